@@ -1,9 +1,13 @@
+import asyncio
+import json
 import os
-import requests
+import time
 import logging
-from typing import Dict, List, Any, Optional
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import AsyncIterator, Dict, List, Any, Optional, Tuple
+
+import httpx
 
 logger = logging.getLogger(__name__)
 
@@ -12,83 +16,247 @@ RUST_ENGINE_URL = os.getenv("RUST_ENGINE_URL", "http://localhost:8080")
 
 DEFAULT_TIMEOUT = 15
 REQUEST_TIMEOUT = 20
+# GET responses are reused for this many seconds by every screen
+CACHE_TTL = float(os.getenv("API_CACHE_TTL", 2))
+MAX_CONNECTIONS = 10
+
+# Listings and feeds streamed one JSON record per line
+NDJSON_MIMETYPE = "application/x-ndjson"
+
+RETRIES = 3
+RETRY_BACKOFF = 0.5
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+CacheKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+class _CacheEntry:
+    def __init__(self, data: Any, etag: Optional[str], expires_at: float):
+        self.data = data
+        self.etag = etag
+        self.expires_at = expires_at
+
+
+class ApiClient:
+    """Asyncio client for the Python API shared by every screen.
+
+    One pooled httpx.AsyncClient; concurrent identical GETs share a single
+    in-flight request, and responses are reused for `cache_ttl` seconds.
+    Expired entries that came with an ETag are revalidated, so an unchanged
+    resource costs a 304."""
+
+    def __init__(self, base_url: str = API_BASE_URL, cache_ttl: float = CACHE_TTL):
+        self.base_url = base_url
+        self.cache_ttl = cache_ttl
+        self._client: Optional[httpx.AsyncClient] = None
+        self._inflight: Dict[CacheKey, asyncio.Task] = {}
+        self._cache: Dict[CacheKey, _CacheEntry] = {}
+
+    def _http(self) -> httpx.AsyncClient:
+        """Create the pooled client on first use, inside the running loop."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=DEFAULT_TIMEOUT,
+                limits=httpx.Limits(
+                    max_connections=MAX_CONNECTIONS,
+                    max_keepalive_connections=MAX_CONNECTIONS,
+                ),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def invalidate(self) -> None:
+        """Expire cached responses; ETags are kept for revalidation."""
+        for entry in self._cache.values():
+            entry.expires_at = 0.0
+
+    def stream(self, path: str, **kwargs):
+        """Streaming GET on the shared pool (async context manager)."""
+        return self._http().stream("GET", path, **kwargs)
+
+    @asynccontextmanager
+    async def stream_ndjson(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: float = REQUEST_TIMEOUT,
+    ):
+        """Streaming GET of an NDJSON resource (async context manager).
+
+        Yields the response (for its headers) and an async iterator decoding
+        records as their lines arrive; nothing is cached or retried."""
+        async with self.stream(
+            path, params=params, headers={"Accept": NDJSON_MIMETYPE}, timeout=timeout
+        ) as response:
+            response.raise_for_status()
+            yield response, _ndjson_records(response)
+
+    async def get_json(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> Any:
+        """GET a JSON resource through the cache and in-flight coalescing."""
+        key = (path, tuple(sorted((k, str(v)) for k, v in (params or {}).items())))
+
+        entry = self._cache.get(key)
+        if entry is not None and entry.expires_at > time.monotonic():
+            return entry.data
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._fetch(key, path, params, timeout))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        # A cancelled caller (e.g. an exclusive worker restarting) must not
+        # cancel the request other callers are waiting on
+        return await asyncio.shield(task)
+
+    def _forget(self, key: CacheKey, task: asyncio.Task) -> None:
+        """Drop a finished request; its error is re-raised to every waiter."""
+        self._inflight.pop(key, None)
+        if not task.cancelled():
+            task.exception()  # mark retrieved even if every waiter was cancelled
+
+    async def get(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> httpx.Response:
+        """Uncached GET (with retries) for callers that need headers."""
+        return await self._send("GET", path, params=params, timeout=timeout)
 
-def _create_session_with_retries() -> requests.Session:
-    """Create a requests session with retry strategy."""
-    session = requests.Session()
-    
-    retry_strategy = Retry(
-        total=3,
-        backoff_factor=0.5,
-        status_forcelist=[429, 500, 502, 503, 504],
-        allowed_methods=["HEAD", "GET", "OPTIONS", "POST"]
-    )
-    
-    adapter = HTTPAdapter(max_retries=retry_strategy)
-    session.mount("http://", adapter)
-    session.mount("https://", adapter)
-    
-    return session
-
-_session = _create_session_with_retries()
+    async def post_json(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: float = REQUEST_TIMEOUT,
+    ) -> Any:
+        """POST and return the JSON body. Cached GETs are expired afterwards."""
+        try:
+            response = await self._send("POST", path, params=params, timeout=timeout)
+            response.raise_for_status()
+            return response.json()
+        finally:
+            self.invalidate()
+
+    async def _fetch(
+        self, key: CacheKey, path: str, params: Optional[Dict[str, Any]], timeout: float
+    ) -> Any:
+        """Perform the GET, revalidating a stale entry when it has an ETag."""
+        stale = self._cache.get(key)
+        headers = {"If-None-Match": stale.etag} if stale is not None and stale.etag else {}
+
+        response = await self._send("GET", path, params=params, headers=headers, timeout=timeout)
+        if response.status_code == 304 and stale is not None:
+            stale.expires_at = time.monotonic() + self.cache_ttl
+            return stale.data
+
+        response.raise_for_status()
+        data = response.json()
+        self._cache[key] = _CacheEntry(
+            data, response.headers.get("ETag"), time.monotonic() + self.cache_ttl
+        )
+        return data
+
+    async def _send(self, method: str, path: str, **kwargs) -> httpx.Response:
+        """Send with retries on connection errors and retryable statuses."""
+        attempt = 0
+        while True:
+            try:
+                response = await self._http().request(method, path, **kwargs)
+                if response.status_code not in RETRY_STATUSES or attempt >= RETRIES:
+                    return response
+            except httpx.TransportError:
+                if attempt >= RETRIES:
+                    raise
+            await asyncio.sleep(RETRY_BACKOFF * (2 ** attempt))
+            attempt += 1
+
+
+async def _ndjson_records(response: httpx.Response) -> AsyncIterator[Dict[str, Any]]:
+    async for line in response.aiter_lines():
+        if line:
+            yield json.loads(line)
+
+
+api = ApiClient()
+
+
+async def close_client() -> None:
+    """Close the shared client's connections."""
+    await api.aclose()
 
 # =====================================================================
 # HEALTH & STATUS
 # =====================================================================
 
-def get_backend_health() -> Dict[str, Any]:
+async def get_backend_health() -> Dict[str, Any]:
     """Check Python API health."""
     try:
-        response = _session.get(
-            f"{API_BASE_URL}/pipeline/status",
-            timeout=DEFAULT_TIMEOUT,
-        )
-        response.raise_for_status()
-        return response.json()
-    except requests.RequestException as e:
+        return await api.get_json("/pipeline/status")
+    except httpx.HTTPError as e:
         logger.warning(f"Backend health check failed: {e}")
         return {"status": "unreachable", "error": str(e)}
 
-def get_rust_health() -> Dict[str, Any]:
+async def get_rust_health() -> Dict[str, Any]:
     """Check Rust engine health via Python API status."""
     try:
-        response = _session.get(
-            f"{API_BASE_URL}/pipeline/status",
-            timeout=DEFAULT_TIMEOUT,
-        )
-        response.raise_for_status()
-        data = response.json()
+        # Shares the cached/in-flight /pipeline/status call with get_backend_health
+        data = await api.get_json("/pipeline/status")
         rust_status = data.get("components", {}).get("rust_engine", "unknown")
         return {"status": "ok" if rust_status == "ok" else "unreachable"}
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         logger.warning(f"Rust health check failed: {e}")
         return {"status": "unreachable", "error": str(e)}
 
-def get_system_status() -> Dict[str, Any]:
-    """Get overall system health status."""
-    backend = get_backend_health()
-    rust = get_rust_health()
-    
+async def get_system_status() -> Dict[str, Any]:
+    """Get overall system health and pipeline stats in a single call."""
+    try:
+        backend = await api.get_json("/pipeline/status", params={"include": "stats"})
+    except httpx.HTTPError as e:
+        logger.warning(f"Backend health check failed: {e}")
+        backend = {"status": "unreachable", "error": str(e)}
+
+    rust_status = backend.get("components", {}).get("rust_engine", "unknown")
+
     return {
         "backend": backend,
-        "rust_engine": rust,
-        "timestamp": __import__("datetime").datetime.now().isoformat()
+        "rust_engine": {"status": "ok" if rust_status == "ok" else "unreachable"},
+        "stats": backend.get("stats", {"status": "error"}),
+        "timestamp": datetime.now().isoformat()
     }
 
+async def get_dashboard_snapshot() -> Dict[str, Any]:
+    """Get health, stats, top risks and log tail; unchanged polls cost a 304."""
+    try:
+        return await api.get_json("/dashboard/snapshot")
+    except httpx.HTTPError as e:
+        logger.warning(f"Dashboard snapshot failed: {e}")
+        return {
+            "health": {"status": "unreachable", "error": str(e)},
+            "stats": {"status": "error", "error": str(e)},
+            "top_risks": [],
+            "logs": [],
+        }
+
 # =====================================================================
 # PIPELINE STATISTICS
 # =====================================================================
 
-def get_pipeline_stats() -> Dict[str, Any]:
+async def get_pipeline_stats() -> Dict[str, Any]:
     """Get pipeline statistics (unprocessed, analyzed today, high risks)."""
     try:
-        response = _session.get(
-            f"{API_BASE_URL}/pipeline/stats",
-            timeout=DEFAULT_TIMEOUT,
-        )
-        response.raise_for_status()
-        return response.json()
-    except requests.RequestException as e:
+        return await api.get_json("/pipeline/stats")
+    except httpx.HTTPError as e:
         logger.error(f"Failed to get pipeline stats: {e}")
         return {
             "status": "error",
@@ -103,17 +271,25 @@ def get_pipeline_stats() -> Dict[str, Any]:
 # ACTIONS
 # =====================================================================
 
-def run_pipeline(limit: int = 100) -> Dict[str, Any]:
+async def run_pipeline(limit: int = 100) -> Dict[str, Any]:
     """Trigger pipeline analysis for unprocessed asteroids."""
     try:
-        response = _session.post(
-            f"{API_BASE_URL}/pipeline/neo/analyze",
-            params={"limit": limit},
-            timeout=REQUEST_TIMEOUT,
-        )
-        response.raise_for_status()
-        return response.json()
-    except requests.RequestException as e:
+        return await api.post_json("/pipeline/neo/analyze", params={"limit": limit})
+    except httpx.HTTPStatusError as e:
+        # 409: a scheduled or another manual run holds the pipeline lease
+        if e.response.status_code == 409:
+            return {
+                "status": "busy",
+                "error": "Pipeline already running",
+                "statistics": {"processed": 0, "failed": 0, "skipped": 0}
+            }
+        logger.error(f"Pipeline execution failed: {e}")
+        return {
+            "status": "error",
+            "error": str(e),
+            "statistics": {"processed": 0, "failed": 0, "skipped": 0}
+        }
+    except httpx.HTTPError as e:
         logger.error(f"Pipeline execution failed: {e}")
         return {
             "status": "error",
@@ -125,15 +301,15 @@ def run_pipeline(limit: int = 100) -> Dict[str, Any]:
 # DATA ACCESS
 # =====================================================================
 
-def get_analyzed_asteroids(
-    limit: int = 200, 
-    sort: str = "risk_score", 
+async def get_analyzed_asteroids(
+    limit: int = 200,
+    sort: str = "risk_score",
     order: str = "desc"
 ) -> List[Dict[str, Any]]:
     """Get list of analyzed asteroids."""
     try:
-        response = _session.get(
-            f"{API_BASE_URL}/pipeline/analysis/asteroids",
+        data = await api.get_json(
+            "/pipeline/analysis/asteroids",
             params={
                 "limit": limit,
                 "sort": sort,
@@ -141,36 +317,77 @@ def get_analyzed_asteroids(
             },
             timeout=REQUEST_TIMEOUT,
         )
-        response.raise_for_status()
-        data = response.json()
-        
+
         # Handle both direct list and wrapped response
         if isinstance(data, list):
             return data
         return data.get("asteroids", [])
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         logger.error(f"Failed to get analyzed asteroids: {e}")
         return []
 
-def get_logs(limit: int = 100) -> List[Dict[str, Any]]:
+async def get_analyzed_asteroids_page(
+    offset: int,
+    limit: int,
+    sort: str = "risk_score",
+    order: str = "desc",
+    query: Optional[str] = None,
+) -> Tuple[List[Dict[str, Any]], int]:
+    """Get one page of analyzed asteroids and the total number of matches.
+
+    Errors are raised so a failed page is retried instead of shown empty."""
+    params = {"offset": offset, "limit": limit, "sort": sort, "order": order}
+    if query:
+        params["q"] = query
+
+    async with api.stream_ndjson("/pipeline/analysis/asteroids", params=params) as (response, records):
+        rows = [row async for row in records]
+    return rows, int(response.headers.get("X-Total-Count", offset + len(rows)))
+
+async def iter_analyzed_asteroids(
+    limit: int,
+    sort: str = "risk_score",
+    order: str = "desc",
+    query: Optional[str] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    """Analyzed asteroids one by one as the API streams them, for requests
+    too large to hold as one JSON document (e.g. 100k rows)."""
+    params = {"limit": limit, "sort": sort, "order": order}
+    if query:
+        params["q"] = query
+
+    async with api.stream_ndjson("/pipeline/analysis/asteroids", params=params) as (_, records):
+        async for row in records:
+            yield row
+
+async def get_logs(limit: int = 100) -> List[Dict[str, Any]]:
     """Get recent logs from Python API."""
     try:
-        response = _session.get(
-            f"{API_BASE_URL}/logs",
-            params={"limit": limit},
-            timeout=DEFAULT_TIMEOUT,
-        )
-        response.raise_for_status()
-        data = response.json()
-        
+        data = await api.get_json("/logs", params={"limit": limit})
+
         if isinstance(data, list):
             return data
         return data.get("logs", [])
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         logger.error(f"Failed to get logs: {e}")
         return []
 
-def get_asteroids(
+async def iter_neo_feed(
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    """NASA feed asteroids one by one, each with its `feed_date`."""
+    params = {}
+    if start_date:
+        params["start_date"] = start_date
+    if end_date:
+        params["end_date"] = end_date
+
+    async with api.stream_ndjson("/nasa/neo/feed", params=params) as (_, records):
+        async for asteroid in records:
+            yield asteroid
+
+async def get_asteroids(
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
     limit: int = 100
@@ -183,18 +400,12 @@ def get_asteroids(
         params["end_date"] = end_date
 
     try:
-        response = _session.get(
-            f"{API_BASE_URL}/nasa/neo/feed",
-            params=params,
-            timeout=REQUEST_TIMEOUT,
-        )
-        response.raise_for_status()
-        data = response.json()
-        
+        data = await api.get_json("/nasa/neo/feed", params=params, timeout=REQUEST_TIMEOUT)
+
         # Handle both direct list and wrapped response
         if isinstance(data, list):
             return data
         return data.get("asteroids", data.get("near_earth_objects", []))
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         logger.error(f"Failed to get asteroids: {e}")
-        return []
\ No newline at end of file
+        return []
@@ -0,0 +1,69 @@
+import asyncio
+import json
+import logging
+from typing import Any, AsyncIterator, Callable, Dict
+
+import httpx
+
+from app.client.api_client import api
+
+logger = logging.getLogger(__name__)
+
+CONNECT_TIMEOUT = 5
+# The API sends a keepalive comment every 15s; three missed ones means a dead stream
+READ_TIMEOUT = 45
+
+
+async def parse_sse(lines: AsyncIterator[str]) -> AsyncIterator[Dict[str, Any]]:
+    """Yield decoded `data:` payloads from server-sent event lines."""
+    data: list[str] = []
+    async for line in lines:
+        if not line:
+            if data:
+                try:
+                    yield json.loads("\n".join(data))
+                except ValueError:
+                    logger.warning("Ignoring malformed event payload")
+                data = []
+        elif line.startswith("data:"):
+            data.append(line[5:].lstrip())
+        # comments (": keepalive"), event names and retry hints need no handling
+
+
+class EventStream:
+    """Subscription to the API's /events feed, run as an asyncio task.
+
+    Reconnects with backoff; `on_state(False)` tells the UI to fall back to
+    timer polling until the stream is back."""
+
+    def __init__(
+        self,
+        on_event: Callable[[Dict[str, Any]], None],
+        on_state: Callable[[bool], None],
+        path: str = "/events",
+    ):
+        self.on_event = on_event
+        self.on_state = on_state
+        self.path = path
+
+    async def run(self) -> None:
+        """Connect, dispatch events, reconnect on failure. Runs until cancelled."""
+        delay = 1.0
+        while True:
+            try:
+                async with api.stream(
+                    self.path,
+                    headers={"Accept": "text/event-stream"},
+                    timeout=httpx.Timeout(READ_TIMEOUT, connect=CONNECT_TIMEOUT),
+                ) as response:
+                    response.raise_for_status()
+                    self.on_state(True)
+                    delay = 1.0
+                    async for event in parse_sse(response.aiter_lines()):
+                        self.on_event(event)
+            except httpx.HTTPError as e:
+                logger.warning(f"Event stream disconnected: {e}")
+
+            self.on_state(False)
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 30.0)
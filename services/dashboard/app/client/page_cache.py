@@ -0,0 +1,86 @@
+import asyncio
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+# fetch(offset, limit) -> (rows, total matching rows)
+PageFetcher = Callable[[int, int], Awaitable[Tuple[List[Dict[str, Any]], int]]]
+
+
+class PageCache:
+    """Bounded LRU of fixed-size result pages for one query.
+
+    Rows are only held for the `max_pages` most recently used pages, so
+    memory stays constant however far the user scrolls. Loads of the same
+    page share one request; responses for a query that has since been reset
+    or invalidated are dropped."""
+
+    def __init__(self, fetch: PageFetcher, page_size: int = 100, max_pages: int = 8):
+        self.fetch = fetch
+        self.page_size = page_size
+        self.max_pages = max_pages
+        self.total: Optional[int] = None
+        self._pages: "OrderedDict[int, List[Dict[str, Any]]]" = OrderedDict()
+        self._stale: Set[int] = set()
+        self._inflight: Dict[Tuple[int, int], asyncio.Task] = {}
+        self._generation = 0
+
+    def page_of(self, index: int) -> int:
+        """Page number holding row `index`."""
+        return index // self.page_size
+
+    def row(self, index: int) -> Optional[Dict[str, Any]]:
+        """Cached row at `index`, or None if its page is not loaded."""
+        page = self.page_of(index)
+        rows = self._pages.get(page)
+        if rows is None:
+            return None
+        self._pages.move_to_end(page)
+        offset = index - page * self.page_size
+        return rows[offset] if offset < len(rows) else None
+
+    def needs(self, page: int) -> bool:
+        """Whether a page is missing or stale."""
+        if page < 0 or (self.total is not None and page * self.page_size >= max(self.total, 1)):
+            return False
+        return page not in self._pages or page in self._stale
+
+    def loading(self, page: int) -> bool:
+        """Whether a request for this page (current query) is in flight."""
+        return (self._generation, page) in self._inflight
+
+    async def load(self, page: int) -> bool:
+        """Fetch a page unless it is already loading. True if it was stored."""
+        key = (self._generation, page)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._fetch(page, self._generation))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _fetch(self, page: int, generation: int) -> bool:
+        """Fetch and store one page if the query has not changed meanwhile."""
+        rows, total = await self.fetch(page * self.page_size, self.page_size)
+        if generation != self._generation:
+            return False
+
+        self.total = total
+        self._pages[page] = rows
+        self._pages.move_to_end(page)
+        self._stale.discard(page)
+        while len(self._pages) > self.max_pages:
+            evicted, _ = self._pages.popitem(last=False)
+            self._stale.discard(evicted)
+        return True
+
+    def invalidate(self) -> None:
+        """Mark every page for refetch; they are served until replaced."""
+        self._generation += 1
+        self._stale = set(self._pages)
+
+    def reset(self) -> None:
+        """Drop all pages, e.g. after the sort order or filter changed."""
+        self._generation += 1
+        self._pages.clear()
+        self._stale.clear()
+        self.total = None
@@ -1,11 +1,26 @@
+from importlib import import_module
+from typing import Callable
+
 from textual.app import App
 from textual.binding import Binding
-from textual.widgets import Header, Footer
+from textual.screen import Screen
+
+from app.client.api_client import api, close_client
+from app.client.event_stream import EventStream
+from app.messages import DataChanged, EventStreamStatus
+
+# Window over which pushed events are merged into one DataChanged message
+EVENT_COALESCE_SECONDS = 1.0
+CHANGE_EVENT_TYPES = {"analysis", "raw", "resync"}
+
 
-from app.screens.home import HomeScreen
-from app.screens.asteroids import AsteroidsScreen
-from app.screens.pipeline import PipelineScreen
-from app.screens.logs import LogsScreen
+def _lazy_screen(module: str, name: str) -> Callable[[], Screen]:
+    """Screen factory that imports the screen module on first navigation."""
+
+    def factory() -> Screen:
+        return getattr(import_module(module), name)()
+
+    return factory
 
 
 class AstroForgeDashboard(App):
@@ -45,10 +60,10 @@ class AstroForgeDashboard(App):
     SUB_TITLE = "Asteroid Risk Analysis Dashboard"
 
     SCREENS = {
-        "home": HomeScreen,
-        "asteroids": AsteroidsScreen,
-        "pipeline": PipelineScreen,
-        "logs": LogsScreen,
+        "home": _lazy_screen("app.screens.home", "HomeScreen"),
+        "asteroids": _lazy_screen("app.screens.asteroids", "AsteroidsScreen"),
+        "pipeline": _lazy_screen("app.screens.pipeline", "PipelineScreen"),
+        "logs": _lazy_screen("app.screens.logs", "LogsScreen"),
     }
 
     BINDINGS = [
@@ -59,10 +74,57 @@ class AstroForgeDashboard(App):
         Binding("l", "show_logs", "Logs", show=True),
     ]
 
+    def __init__(self):
+        super().__init__()
+        self.events_connected = False
+        self._pending_kinds: set[str] = set()
+        self._flush_timer = None
+        self._event_stream = EventStream(
+            on_event=self._on_backend_event,
+            on_state=self._on_stream_state,
+        )
+
     def on_mount(self) -> None:
         """Initialize the application and show home screen."""
+        # Cancelled with the app's other workers on exit
+        self.run_worker(self._event_stream.run(), name="event-stream", group="events")
         self.push_screen("home")
 
+    async def on_unmount(self) -> None:
+        """Close pooled API connections."""
+        await close_client()
+
+    def _broadcast(self, make_message) -> None:
+        """Post a fresh message to every screen on the stack."""
+        seen = set()
+        for screen in self.screen_stack:
+            if id(screen) not in seen:
+                seen.add(id(screen))
+                screen.post_message(make_message())
+
+    def _on_stream_state(self, connected: bool) -> None:
+        """Tell screens to pause or resume their polling timers."""
+        if connected != self.events_connected:
+            self.events_connected = connected
+            self._broadcast(lambda: EventStreamStatus(connected))
+
+    def _on_backend_event(self, event: dict) -> None:
+        """Collect change events and flush them once per coalescing window."""
+        if event.get("type") not in CHANGE_EVENT_TYPES:
+            return
+        self._pending_kinds.add(event["type"])
+        if self._flush_timer is None:
+            self._flush_timer = self.set_timer(EVENT_COALESCE_SECONDS, self._flush_changes)
+
+    def _flush_changes(self) -> None:
+        """Broadcast the coalesced change kinds."""
+        kinds = frozenset(self._pending_kinds)
+        self._pending_kinds.clear()
+        self._flush_timer = None
+        # Refreshes triggered by this must not be answered from the client cache
+        api.invalidate()
+        self._broadcast(lambda: DataChanged(kinds))
+
     def action_show_home(self) -> None:
         """Navigate to home screen."""
         self.push_screen("home")
@@ -0,0 +1,18 @@
+from textual.message import Message
+
+
+class DataChanged(Message):
+    """Backend data changed; `kinds` holds the event types seen ("analysis",
+    "raw", "resync"), coalesced over a short window."""
+
+    def __init__(self, kinds: frozenset[str]):
+        super().__init__()
+        self.kinds = kinds
+
+
+class EventStreamStatus(Message):
+    """The push event stream connected or dropped."""
+
+    def __init__(self, connected: bool):
+        super().__init__()
+        self.connected = connected
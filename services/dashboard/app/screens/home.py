@@ -3,10 +3,10 @@ from textual.widgets import Static, Button, Label
 from textual.containers import Vertical, Horizontal, Container
 from textual import work
 from datetime import datetime
-import asyncio
 import logging
 
-from app.client.api_client import get_system_status, get_pipeline_stats, run_pipeline
+from app.client.api_client import get_dashboard_snapshot, run_pipeline
+from app.messages import DataChanged, EventStreamStatus
 
 logger = logging.getLogger(__name__)
 
@@ -61,6 +61,12 @@ class HomeScreen(Screen):
         margin: 1 2;
     }
 
+    #top_risks {
+        height: auto;
+        border: solid $accent;
+        margin: 1 2;
+    }
+
     #quick_actions {
         height: auto;
         margin: 1 2;
@@ -97,6 +103,11 @@ class HomeScreen(Screen):
             yield Static("High/Critical risks: Loading...", id="high_risks")
             yield Static("Last pipeline run: --", id="last_run")
 
+        # Top Risks Section
+        with Vertical(id="top_risks"):
+            yield Static("TOP RISKS", classes="section-title")
+            yield Static("Loading...", id="top_risks_list")
+
         # Quick Actions
         with Vertical(id="quick_actions"):
             yield Static("QUICK ACTIONS", classes="section-title")
@@ -114,7 +125,22 @@ class HomeScreen(Screen):
     def on_mount(self) -> None:
         """Initialize and start refreshing data."""
         self.refresh_all_data()
-        self.set_interval(10, self.refresh_all_data)  # Refresh every 10 seconds
+        # Fallback polling every 10 seconds, paused while pushed events flow
+        self._poll_timer = self.set_interval(
+            10, self.refresh_all_data, pause=self.app.events_connected
+        )
+
+    def on_event_stream_status(self, message: EventStreamStatus) -> None:
+        """Pause polling while the event stream is connected."""
+        if message.connected:
+            self._poll_timer.pause()
+        else:
+            self._poll_timer.resume()
+            self.refresh_all_data()
+
+    def on_data_changed(self, message: DataChanged) -> None:
+        """Refresh status, stats and top risks after backend changes."""
+        self.refresh_all_data()
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button clicks."""
@@ -131,15 +157,14 @@ class HomeScreen(Screen):
     async def refresh_all_data(self) -> None:
         """Refresh system status and pipeline stats."""
         try:
-            # Get system status
-            loop = asyncio.get_event_loop()
-            status = await loop.run_in_executor(None, get_system_status)
-            backend = status.get("backend", {})
-            rust = status.get("rust_engine", {})
+            # One snapshot call covers status, stats and top risks
+            snapshot = await get_dashboard_snapshot()
+            health = snapshot.get("health", {})
+            components = health.get("components", {})
 
-            backend_ok = backend.get("status") == "healthy"
-            mongodb_ok = backend.get("components", {}).get("mongodb") == "connected"
-            rust_ok = rust.get("status") == "ok"
+            backend_ok = health.get("status") == "healthy"
+            mongodb_ok = components.get("mongodb") == "connected"
+            rust_ok = components.get("rust_engine") == "ok"
 
             # Update status widgets
             self.query_one("#backend_status").update(
@@ -152,9 +177,12 @@ class HomeScreen(Screen):
                 f"Rust Engine: {'✓ Ready' if rust_ok else '✗ Unreachable'}"
             )
 
-            # Get pipeline stats if backend is healthy
+            self.query_one("#top_risks_list").update(
+                self._format_top_risks(snapshot.get("top_risks", []))
+            )
+
             if backend_ok:
-                stats = await loop.run_in_executor(None, get_pipeline_stats)
+                stats = snapshot.get("stats", {})
                 if stats.get("status") != "error":
                     unprocessed = stats.get("unprocessed", 0)
                     analyzed_today = stats.get("analyzed_today", 0)
@@ -186,6 +214,16 @@ class HomeScreen(Screen):
                 backend_status.update(f"Backend: ✗ Error ({str(e)[:30]})")
             logger.error(f"Failed to refresh system status: {str(e)}")
 
+    def _format_top_risks(self, top_risks: list, limit: int = 5) -> str:
+        """Format the highest risk asteroids, one per line."""
+        if not top_risks:
+            return "No analyzed asteroids yet"
+        return "\n".join(
+            f"{row.get('name', '?'):<28} {row.get('risk_level', '?'):<9} "
+            f"{row.get('risk_score', 0):5.1f}"
+            for row in top_risks[:limit]
+        )
+
     @work(exclusive=True)
     async def run_pipeline_action(self) -> None:
         """Execute pipeline run."""
@@ -196,8 +234,7 @@ class HomeScreen(Screen):
             button.label = "⟳ Running..."
             button.disabled = True
             
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(None, lambda: run_pipeline(limit=100))
+            result = await run_pipeline(limit=100)
             
             if result.get("status") == "success":
                 stats = result.get("statistics", {})
@@ -3,7 +3,7 @@ from textual.widgets import Static, Button, RichLog
 from textual.containers import Vertical, Horizontal
 from textual import work
 
-from app.client.api_client import get_logs
+from app.client.api_client import api, get_logs
 
 
 class LogsScreen(Screen):
@@ -62,6 +62,7 @@ class LogsScreen(Screen):
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
         if event.button.id == "refresh":
+            api.invalidate()
             self.load_logs()
         elif event.button.id == "clear":
             self.log_display.clear()
@@ -74,9 +75,7 @@ class LogsScreen(Screen):
         self.log_display.clear()
         
         try:
-            worker = self.run_worker(lambda: get_logs(limit=100), thread=True)
-            await worker.wait()
-            logs = worker.result
+            logs = await get_logs(limit=100)
 
             if not logs:
                 self.log_display.write("[yellow]No logs available[/yellow]")
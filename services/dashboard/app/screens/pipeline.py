@@ -6,7 +6,8 @@ from textual.css.query import NoMatches
 from textual import work
 from datetime import datetime
 
-from app.client.api_client import run_pipeline, get_pipeline_stats
+from app.client.api_client import api, run_pipeline, get_dashboard_snapshot
+from app.messages import DataChanged, EventStreamStatus
 
 
 class PipelineScreen(Screen):
@@ -84,13 +85,29 @@ class PipelineScreen(Screen):
     def on_mount(self) -> None:
         """Initialize screen and start refreshing."""
         self.refresh_stats()
-        self.set_interval(15, self.refresh_stats)
+        # Fallback polling, paused while pushed events flow
+        self._poll_timer = self.set_interval(
+            15, self.refresh_stats, pause=self.app.events_connected
+        )
+
+    def on_event_stream_status(self, message: EventStreamStatus) -> None:
+        """Pause polling while the event stream is connected."""
+        if message.connected:
+            self._poll_timer.pause()
+        else:
+            self._poll_timer.resume()
+            self.refresh_stats()
+
+    def on_data_changed(self, message: DataChanged) -> None:
+        """Refresh stats after backend changes."""
+        self.refresh_stats()
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
         if event.button.id == "run_pipeline":
             self.run_pipeline_action()
         elif event.button.id == "refresh_stats":
+            api.invalidate()
             self.refresh_stats()
         elif event.button.id == "back":
             self.app.action_show_home()
@@ -99,9 +116,9 @@ class PipelineScreen(Screen):
     async def refresh_stats(self) -> None:
         """Refresh pipeline statistics."""
         try:
-            worker = self.run_worker(get_pipeline_stats, thread=True)
-            await worker.wait()
-            stats = worker.result
+            # Shares the snapshot (and its ETag) with the home screen
+            snapshot = await get_dashboard_snapshot()
+            stats = snapshot.get("stats", {})
 
             if stats.get("status") != "error":
                 unprocessed = stats.get("unprocessed", 0)
@@ -155,9 +172,7 @@ class PipelineScreen(Screen):
             status_widget.update("Status: [yellow]Pipeline running...[/yellow]")
 
         try:
-            worker = self.run_worker(lambda: run_pipeline(limit=100), thread=True)
-            await worker.wait()
-            result = worker.result
+            result = await run_pipeline(limit=100)
 
             if "error" not in result:
                 stats = result.get("statistics", {})
@@ -1,9 +1,68 @@
 from textual.widgets import DataTable
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
+
+# (column key, header, record field, cell format)
+COLUMNS = [
+    ("id", "ID", "id", None),
+    ("name", "Name", "name", None),
+    ("risk_level", "Risk Level", "risk_level", None),
+    ("risk_score", "Score", "risk_score", "{:.1f}"),
+    ("energy_mt", "Energy (MT)", "energy_mt", "{:.2f}"),
+    ("distance_km", "Distance (km)", "distance_km", "{:.0f}"),
+    ("diameter_km", "Diameter (km)", "diameter_km", "{:.3f}"),
+    ("velocity_kps", "Velocity (km/s)", "velocity_kps", "{:.2f}"),
+]
+COLUMN_KEYS = [key for key, _, _, _ in COLUMNS]
+
+RISK_ORDER = {"Critical": 4, "High": 3, "Medium": 2, "Low": 1}
+
+EMPTY_ROW_KEY = "__empty__"
+
+
+class SortableCell(str):
+    """Rendered cell text that keeps the raw value it was formatted from."""
+
+    def __new__(cls, text: str, sort_value: Any):
+        cell = super().__new__(cls, text)
+        cell.sort_value = sort_value
+        return cell
+
+
+def _raw_values(asteroid: Dict[str, Any]) -> Tuple[Any, ...]:
+    """Displayed fields of a record, used to detect changed cells."""
+    return tuple(asteroid.get(field) for _, _, field, _ in COLUMNS)
+
+
+def format_cell(column: str, value: Any) -> SortableCell:
+    """Format one cell, with the value to sort it by."""
+    if column == "id":
+        text = str(value or "?")
+        return SortableCell(text[:8], text)
+    if column == "name":
+        text = str(value or "?")
+        return SortableCell(text[:20], text.lower())
+    if column == "risk_level":
+        level = value or "Unknown"
+        # Color code the risk level
+        if level in ["Critical", "High"]:
+            text = f"[red]{level}[/red]"
+        elif level == "Medium":
+            text = f"[yellow]{level}[/yellow]"
+        else:
+            text = f"[green]{level}[/green]"
+        return SortableCell(text, RISK_ORDER.get(level, 0))
+
+    number = value or 0
+    fmt = next(f for key, _, _, f in COLUMNS if key == column)
+    return SortableCell(fmt.format(number), number)
 
 
 class AsteroidTable(DataTable):
-    """A custom data table widget for displaying asteroids."""
+    """A custom data table widget for displaying asteroids.
+
+    Rows are keyed by asteroid id. `load_asteroids` diffs the new dataset
+    against what is shown and only adds, removes or updates changed cells;
+    sorting and filtering work on the cached records without refetching."""
 
     DEFAULT_CSS = """
     AsteroidTable {
@@ -13,58 +72,92 @@ class AsteroidTable(DataTable):
     }
     """
 
-    def __init__(self):
-        super().__init__()
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._records: Dict[str, Dict[str, Any]] = {}
+        self._shown: Dict[str, Tuple[Any, ...]] = {}
+        self._filter = ""
+        self.sort_column = "risk_score"
+        self.sort_reverse = True
         self._setup_columns()
 
     def _setup_columns(self) -> None:
         """Setup table columns."""
-        self.add_columns(
-            "ID",
-            "Name",
-            "Risk Level",
-            "Score",
-            "Energy (MT)",
-            "Distance (km)",
-            "Diameter (km)",
-            "Velocity (km/s)",
-        )
+        for key, label, _, _ in COLUMNS:
+            self.add_column(label, key=key)
 
     def load_asteroids(self, asteroids: List[Dict[str, Any]]) -> None:
-        """Load asteroids data into the table."""
-        self.clear()
-
-        if not asteroids:
-            self.add_row(
-                "No data",
-                "--",
-                "--",
-                "--",
-                "--",
-                "--",
-                "--",
-                "--",
-            )
-            return
+        """Replace the cached records and apply the difference to the table."""
+        self._records = {str(a.get("id", "?")): a for a in asteroids}
+        self._apply()
+
+    def set_filter(self, text: str) -> None:
+        """Show only rows whose id, name or risk level contains `text`."""
+        self._filter = text.strip().lower()
+        self._apply()
+
+    def sort_by(self, column: str) -> None:
+        """Sort by a column; choosing the current column flips the order."""
+        if column == self.sort_column:
+            self.sort_reverse = not self.sort_reverse
+        else:
+            self.sort_column = column
+            self.sort_reverse = column in ("risk_level", "risk_score", "energy_mt")
+        self._sort()
+
+    def _matches(self, asteroid: Dict[str, Any]) -> bool:
+        """Check a record against the current filter."""
+        if not self._filter:
+            return True
+        return any(
+            self._filter in str(asteroid.get(field, "")).lower()
+            for field in ("id", "name", "risk_level")
+        )
+
+    def _apply(self) -> None:
+        """Diff the filtered records against the shown rows."""
+        visible = {key: a for key, a in self._records.items() if self._matches(a)}
+        changed = False
 
-        for asteroid in asteroids:
-            risk_level = asteroid.get("risk_level", "Unknown")
-
-            # Color code the risk level
-            if risk_level in ["Critical", "High"]:
-                risk_display = f"[red]{risk_level}[/red]"
-            elif risk_level == "Medium":
-                risk_display = f"[yellow]{risk_level}[/yellow]"
-            else:
-                risk_display = f"[green]{risk_level}[/green]"
-
-            self.add_row(
-                asteroid.get("id", "?")[:8],
-                asteroid.get("name", "?")[:20],
-                risk_display,
-                f"{asteroid.get('risk_score', 0):.1f}",
-                f"{asteroid.get('energy_mt', 0):.2f}",
-                f"{asteroid.get('distance_km', 0):.0f}",
-                f"{asteroid.get('diameter_km', 0):.3f}",
-                f"{asteroid.get('velocity_kps', 0):.2f}",
-            )
+        for key in self._shown.keys() - visible.keys():
+            self.remove_row(key)
+            del self._shown[key]
+            changed = True
+
+        for key, asteroid in visible.items():
+            values = _raw_values(asteroid)
+            previous = self._shown.get(key)
+            if previous is None:
+                self.add_row(
+                    *(format_cell(col, v) for col, v in zip(COLUMN_KEYS, values)), key=key
+                )
+                changed = True
+            elif previous != values:
+                for col, old, new in zip(COLUMN_KEYS, previous, values):
+                    if old != new:
+                        self.update_cell(key, col, format_cell(col, new))
+                changed = True
+            self._shown[key] = values
+
+        self._toggle_empty_row()
+        if changed:
+            self._sort()
+
+    def _toggle_empty_row(self) -> None:
+        """Show a placeholder row while nothing matches."""
+        has_placeholder = EMPTY_ROW_KEY in self.rows
+        if not self._shown and not has_placeholder:
+            self.add_row("No data", *(["--"] * (len(COLUMNS) - 1)), key=EMPTY_ROW_KEY)
+        elif self._shown and has_placeholder:
+            self.remove_row(EMPTY_ROW_KEY)
+
+    def _sort(self) -> None:
+        """Order rows by the sort column, ties broken by id."""
+        if not self._shown:
+            return
+        self.sort(
+            self.sort_column,
+            "id",
+            key=lambda cells: (cells[0].sort_value, cells[1].sort_value),
+            reverse=self.sort_reverse,
+        )
@@ -0,0 +1,195 @@
+from typing import Any, Dict, List, Tuple
+
+import httpx
+from rich.segment import Segment
+from rich.style import Style
+from rich.text import Text
+from textual.events import Click, Resize
+from textual.geometry import Size
+from textual.scroll_view import ScrollView
+from textual.strip import Strip
+
+from app.client.api_client import get_analyzed_asteroids_page
+from app.client.page_cache import PageCache
+from app.widgets.asteroid_table import COLUMNS, format_cell
+
+PAGE_SIZE = 100
+# Pages kept in memory; must cover the visible rows plus the prefetched page
+MAX_PAGES = 8
+FILTER_DEBOUNCE = 0.3
+
+# Table columns the API can sort on, mapped to its `sort` parameter
+SERVER_SORT = {"risk_level": "risk_score", "risk_score": "risk_score", "energy_mt": "energy_mt"}
+
+_MIN_WIDTHS = {"id": 8, "name": 20, "distance_km": 12}
+COLUMN_GAP = 2
+
+
+class PagedAsteroidTable(ScrollView, can_focus=True):
+    """Virtual table over every analyzed asteroid.
+
+    Only visible lines are rendered, and only the pages covering them (plus
+    the next page) are fetched from the paginated API. Loaded pages live in
+    a bounded LRU, so browsing any number of results keeps memory and fetch
+    size constant. Sorting and filtering are done by the server."""
+
+    DEFAULT_CSS = """
+    PagedAsteroidTable {
+        border: solid $accent;
+        margin: 1 0;
+        height: 1fr;
+    }
+    """
+
+    def __init__(self, page_size: int = PAGE_SIZE, max_pages: int = MAX_PAGES, **kwargs):
+        super().__init__(**kwargs)
+        self.sort_column = "risk_score"
+        self.sort_reverse = True
+        self.query_text = ""
+        self.pages = PageCache(self._fetch_page, page_size, max_pages)
+        self._filter_timer = None
+        self._widths = [
+            max(len(label) + 2, _MIN_WIDTHS.get(key, 0)) for key, label, _, _ in COLUMNS
+        ]
+        self._line_width = sum(self._widths) + COLUMN_GAP * (len(COLUMNS) - 1)
+        self.virtual_size = Size(self._line_width, 1)
+
+    async def _fetch_page(self, offset: int, limit: int) -> Tuple[List[Dict[str, Any]], int]:
+        """Fetch rows for the current sort order and filter."""
+        return await get_analyzed_asteroids_page(
+            offset,
+            limit,
+            sort=SERVER_SORT[self.sort_column],
+            order="desc" if self.sort_reverse else "asc",
+            query=self.query_text or None,
+        )
+
+    def on_mount(self) -> None:
+        """Load the first pages."""
+        self.load_visible()
+
+    def on_resize(self, event: Resize) -> None:
+        """More rows may have become visible."""
+        self.load_visible()
+
+    def watch_scroll_y(self, old_value: float, new_value: float) -> None:
+        """Fetch pages scrolled into view."""
+        super().watch_scroll_y(old_value, new_value)
+        self.load_visible()
+
+    def on_click(self, event: Click) -> None:
+        """Sort by the clicked header column."""
+        offset = event.get_content_offset(self)
+        if offset is None or offset.y != 0:
+            return
+        x = offset.x + int(self.scroll_x)
+        for (key, _, _, _), width in zip(COLUMNS, self._widths):
+            if x < width + COLUMN_GAP:
+                self.sort_by(key)
+                return
+            x -= width + COLUMN_GAP
+
+    def sort_by(self, column: str) -> None:
+        """Sort by a column; choosing the current column flips the order."""
+        if column not in SERVER_SORT:
+            label = next(label for key, label, _, _ in COLUMNS if key == column)
+            self.notify(f"Sorting by {label} is not supported", severity="warning")
+            return
+        if SERVER_SORT[column] == SERVER_SORT[self.sort_column]:
+            self.sort_reverse = not self.sort_reverse
+        else:
+            self.sort_reverse = True
+        self.sort_column = column
+        self._restart()
+
+    def set_filter(self, text: str) -> None:
+        """Filter by id, name or risk level once typing pauses."""
+        if self._filter_timer is not None:
+            self._filter_timer.stop()
+        self._filter_timer = self.set_timer(FILTER_DEBOUNCE, lambda: self._apply_filter(text))
+
+    def _apply_filter(self, text: str) -> None:
+        """Restart browsing with a new filter."""
+        self._filter_timer = None
+        if text.strip() != self.query_text:
+            self.query_text = text.strip()
+            self._restart()
+
+    def reload(self) -> None:
+        """Refetch visible pages; current rows stay on screen until replaced."""
+        self.pages.invalidate()
+        self.load_visible()
+
+    def _restart(self) -> None:
+        """Drop all pages and browse from the top."""
+        self.pages.reset()
+        self.scroll_to(y=0, animate=False)
+        self._update_virtual_size()
+        self.refresh()
+        self.load_visible()
+
+    def load_visible(self) -> None:
+        """Fetch missing pages for the visible rows and the page after them."""
+        first = int(self.scroll_y)
+        last = first + max(self.size.height - 2, 0)
+        # One page ahead so scrolling down rarely waits on the network
+        for page in range(self.pages.page_of(first), self.pages.page_of(last) + 2):
+            if self.pages.needs(page) and not self.pages.loading(page):
+                self.run_worker(self._load_page(page), group="pages")
+
+    async def _load_page(self, page: int) -> None:
+        """Load one page and redraw."""
+        try:
+            if await self.pages.load(page):
+                self._update_virtual_size()
+                self.refresh()
+        except httpx.HTTPError as e:
+            self.notify(f"Failed to load asteroids: {str(e)[:50]}", severity="error")
+
+    def _update_virtual_size(self) -> None:
+        """One line per matching row, plus the header."""
+        self.virtual_size = Size(self._line_width, (self.pages.total or 0) + 1)
+
+    def render_line(self, y: int) -> Strip:
+        """Render the header on the first line and rows below it."""
+        scroll_x, scroll_y = self.scroll_offset
+        if y == 0:
+            strip = self._header_strip()
+        else:
+            strip = self._row_strip(scroll_y + y - 1)
+        return strip.crop_extend(scroll_x, scroll_x + self.size.width, self.rich_style)
+
+    def _header_strip(self) -> Strip:
+        """Column labels, with an arrow on the sort column."""
+        cells = []
+        for key, label, _, _ in COLUMNS:
+            if key == self.sort_column:
+                label = f"{label} {'▼' if self.sort_reverse else '▲'}"
+            cells.append(label)
+        return self._strip(cells, Style(bold=True))
+
+    def _row_strip(self, index: int) -> Strip:
+        """One asteroid, or a placeholder while its page loads."""
+        total = self.pages.total
+        if total is not None and index >= total:
+            if index == 0:
+                return Strip([Segment("No data", Style(dim=True))])
+            return Strip.blank(self._line_width)
+
+        row = self.pages.row(index)
+        if row is None:
+            return Strip([Segment("Loading...", Style(dim=True))])
+        return self._strip(
+            [format_cell(key, row.get(field)) for key, _, field, _ in COLUMNS]
+        )
+
+    def _strip(self, cells: List[str], style: Style | None = None) -> Strip:
+        """Lay out markup cells in fixed-width columns."""
+        line = Text(style=style or "")
+        for i, (cell, width) in enumerate(zip(cells, self._widths)):
+            text = Text.from_markup(cell)
+            text.truncate(width, pad=True)
+            if i:
+                line.append(" " * COLUMN_GAP)
+            line.append_text(text)
+        return Strip(list(line.render(self.app.console)), self._line_width)
@@ -0,0 +1,89 @@
+import argparse
+import json
+import sys
+
+from app.core.archive import ARCHIVE_POLICIES, Archive, archive_collection, rehydrate
+from app.core.config import (
+    ARCHIVE_BATCH_SIZE,
+    ARCHIVE_DIR,
+    ARCHIVE_FEED_RETENTION_DAYS,
+    ARCHIVE_RAW_RETENTION_DAYS,
+    MONGO_DB_NAME,
+    MONGO_URI,
+)
+from app.core.mongodb import MongoDBClient
+
+RETENTION_DAYS = {
+    "asteroids_raw": ARCHIVE_RAW_RETENTION_DAYS,
+    "nasa_feeds": ARCHIVE_FEED_RETENTION_DAYS,
+}
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Archive old raw asteroids and NASA feeds to compressed NDJSON, and restore them",
+    )
+    parser.add_argument("--archive-dir", default=ARCHIVE_DIR)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="archive documents past retention, then delete them from MongoDB")
+    run.add_argument("--collection", choices=sorted(ARCHIVE_POLICIES), action="append",
+                     help="collection to archive (repeatable; default: all)")
+    run.add_argument("--older-than-days", type=int,
+                     help="override the configured retention for every collection")
+    run.add_argument("--batch-size", type=int, default=ARCHIVE_BATCH_SIZE)
+    run.add_argument("--dry-run", action="store_true", help="count what would be archived")
+
+    for name, help_text in (
+        ("rehydrate", "restore archived partitions into MongoDB"),
+        ("cat", "print archived documents as Extended JSON lines"),
+        ("list", "list archived partitions"),
+    ):
+        command = commands.add_parser(name, help=help_text)
+        command.add_argument("--collection", choices=sorted(ARCHIVE_POLICIES), default="asteroids_raw")
+        if name != "list":
+            command.add_argument("--start", help="first partition date (YYYY-MM-DD)")
+            command.add_argument("--end", help="last partition date (YYYY-MM-DD)")
+        if name == "rehydrate":
+            command.add_argument("--reprocess", action="store_true",
+                                 help="restore raw asteroids as pending, so the pipeline re-scores them")
+
+    args = parser.parse_args(argv)
+    if getattr(args, "older_than_days", None) is not None and args.older_than_days < 0:
+        parser.error("--older-than-days must be >= 0")
+    return args
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = _parse_args(argv)
+    archive = Archive(args.archive_dir)
+
+    if args.command == "list":
+        print(json.dumps(archive.stats(args.collection)))
+        return
+
+    if args.command == "cat":
+        from bson import json_util
+
+        for doc in archive.read(args.collection, args.start, args.end):
+            sys.stdout.write(json_util.dumps(doc, json_options=json_util.RELAXED_JSON_OPTIONS) + "\n")
+        return
+
+    mongo = MongoDBClient(MONGO_URI, MONGO_DB_NAME, max_pool_size=4)
+    mongo.connect(background=False)
+    try:
+        if args.command == "rehydrate":
+            restored = rehydrate(mongo, archive, args.collection, args.start, args.end, args.reprocess)
+            print(json.dumps({"collection": args.collection, "restored": restored}))
+            return
+
+        for collection in args.collection or sorted(ARCHIVE_POLICIES):
+            days = args.older_than_days if args.older_than_days is not None else RETENTION_DAYS[collection]
+            totals = archive_collection(mongo, archive, collection, days, args.batch_size, args.dry_run)
+            print(json.dumps(totals))
+    finally:
+        mongo.close()
+
+
+if __name__ == "__main__":
+    main()
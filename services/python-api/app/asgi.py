@@ -0,0 +1,78 @@
+from a2wsgi import WSGIMiddleware
+from quart import Quart
+from werkzeug.exceptions import MethodNotAllowed, NotFound
+
+from app.core.async_clients import AsyncClients
+from app.core.config import ASYNC_WSGI_WORKERS
+from app.main import create_app
+from app.routes.async_api import async_events_bp, async_nasa_bp, async_pipeline_bp
+from app.utils.compression import init_compression
+from app.utils.json_provider import FastJSONProvider
+from app.utils.logger import logger
+
+
+class AsyncFirstDispatcher:
+    """Serve a request from the Quart app when it has a matching route, else
+    hand it to the sync Flask app running in a thread pool.
+
+    The hot polling paths (status, stats, listings, NEO feed) and the event
+    feed are native async; everything else keeps its sync implementation
+    without being duplicated."""
+
+    def __init__(self, async_app: Quart, wsgi_app):
+        self.async_app = async_app
+        self.wsgi_app = wsgi_app
+        self._adapter = async_app.url_map.bind("")
+
+    def _is_async_route(self, scope) -> bool:
+        if scope["type"] != "http":
+            # lifespan events start/stop the async clients
+            return True
+        try:
+            self._adapter.match(scope["path"], method=scope["method"])
+        except (NotFound, MethodNotAllowed):
+            return False
+        except Exception:
+            # Redirects (e.g. trailing slash) are answered by Quart as usual
+            return True
+        return True
+
+    async def __call__(self, scope, receive, send):
+        if self._is_async_route(scope):
+            await self.async_app(scope, receive, send)
+        else:
+            await self.wsgi_app(scope, receive, send)
+
+
+def create_asgi_app() -> AsyncFirstDispatcher:
+    flask_app = create_app()
+
+    async_app = Quart(__name__, static_folder=None)
+    async_app.json = FastJSONProvider(async_app)
+    init_compression(async_app)
+    clients = AsyncClients()
+    async_app.extensions["async_clients"] = clients
+    # One change-stream watcher per process, shared with the sync routes
+    async_app.extensions["events"] = flask_app.extensions["events"]
+    async_app.extensions["risk_leaderboard"] = flask_app.extensions["risk_leaderboard"]
+
+    @async_app.before_serving
+    async def _start_clients():
+        await clients.start()
+
+    @async_app.after_serving
+    async def _close_clients():
+        await clients.close()
+
+    async_app.register_blueprint(async_nasa_bp)
+    async_app.register_blueprint(async_pipeline_bp)
+    async_app.register_blueprint(async_events_bp)
+
+    logger.info("ASGI app ready: async routes with sync Flask fallback")
+    return AsyncFirstDispatcher(async_app, WSGIMiddleware(flask_app, workers=ASYNC_WSGI_WORKERS))
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run("app.asgi:create_asgi_app", factory=True, host="0.0.0.0", port=5001)
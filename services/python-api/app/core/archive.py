@@ -0,0 +1,233 @@
+import gzip
+import io
+import os
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import IO, Iterator
+
+from app.utils.logger import logger
+
+try:
+    import zstandard
+except ImportError:  # optional: archives are gzip-compressed without it
+    zstandard = None
+
+ZSTD_LEVEL = 10
+
+# Archived collections: the query selecting documents past retention (at a
+# cutoff) and the date partition of a document
+ARCHIVE_POLICIES = {
+    "asteroids_raw": {
+        # Only asteroids the pipeline is done with
+        "filter": lambda cutoff: {"stored_at": {"$lt": cutoff}, "processing.state": "done"},
+        "partition": lambda doc: doc.get("date") or doc["stored_at"].strftime("%Y-%m-%d"),
+    },
+    "nasa_feeds": {
+        "filter": lambda cutoff: {"retrieved_at": {"$lt": cutoff}},
+        "partition": lambda doc: doc["retrieved_at"].strftime("%Y-%m-%d"),
+    },
+}
+
+_EXTENSIONS = (".ndjson.zst", ".ndjson.gz")
+
+
+def _json_util():
+    # bson ships with pymongo, which is loaded lazily (see mongodb.load_driver)
+    from bson import json_util
+
+    return json_util
+
+
+def _compressor(raw: IO[bytes], extension: str) -> IO[bytes]:
+    if extension.endswith(".zst"):
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).stream_writer(raw, closefd=False)
+    return gzip.GzipFile(fileobj=raw, mode="wb")
+
+
+def _open_read(path: str) -> IO[bytes]:
+    if path.endswith(".zst"):
+        if zstandard is None:
+            raise RuntimeError(f"{path} is zstd-compressed; install zstandard to read it")
+        return zstandard.ZstdDecompressor().stream_reader(open(path, "rb"), closefd=True)
+    return gzip.open(path, "rb")
+
+
+class Archive:
+    """Compressed NDJSON files under `root`, one directory per collection
+    and date partition:
+
+        <root>/<collection>/date=YYYY-MM-DD/part-<timestamp>-<id>.ndjson.zst
+
+    Documents are Extended JSON (bson.json_util, relaxed), so ObjectIds and
+    dates survive the round trip. Files are zstd-compressed when zstandard
+    is installed, gzip otherwise; both are read back."""
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def partition_dir(self, collection: str, partition: str) -> str:
+        return os.path.join(self.root, collection, f"date={partition}")
+
+    def write_partition(self, collection: str, partition: str, docs: list[dict]) -> str:
+        """Write `docs` as a new part file; durable once this returns."""
+        json_util = _json_util()
+        directory = self.partition_dir(collection, partition)
+        os.makedirs(directory, exist_ok=True)
+
+        extension = _EXTENSIONS[0] if zstandard is not None else _EXTENSIONS[1]
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S")
+        path = os.path.join(directory, f"part-{stamp}-{uuid.uuid4().hex[:8]}{extension}")
+        tmp = path + ".tmp"
+        try:
+            with open(tmp, "wb") as raw:
+                with _compressor(raw, extension) as out:
+                    for doc in docs:
+                        out.write(json_util.dumps(doc, json_options=json_util.RELAXED_JSON_OPTIONS).encode())
+                        out.write(b"\n")
+                raw.flush()
+                os.fsync(raw.fileno())
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
+        return path
+
+    def partitions(self, collection: str, start: str | None = None, end: str | None = None) -> list[str]:
+        """Partition dates of `collection` within [start, end], in order."""
+        directory = os.path.join(self.root, collection)
+        if not os.path.isdir(directory):
+            return []
+        found = sorted(
+            name.removeprefix("date=") for name in os.listdir(directory) if name.startswith("date=")
+        )
+        return [p for p in found if (start is None or p >= start) and (end is None or p <= end)]
+
+    def files(self, collection: str, partition: str) -> list[str]:
+        directory = self.partition_dir(collection, partition)
+        return sorted(
+            os.path.join(directory, name)
+            for name in os.listdir(directory)
+            if name.endswith(_EXTENSIONS)
+        )
+
+    def read(self, collection: str, start: str | None = None, end: str | None = None) -> Iterator[dict]:
+        """Archived documents of partitions [start, end], partition by partition.
+
+        A document archived again after a rehydration appears in several
+        part files; only its latest copy is returned."""
+        json_util = _json_util()
+        for partition in self.partitions(collection, start, end):
+            docs: dict = {}
+            for path in self.files(collection, partition):
+                with _open_read(path) as raw, io.TextIOWrapper(raw, encoding="utf-8") as lines:
+                    for line in lines:
+                        if line.strip():
+                            doc = json_util.loads(line)
+                            docs[doc["_id"]] = doc
+            yield from docs.values()
+
+    def stats(self, collection: str) -> list[dict]:
+        rows = []
+        for partition in self.partitions(collection):
+            files = self.files(collection, partition)
+            rows.append({
+                "partition": partition,
+                "files": len(files),
+                "bytes": sum(os.path.getsize(path) for path in files),
+            })
+        return rows
+
+
+def archive_collection(
+    mongo,
+    archive: Archive,
+    collection: str,
+    older_than_days: int,
+    batch_size: int,
+    dry_run: bool = False,
+) -> dict:
+    """Move documents of `collection` past retention into `archive`.
+
+    Documents are buffered per date partition; each flush writes one part
+    file and only then deletes its documents from Mongo, so an interrupted
+    run loses nothing (at worst a document is archived twice)."""
+    if mongo.db is None:
+        raise RuntimeError("Database not initialized")
+
+    policy = ARCHIVE_POLICIES[collection]
+    cutoff = datetime.now(timezone.utc) - timedelta(days=older_than_days)
+    query = policy["filter"](cutoff)
+    source = mongo.db[collection]
+    totals = {"collection": collection, "cutoff": cutoff.isoformat(), "documents": 0, "files": 0, "partitions": set()}
+
+    buffers: dict[str, list[dict]] = {}
+    buffered = 0
+
+    def flush() -> None:
+        nonlocal buffered
+        for partition, docs in buffers.items():
+            if not dry_run:
+                archive.write_partition(collection, partition, docs)
+                # Re-checked so a document changed since it was read stays in Mongo
+                source.delete_many({"_id": {"$in": [doc["_id"] for doc in docs]}, **query})
+            totals["documents"] += len(docs)
+            totals["files"] += 1
+            totals["partitions"].add(partition)
+        buffers.clear()
+        buffered = 0
+
+    # Only documents the cursor already returned are deleted
+    for doc in source.find(query):
+        buffers.setdefault(policy["partition"](doc), []).append(doc)
+        buffered += 1
+        if buffered >= batch_size:
+            flush()
+    flush()
+
+    totals["partitions"] = len(totals["partitions"])
+    logger.info(
+        f"Archived {totals['documents']} {collection} documents older than {older_than_days} days "
+        f"into {totals['files']} files{' (dry run)' if dry_run else ''}"
+    )
+    return totals
+
+
+def rehydrate(
+    mongo,
+    archive: Archive,
+    collection: str,
+    start: str | None = None,
+    end: str | None = None,
+    reprocess: bool = False,
+    batch_size: int = 1000,
+) -> int:
+    """Restore archived documents of partitions [start, end] into Mongo
+    (upserts by _id, so running it twice is harmless).
+
+    With `reprocess`, raw asteroids come back pending for the pipeline to
+    analyze again."""
+    if mongo.db is None:
+        raise RuntimeError("Database not initialized")
+
+    from pymongo import ReplaceOne
+
+    from app.core.mongodb import new_processing_state
+
+    target = mongo.db[collection]
+    restored = 0
+    batch = []
+    for doc in archive.read(collection, start, end):
+        if reprocess and collection == "asteroids_raw":
+            doc["processing"] = new_processing_state(str(doc.get("asteroid", {}).get("id", "")))
+        batch.append(ReplaceOne({"_id": doc["_id"]}, doc, upsert=True))
+        if len(batch) >= batch_size:
+            target.bulk_write(batch, ordered=False)
+            restored += len(batch)
+            batch = []
+    if batch:
+        target.bulk_write(batch, ordered=False)
+        restored += len(batch)
+
+    logger.info(f"Rehydrated {restored} {collection} documents from the archive")
+    return restored
@@ -0,0 +1,173 @@
+import asyncio
+import time
+from typing import Any, Dict, Optional
+
+import httpx
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from app.core.config import (
+    ASYNC_HTTP_MAX_CONNECTIONS,
+    MONGO_DB_NAME,
+    MONGO_MAX_POOL_SIZE,
+    MONGO_URI,
+    NASA_NEO_FEED_ENDPOINT,
+    REQUEST_TIMEOUT,
+    RUST_CONNECT_TIMEOUT,
+)
+from app.core.mongodb import mark_analyzed_update
+from app.core.nasa_client import _build_nasa_url, _neo_feed_params
+from app.core.resilience import CircuitOpenError
+from app.core.rust_client import (
+    _downgrade_to_json,
+    _instance_wire_format,
+    _retry_as_json,
+    _wire_headers,
+    limiter,
+    pool,
+)
+from app.core.wire_format import decode_body, encode_body
+from app.models.risk_rollup import rollup_update
+from app.utils.logger import logger
+
+
+class AsyncClients:
+    """httpx and motor clients shared by the async (ASGI) routes.
+
+    Both are created inside the serving event loop (`start`) and closed on
+    shutdown. Rust Engine calls go through the same `EnginePool` as the sync
+    client, so breakers and ejections are shared between both modes."""
+
+    def __init__(self, mongo_uri: str = MONGO_URI, db_name: str = MONGO_DB_NAME):
+        self.mongo_uri = mongo_uri
+        self.db_name = db_name
+        self.http: httpx.AsyncClient | None = None
+        self.mongo: AsyncIOMotorClient | None = None
+        self.db = None
+
+    async def start(self) -> None:
+        self.http = httpx.AsyncClient(
+            timeout=httpx.Timeout(REQUEST_TIMEOUT, connect=RUST_CONNECT_TIMEOUT),
+            limits=httpx.Limits(
+                max_connections=ASYNC_HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=ASYNC_HTTP_MAX_CONNECTIONS,
+            ),
+        )
+        self.mongo = AsyncIOMotorClient(
+            self.mongo_uri, serverSelectionTimeoutMS=3000, maxPoolSize=MONGO_MAX_POOL_SIZE
+        )
+        self.db = self.mongo[self.db_name]
+        logger.info(f"Async clients started for database '{self.db_name}'")
+
+    async def close(self) -> None:
+        if self.http is not None:
+            await self.http.aclose()
+        if self.mongo is not None:
+            self.mongo.close()
+        logger.info("Async clients closed")
+
+    def _require_db(self):
+        if self.db is None:
+            raise RuntimeError("Database not initialized")
+        return self.db
+
+    async def ping_mongo(self) -> None:
+        await self._require_db().command("ping")
+
+    async def get_raw_asteroid_by_id(self, asteroid_id: str) -> dict | None:
+        return await self._require_db()["asteroids_raw"].find_one({"asteroid.id": asteroid_id})
+
+    async def mark_analyzed(self, raw_id) -> None:
+        await self._require_db()["asteroids_raw"].update_one(*mark_analyzed_update(raw_id))
+
+    async def insert_analysis(self, document: dict) -> str:
+        db = self._require_db()
+        result = await db["asteroid_analyses"].insert_one(document)
+        rollup_filter, rollup = rollup_update(document)
+        await db["risk_rollups"].update_one(rollup_filter, rollup, upsert=True)
+        return str(result.inserted_id)
+
+    async def get_neo_feed(
+        self, start_date: Optional[str] = None, end_date: Optional[str] = None
+    ) -> Dict[str, Any]:
+        url, query = _build_nasa_url(NASA_NEO_FEED_ENDPOINT, _neo_feed_params(start_date, end_date))
+
+        logger.info(f"Calling NASA NEO Feed (async): {url} params={query}")
+
+        response = await self.http.get(url, params=query)
+        response.raise_for_status()
+        return response.json()
+
+    async def _post_asteroid(self, base_url: str, asteroid_dto: Dict[str, Any], wire_format: str):
+        return await self.http.post(
+            f"{base_url}/api/process/asteroid",
+            content=encode_body(asteroid_dto, wire_format),
+            headers=_wire_headers[wire_format],
+        )
+
+    @staticmethod
+    async def _wait_for_slot() -> None:
+        """Block on the limiter in a thread, off the event loop."""
+        waiter = asyncio.ensure_future(asyncio.to_thread(limiter.acquire))
+        try:
+            await asyncio.shield(waiter)
+        except asyncio.CancelledError:
+            # The thread still gets its slot eventually; hand it back
+            waiter.add_done_callback(lambda _: limiter.cancel())
+            raise
+
+    @staticmethod
+    async def _acquire_instance():
+        try:
+            return pool.acquire(probe=False)
+        except CircuitOpenError:
+            # Probing ejected instances does blocking I/O, keep it off the event loop
+            return await asyncio.to_thread(pool.acquire)
+
+    async def process_asteroid_with_rust(self, asteroid_dto: Dict[str, Any]) -> Dict[str, Any]:
+        if not pool.instances:
+            raise ValueError("RUST_ENGINE_URL is not configured.")
+
+        asteroid_id = asteroid_dto.get("id", "unknown")
+
+        # Same AIMD slots as the sync client, so both modes share one limit
+        if not limiter.try_acquire():
+            await self._wait_for_slot()
+        try:
+            instance = await self._acquire_instance()
+        except BaseException:
+            limiter.cancel()
+            raise
+
+        logger.info(f"Sending asteroid {asteroid_id} to Rust Engine at {instance.url} (async)")
+
+        started = time.monotonic()
+        engine_failed = True
+        try:
+            wire_format = _instance_wire_format(instance)
+            response = await self._post_asteroid(instance.url, asteroid_dto, wire_format)
+            if _retry_as_json(wire_format, response.status_code):
+                response = await self._post_asteroid(instance.url, asteroid_dto, "json")
+                if response.is_success:
+                    _downgrade_to_json(instance)
+            response.raise_for_status()
+            engine_failed = False
+        except httpx.HTTPStatusError as e:
+            # 4xx means the engine is up and rejected the payload
+            engine_failed = e.response.status_code >= 500
+            logger.error(f"Rust Engine request failed for asteroid {asteroid_id}: {e}")
+            raise
+        except httpx.HTTPError as e:
+            logger.error(f"Rust Engine request failed for asteroid {asteroid_id}: {e}")
+            raise
+        finally:
+            latency = time.monotonic() - started
+            pool.release(instance, latency, ok=not engine_failed)
+            limiter.release(latency, ok=not engine_failed)
+
+        try:
+            return decode_body(response.content, response.headers.get("content-type"))
+        except ValueError as e:
+            logger.error(
+                f"Invalid response body from Rust Engine for asteroid {asteroid_id}: {e}"
+            )
+            raise RuntimeError("Rust Engine returned an undecodable response") from e
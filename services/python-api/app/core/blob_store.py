@@ -0,0 +1,130 @@
+import hashlib
+import os
+import queue
+import tempfile
+import threading
+from typing import Callable
+
+from app.utils.logger import logger
+
+
+class BlobStore:
+    """Files under `root` named by a hash of their key, at most `max_bytes`
+    in total. Reads refresh a file's mtime; the least recently used files
+    are evicted when a write goes over the limit.
+
+    Writes are atomic (temp file + rename), so processes can share a root."""
+
+    def __init__(self, root: str, max_bytes: int):
+        self.root = root
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(root, exist_ok=True)
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.root, hashlib.sha256(key.encode()).hexdigest())
+
+    def get(self, key: str) -> str | None:
+        """Path of the blob stored for `key`, or None."""
+        path = self.path(key)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return path
+
+    def put(self, key: str, data: bytes) -> str:
+        if len(data) > self.max_bytes:
+            raise ValueError(f"blob of {len(data)} bytes exceeds the store size")
+
+        path = self.path(key)
+        fd, tmp = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        self._evict()
+        return path
+
+    def usage(self) -> tuple[int, int]:
+        """(files, bytes) currently stored."""
+        entries = self._entries()
+        return len(entries), sum(size for _, size, _ in entries)
+
+    def _entries(self) -> list[tuple[float, int, str]]:
+        entries = []
+        with os.scandir(self.root) as it:
+            for entry in it:
+                if entry.name.endswith(".tmp"):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries
+
+    def _evict(self) -> None:
+        with self._lock:
+            entries = self._entries()
+            total = sum(size for _, size, _ in entries)
+            if total <= self.max_bytes:
+                return
+            evicted = 0
+            for _, size, path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.unlink(path)
+                except FileNotFoundError:
+                    pass
+                total -= size
+                evicted += 1
+            logger.info(f"Blob store {self.root}: evicted {evicted} files")
+
+
+class Prefetcher:
+    """One background thread filling a `BlobStore` from a bounded queue.
+
+    `fetch(key)` returns the bytes to store; keys already stored or queued
+    are skipped, and when the queue is full new keys are dropped (they are
+    fetched again on a later request)."""
+
+    def __init__(self, store: BlobStore, fetch: Callable[[str], bytes], maxsize: int):
+        self.store = store
+        self.fetch = fetch
+        self._queue: queue.Queue = queue.Queue(maxsize=maxsize)
+        self._pending: set[str] = set()
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    def submit(self, key: str) -> bool:
+        """Queue `key` unless stored or pending. True if queued."""
+        if self.store.get(key) is not None:
+            return False
+        with self._lock:
+            if key in self._pending:
+                return False
+            try:
+                self._queue.put_nowait(key)
+            except queue.Full:
+                return False
+            self._pending.add(key)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, daemon=True, name="blob-prefetch")
+                self._thread.start()
+        return True
+
+    def _run(self) -> None:
+        while True:
+            key = self._queue.get()
+            try:
+                self.store.put(key, self.fetch(key))
+            except Exception as e:
+                logger.warning(f"Prefetch of {key} failed: {e}")
+            finally:
+                with self._lock:
+                    self._pending.discard(key)
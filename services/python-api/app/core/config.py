@@ -1,25 +1,135 @@
 import os
+import tempfile
 from dotenv import load_dotenv, find_dotenv
 
 load_dotenv(find_dotenv())
 
-_nasa_key = os.getenv("NASA_API_KEY")
-if not _nasa_key:
-    raise ValueError("NASA_API_KEY is not set in environment variables.")
-
-NASA_API_KEY: str = _nasa_key
+# Checked when a NASA call is made (nasa_client), so tools and workers that
+# never talk to NASA can import the config without it
+NASA_API_KEY: str | None = os.getenv("NASA_API_KEY") or None
 
 NASA_BASE_URL = "https://api.nasa.gov"
 
 NASA_APOD_ENDPOINT = "/planetary/apod"
 NASA_NEO_FEED_ENDPOINT = "/neo/rest/v1/feed"
+NASA_NEO_LOOKUP_ENDPOINT = "/neo/rest/v1/neo"
 
 RUST_ENGINE_URL = os.getenv("RUST_ENGINE_URL")
+# Comma separated list of engine instances; falls back to RUST_ENGINE_URL
+RUST_ENGINE_URLS = [
+    url.strip().rstrip("/")
+    for url in os.getenv("RUST_ENGINE_URLS", RUST_ENGINE_URL or "").split(",")
+    if url.strip()
+]
+RUST_HEALTH_CHECK_INTERVAL = float(os.getenv("RUST_HEALTH_CHECK_INTERVAL", 10))
+# Eject an instance whose latency exceeds this multiple of the pool median
+RUST_SLOW_EJECT_FACTOR = float(os.getenv("RUST_SLOW_EJECT_FACTOR", 3.0))
+# Body encoding for engine calls: "msgpack" or "json". msgpack falls back to JSON
+# when not installed, and per instance once an engine answers 415 to it
+RUST_WIRE_FORMAT = os.getenv("RUST_WIRE_FORMAT", "msgpack")
+RUST_CONNECT_TIMEOUT = float(os.getenv("RUST_CONNECT_TIMEOUT", 3))
+RUST_HEALTH_TIMEOUT = float(os.getenv("RUST_HEALTH_TIMEOUT", 5))
+
+# Circuit breaker around each Rust engine instance
+RUST_BREAKER_FAILURE_THRESHOLD = int(os.getenv("RUST_BREAKER_FAILURE_THRESHOLD", 5))
+RUST_BREAKER_RESET_TIMEOUT = float(os.getenv("RUST_BREAKER_RESET_TIMEOUT", 15))
+
+# Adaptive (AIMD) in-flight limit for Rust engine calls
+RUST_MIN_CONCURRENCY = int(os.getenv("RUST_MIN_CONCURRENCY", 1))
+RUST_MAX_CONCURRENCY = int(os.getenv("RUST_MAX_CONCURRENCY", 32))
+RUST_LATENCY_TARGET_MS = float(os.getenv("RUST_LATENCY_TARGET_MS", 250))
 
 MONGO_URI = os.getenv("MONGO_URI", "mongodb://localhost:27017")
 MONGO_DB_NAME = os.getenv("MONGO_DB", "astroforge_db")
+# Per process; gunicorn.conf.py sizes it from the worker thread count
+MONGO_MAX_POOL_SIZE = int(os.getenv("MONGO_MAX_POOL_SIZE", 100))
 
 LOG_DIRECTORY = os.getenv("LOG_DIRECTORY", "./logs")
 
+# Worker processes race for this lock; only the holder runs the startup seed
+SEED_LOCK_FILE = os.getenv(
+    "SEED_LOCK_FILE", os.path.join(tempfile.gettempdir(), "astroforge-seed.lock")
+)
+
 REQUEST_TIMEOUT = int(os.getenv("REQUEST_TIMEOUT", 30))
+
+# GET /dashboard/snapshot: rebuilt once older than the TTL, or after data
+# change events once at least MIN_AGE old (a burst of events costs one rebuild)
+DASHBOARD_SNAPSHOT_TTL = float(os.getenv("DASHBOARD_SNAPSHOT_TTL", 5))
+DASHBOARD_SNAPSHOT_MIN_AGE = float(os.getenv("DASHBOARD_SNAPSHOT_MIN_AGE", 1))
+DASHBOARD_TOP_RISKS = int(os.getenv("DASHBOARD_TOP_RISKS", 10))
+DASHBOARD_LOG_TAIL = int(os.getenv("DASHBOARD_LOG_TAIL", 20))
+
+# GET /events: polling interval used when change streams are unavailable
+# (standalone mongod)
+EVENTS_POLL_INTERVAL = float(os.getenv("EVENTS_POLL_INTERVAL", 2))
+EVENTS_KEEPALIVE = float(os.getenv("EVENTS_KEEPALIVE", 15))
+
+# Server-side pipeline schedule: "300", "5m", "1h", a 5-field cron
+# expression (UTC) or @hourly/@daily/@weekly; empty disables it
+PIPELINE_SCHEDULE = os.getenv("PIPELINE_SCHEDULE", "")
+# Random delay (seconds) added to each slot so processes don't wake together
+PIPELINE_SCHEDULE_JITTER = float(os.getenv("PIPELINE_SCHEDULE_JITTER", 30))
+# Scheduled runs size their batch from the backlog within these bounds
+PIPELINE_BATCH_MIN = int(os.getenv("PIPELINE_BATCH_MIN", 100))
+PIPELINE_BATCH_MAX = int(os.getenv("PIPELINE_BATCH_MAX", 1000))
+# Pipeline runs (scheduled or manual) hold a Mongo lease, renewed while running
+PIPELINE_LEASE_TTL = float(os.getenv("PIPELINE_LEASE_TTL", 120))
+
+# Partitioned pipeline workers (python -m app.workers)
+WORKER_BATCH_SIZE = int(os.getenv("WORKER_BATCH_SIZE", 50))
+# Claims not renewed within this many seconds (crashed worker) are taken over
+WORKER_CLAIM_TTL = float(os.getenv("WORKER_CLAIM_TTL", 60))
+# An asteroid claimed this many times without success is marked failed
+WORKER_MAX_ATTEMPTS = int(os.getenv("WORKER_MAX_ATTEMPTS", 3))
+# Sleep between polls once a worker's partition is empty
+WORKER_IDLE_INTERVAL = float(os.getenv("WORKER_IDLE_INTERVAL", 5))
+# With --drain, a worker gives up once the engine has been unavailable this long
+WORKER_ENGINE_WAIT = float(os.getenv("WORKER_ENGINE_WAIT", 120))
+
+# Orbit propagation (/orbits): epochs per request, asteroids per batch
+# request, object x epoch pairs per block (bounds memory) and NASA lookups
+# per request for missing elements
+ORBIT_MAX_EPOCHS = int(os.getenv("ORBIT_MAX_EPOCHS", 100_000))
+ORBIT_MAX_IDS = int(os.getenv("ORBIT_MAX_IDS", 1000))
+ORBIT_BLOCK_SIZE = int(os.getenv("ORBIT_BLOCK_SIZE", 100_000))
+ORBIT_LOOKUP_LIMIT = int(os.getenv("ORBIT_LOOKUP_LIMIT", 20))
+
+# GET /nasa/apod: entries older than a day are cached in MongoDB for good;
+# the latest ones are refetched after APOD_RECENT_TTL seconds
+APOD_RECENT_TTL = float(os.getenv("APOD_RECENT_TTL", 600))
+APOD_MAX_RANGE_DAYS = int(os.getenv("APOD_MAX_RANGE_DAYS", 366))
+# Background download of APOD images into a local blob store bounded to
+# APOD_BLOB_MAX_BYTES (least recently used images are evicted)
+APOD_PREFETCH = os.getenv("APOD_PREFETCH", "false").lower() == "true"
+APOD_BLOB_DIR = os.getenv("APOD_BLOB_DIR", "./data/apod")
+APOD_BLOB_MAX_BYTES = int(os.getenv("APOD_BLOB_MAX_BYTES", 512 * 1024 * 1024))
+APOD_MEDIA_MAX_BYTES = int(os.getenv("APOD_MEDIA_MAX_BYTES", 20 * 1024 * 1024))
+APOD_PREFETCH_QUEUE = int(os.getenv("APOD_PREFETCH_QUEUE", 100))
+
+# Retention (python -m app.archive run): analyzed raw asteroids and NASA
+# feeds older than these many days move to compressed NDJSON files
+ARCHIVE_DIR = os.getenv("ARCHIVE_DIR", "./data/archive")
+ARCHIVE_RAW_RETENTION_DAYS = int(os.getenv("ARCHIVE_RAW_RETENTION_DAYS", 90))
+ARCHIVE_FEED_RETENTION_DAYS = int(os.getenv("ARCHIVE_FEED_RETENTION_DAYS", 30))
+# Documents buffered before part files are written and deleted from Mongo
+ARCHIVE_BATCH_SIZE = int(os.getenv("ARCHIVE_BATCH_SIZE", 5000))
+
+# In-memory top-K risk ranking (GET /pipeline/analysis/top), checked
+# against MongoDB and rebuilt on drift every LEADERBOARD_VERIFY_INTERVAL s
+LEADERBOARD_SIZE = int(os.getenv("LEADERBOARD_SIZE", 100))
+LEADERBOARD_VERIFY_INTERVAL = float(os.getenv("LEADERBOARD_VERIFY_INTERVAL", 300))
+
+# Response compression, negotiated on Accept-Encoding (brotli when installed,
+# else gzip). Buffered bodies smaller than COMPRESS_MIN_BYTES go out as is;
+# streamed ones are always compressed
+COMPRESS_RESPONSES = os.getenv("COMPRESS_RESPONSES", "true").lower() == "true"
+COMPRESS_MIN_BYTES = int(os.getenv("COMPRESS_MIN_BYTES", 1024))
+COMPRESS_GZIP_LEVEL = int(os.getenv("COMPRESS_GZIP_LEVEL", 6))
+COMPRESS_BROTLI_QUALITY = int(os.getenv("COMPRESS_BROTLI_QUALITY", 4))
+
+# Async (ASGI) serving mode
+ASYNC_HTTP_MAX_CONNECTIONS = int(os.getenv("ASYNC_HTTP_MAX_CONNECTIONS", 200))
+# Threads serving the routes that fall through to the sync Flask app
+ASYNC_WSGI_WORKERS = int(os.getenv("ASYNC_WSGI_WORKERS", 16))
 DEBUG = os.getenv("DEBUG", "false").lower() == "true"
\ No newline at end of file
@@ -1,74 +1,79 @@
 from typing import Optional
 from app.models.asteroid import Asteroid
+from app.models.close_approach import approach_time
 from app.utils.logger import logger
 
 
-def map_nasa_raw_to_asteroid(raw_nasa_data: dict) -> Optional[Asteroid]:
+def normalize_nasa_raw(raw_nasa_data: dict) -> tuple[Optional[dict], Optional[str]]:
+    """Compact, typed fields of a NASA NEO that the pipeline reads, computed
+    once at ingest and stored as the raw document's `normalized`.
 
+    Returns (normalized, None), or (None, reason code) for an asteroid the
+    engine cannot score."""
     try:
         asteroid_id = raw_nasa_data.get("id", "").strip()
         name = raw_nasa_data.get("name", "Unknown").strip()
-        
+
         if not asteroid_id:
-            logger.warning("Skipping asteroid with empty ID")
-            return None
-        
+            return None, "missing_id"
+
         diameter_info = raw_nasa_data.get("estimated_diameter", {}).get("kilometers", {})
-        diameter_min = diameter_info.get("estimated_diameter_min", 0.0)
-        diameter_max = diameter_info.get("estimated_diameter_max", 0.0)
+        diameter_min = float(diameter_info.get("estimated_diameter_min", 0.0))
+        diameter_max = float(diameter_info.get("estimated_diameter_max", 0.0))
         diameter_avg = (diameter_min + diameter_max) / 2.0
-        
+
         if diameter_avg <= 0.0:
-            logger.warning(f"Asteroid {asteroid_id} has invalid diameter, skipping")
-            return None
-        
+            return None, "invalid_diameter"
+
         close_approach_data = raw_nasa_data.get("close_approach_data", [])
         if not close_approach_data:
-            logger.warning(f"Asteroid {asteroid_id} missing close approach data, skipping")
-            return None
-        
+            return None, "missing_close_approach"
+
         first_approach = close_approach_data[0]
         # using first close approach entry; maybe refined later...
-        
+
         velocity_info = first_approach.get("relative_velocity", {})
         velocity_kps = float(velocity_info.get("kilometers_per_second", 0.0))
         if velocity_kps <= 0.0:
-            logger.warning(f"Asteroid {asteroid_id} has non-physical velocity ({velocity_kps}), skipping")
-            return None
-    
-        
+            return None, "invalid_velocity"
+
         miss_distance_info = first_approach.get("miss_distance", {})
         miss_distance_km = float(miss_distance_info.get("kilometers", 0.0))
-        
-        approach_date = first_approach.get("close_approach_date", "")
-        orbiting_body = first_approach.get("orbiting_body", "Earth")
-        
-        is_hazardous = raw_nasa_data.get("is_potentially_hazardous_asteroid", False)
-        
-        absolute_magnitude = raw_nasa_data.get("absolute_magnitude_h", 0.0)
-        
-        return Asteroid(
-            id=asteroid_id,
-            name=name,
-            absolute_magnitude_h=absolute_magnitude,
-            diameter_km=diameter_avg,
-            velocity_kps=velocity_kps,
-            distance_km=miss_distance_km,
-            is_potentially_hazardous=is_hazardous,
-            close_approach_date=approach_date,
-            orbiting_body=orbiting_body,
-        )
-        
-    except (KeyError, ValueError, TypeError) as e:
-        logger.error(f"Error mapping NASA data to Asteroid: {e}")
+
+        return {
+            "id": asteroid_id,
+            "name": name,
+            "absolute_magnitude_h": float(raw_nasa_data.get("absolute_magnitude_h") or 0.0),
+            "diameter_km": diameter_avg,
+            "velocity_kps": velocity_kps,
+            "distance_km": miss_distance_km,
+            "is_potentially_hazardous": bool(raw_nasa_data.get("is_potentially_hazardous_asteroid", False)),
+            "approach_at": approach_time(first_approach),
+            "orbiting_body": first_approach.get("orbiting_body", "Earth"),
+        }, None
+
+    except (AttributeError, KeyError, ValueError, TypeError):
+        return None, "malformed"
+
+
+def map_nasa_raw_to_asteroid(raw_nasa_data: dict) -> Optional[Asteroid]:
+    normalized, reason = normalize_nasa_raw(raw_nasa_data)
+    if normalized is None:
+        logger.warning(f"Skipping asteroid {raw_nasa_data.get('id', 'unknown')}: {reason}")
         return None
+    return Asteroid.from_normalized(normalized)
 
 
 def map_mongo_document_to_asteroid(mongo_doc: dict) -> Optional[Asteroid]:
+    normalized = mongo_doc.get("normalized")
+    if normalized is not None:
+        return Asteroid.from_normalized(normalized)
+
+    # Stored before normalize-at-ingest
     raw_asteroid = mongo_doc.get("asteroid")
-    
+
     if not raw_asteroid:
         logger.warning("MongoDB document missing 'asteroid' field")
         return None
-    
+
     return map_nasa_raw_to_asteroid(raw_asteroid)
@@ -0,0 +1,197 @@
+import statistics
+import threading
+import time
+from typing import Callable
+
+from app.core.resilience import CircuitBreaker, CircuitOpenError
+from app.utils.logger import logger
+
+
+class EngineInstance:
+    def __init__(self, url: str, breaker: CircuitBreaker):
+        self.url = url
+        self.breaker = breaker
+        self.outstanding = 0
+        self.latency_ewma_s = 0.0
+        self.requests = 0
+        self.failures = 0
+        self.ejections = 0
+        self.last_health: str | None = None
+        self.last_health_at: float | None = None
+        # Set once the instance rejected a MessagePack body and accepted JSON
+        self.json_only = False
+
+    def observe_latency(self, latency_s: float) -> None:
+        self.latency_ewma_s = (
+            latency_s if self.latency_ewma_s == 0.0
+            else 0.8 * self.latency_ewma_s + 0.2 * latency_s
+        )
+
+    def snapshot(self) -> dict:
+        return {
+            "url": self.url,
+            "state": self.breaker.state,
+            "outstanding": self.outstanding,
+            "latency_ewma_ms": round(self.latency_ewma_s * 1000.0, 2),
+            "requests": self.requests,
+            "failures": self.failures,
+            "ejections": self.ejections,
+            "json_only": self.json_only,
+            "last_health": self.last_health,
+            "last_health_age_s": (
+                round(time.monotonic() - self.last_health_at, 1)
+                if self.last_health_at is not None else None
+            ),
+        }
+
+
+class EnginePool:
+    """Least-outstanding-requests balancing over Rust engine instances.
+
+    Every instance owns a circuit breaker: failing or persistently slow
+    instances are ejected (circuit opened) and reinstated once their
+    `/api/health` probe succeeds again."""
+
+    def __init__(
+        self,
+        urls: list[str],
+        health_check: Callable[[str], str],
+        failure_threshold: int,
+        reset_timeout: float,
+        slow_eject_factor: float,
+    ):
+        self.health_check = health_check
+        self.slow_eject_factor = slow_eject_factor
+        self._lock = threading.Lock()
+        self._health_thread: threading.Thread | None = None
+        self._stop = threading.Event()
+
+        self.instances = [
+            EngineInstance(
+                url,
+                CircuitBreaker(
+                    f"rust-engine {url}",
+                    failure_threshold=failure_threshold,
+                    reset_timeout=reset_timeout,
+                    probe=self._make_probe(url),
+                ),
+            )
+            for url in urls
+        ]
+
+    def _make_probe(self, url: str) -> Callable[[], bool]:
+        return lambda: self._probe(url)
+
+    def _probe(self, url: str) -> bool:
+        status = self.health_check(url)
+        for instance in self.instances:
+            if instance.url == url:
+                instance.last_health = status
+                instance.last_health_at = time.monotonic()
+        return status == "ok"
+
+    def is_available(self) -> bool:
+        return any(instance.breaker.allow_request() for instance in self.instances)
+
+    def acquire(self, probe: bool = True) -> EngineInstance:
+        """Pick the healthy instance with the fewest outstanding requests.
+
+        With `probe=False` ejected instances are not health-probed inline, so
+        the call never blocks (used from the event loop in async mode)."""
+        candidates = [i for i in self.instances if i.breaker.state == CircuitBreaker.CLOSED]
+        if not candidates and probe:
+            # Let ejected instances whose reset timeout elapsed probe their way back in
+            candidates = [i for i in self.instances if i.breaker.allow_request()]
+        if not candidates:
+            raise CircuitOpenError("All Rust Engine instances are unavailable")
+
+        with self._lock:
+            instance = min(candidates, key=lambda i: (i.outstanding, i.latency_ewma_s))
+            instance.outstanding += 1
+            instance.requests += 1
+        return instance
+
+    def release(self, instance: EngineInstance, latency_s: float, ok: bool) -> None:
+        with self._lock:
+            instance.outstanding -= 1
+            if ok:
+                instance.observe_latency(latency_s)
+            else:
+                instance.failures += 1
+
+        if ok:
+            instance.breaker.record_success()
+            self._eject_if_slow(instance)
+        else:
+            was_closed = instance.breaker.state == CircuitBreaker.CLOSED
+            instance.breaker.record_failure()
+            if was_closed and instance.breaker.state != CircuitBreaker.CLOSED:
+                instance.ejections += 1
+
+    def _eject_if_slow(self, instance: EngineInstance) -> None:
+        healthy = [
+            i for i in self.instances
+            if i.breaker.state == CircuitBreaker.CLOSED and i.latency_ewma_s > 0.0
+        ]
+        # Never eject the last healthy instance for being slow
+        if len(healthy) < 2:
+            return
+
+        median = statistics.median(i.latency_ewma_s for i in healthy)
+        if instance.latency_ewma_s > median * self.slow_eject_factor:
+            logger.warning(
+                f"Ejecting slow Rust Engine instance {instance.url}: "
+                f"{instance.latency_ewma_s * 1000:.1f}ms vs median {median * 1000:.1f}ms"
+            )
+            instance.ejections += 1
+            # Start from the median again once reinstated
+            instance.latency_ewma_s = median
+            instance.breaker.trip()
+
+    def check_all(self) -> None:
+        for instance in self.instances:
+            if instance.breaker.state != CircuitBreaker.CLOSED:
+                # Probes /api/health if the reset timeout elapsed
+                instance.breaker.allow_request()
+            elif not self._probe(instance.url):
+                logger.warning(f"Rust Engine instance {instance.url} failed health check, ejecting")
+                instance.ejections += 1
+                instance.breaker.trip()
+
+    def start_health_checks(self, interval_s: float) -> None:
+        if not self.instances or (self._health_thread and self._health_thread.is_alive()):
+            return
+
+        def _loop():
+            # First round right away so the cached health is known soon after startup
+            while True:
+                try:
+                    self.check_all()
+                except Exception as e:
+                    logger.error(f"Rust Engine health check loop failed: {e}")
+                if self._stop.wait(interval_s):
+                    return
+
+        self._stop.clear()
+        self._health_thread = threading.Thread(
+            target=_loop, daemon=True, name="rust-engine-health"
+        )
+        self._health_thread.start()
+
+    def stop_health_checks(self) -> None:
+        self._stop.set()
+
+    def health_status(self) -> str:
+        """Health as of the last background checks, without any I/O."""
+        closed = [i for i in self.instances if i.breaker.state == CircuitBreaker.CLOSED]
+        if any(i.last_health == "ok" for i in closed):
+            return "ok"
+        if closed and all(i.last_health is None for i in closed):
+            return "unknown"
+
+        statuses = [i.last_health for i in self.instances]
+        return "unhealthy" if "unhealthy" in statuses else "unreachable"
+
+    def snapshot(self) -> list[dict]:
+        with self._lock:
+            return [instance.snapshot() for instance in self.instances]
@@ -0,0 +1,218 @@
+import asyncio
+import queue
+import threading
+from typing import Callable
+
+from app.core import mongodb
+from app.models.analysis_result import flatten_analysis
+from app.utils.logger import logger
+
+WATCHED_COLLECTIONS = ("asteroid_analyses", "asteroids_raw")
+EVENT_TYPES = {"asteroid_analyses": "analysis", "asteroids_raw": "raw"}
+
+# Returned by mongod when change streams are used without a replica set
+CHANGE_STREAM_UNSUPPORTED = 40573
+
+
+def _to_event(collection: str, op: str, doc: dict | None, doc_id) -> dict:
+    event = {"type": EVENT_TYPES[collection], "op": op, "id": str(doc_id)}
+    if doc is None:
+        return event
+
+    if collection == "asteroid_analyses":
+        # `id` is the asteroid; `key` tells apart its successive analyses
+        event["key"] = event["id"]
+        event["id"] = doc.get("neo_reference_id", event["id"])
+        try:
+            event["row"] = flatten_analysis(doc)
+        except (KeyError, AttributeError):
+            pass
+    else:
+        event["id"] = doc.get("asteroid", {}).get("id", event["id"])
+        event["date"] = doc.get("date")
+    return event
+
+
+class Subscription:
+    """Bounded per-client buffer. A client too slow to keep up gets a single
+    `resync` event instead of an ever-growing backlog."""
+
+    def __init__(self, notify: Callable[[dict], None] | None = None, maxsize: int = 1000):
+        self.queue: queue.Queue = queue.Queue(maxsize=maxsize)
+        self.notify = notify
+        self.overflowed = False
+
+    def put(self, event: dict) -> None:
+        if self.notify is not None:
+            self.notify(event)
+            return
+        try:
+            self.queue.put_nowait(event)
+        except queue.Full:
+            if not self.overflowed:
+                self.overflowed = True
+                # Make room for the marker; the client reloads everything anyway
+                try:
+                    self.queue.get_nowait()
+                except queue.Empty:
+                    pass
+                self.queue.put_nowait({"type": "resync", "op": "overflow"})
+
+    def get(self, timeout: float) -> dict:
+        event = self.queue.get(timeout=timeout)
+        if event.get("type") == "resync":
+            self.overflowed = False
+        return event
+
+    @classmethod
+    def for_event_loop(
+        cls, loop: asyncio.AbstractEventLoop, target: asyncio.Queue
+    ) -> "Subscription":
+        """Subscription feeding an asyncio.Queue from the broker thread."""
+
+        def notify(event: dict) -> None:
+            loop.call_soon_threadsafe(_put_async, target, event)
+
+        return cls(notify=notify)
+
+
+def _put_async(target: asyncio.Queue, event: dict) -> None:
+    try:
+        target.put_nowait(event)
+    except asyncio.QueueFull:
+        # Same contract as the sync buffer: drop the backlog, ask for a reload
+        while not target.empty():
+            target.get_nowait()
+        target.put_nowait({"type": "resync", "op": "overflow"})
+
+
+class EventBroker:
+    """Fans out inserts/updates on the watched collections to subscribers.
+
+    Uses a MongoDB change stream when the server supports it (replica set or
+    sharded cluster) and falls back to polling for new `_id`s on a standalone
+    mongod; the fallback only reports inserts. The watcher thread starts with
+    the first subscriber, or with `start` for in-process listeners that need
+    every event, so processes nobody listens to don't watch."""
+
+    def __init__(self, mongo, poll_interval_s: float):
+        self.mongo = mongo
+        self.poll_interval_s = poll_interval_s
+        self.mode = "idle"
+        self._subscribers: set[Subscription] = set()
+        self._listeners: list[Callable[[dict], None]] = []
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+
+    def subscribe(self, subscription: Subscription | None = None) -> Subscription:
+        subscription = subscription or Subscription()
+        with self._lock:
+            self._subscribers.add(subscription)
+            self._start_watcher()
+        return subscription
+
+    def start(self) -> None:
+        """Watch without waiting for a subscriber. Call after any fork."""
+        with self._lock:
+            self._start_watcher()
+
+    def _start_watcher(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, daemon=True, name="event-feed")
+            self._thread.start()
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return len(self._subscribers)
+
+    def add_listener(self, listener: Callable[[dict], None]) -> None:
+        """In-process callback run on every published event. Unlike a
+        subscription it does not start the watcher on its own (see `start`)."""
+        with self._lock:
+            self._listeners.append(listener)
+
+    def publish(self, event: dict) -> None:
+        with self._lock:
+            subscribers = list(self._subscribers)
+            listeners = list(self._listeners)
+        for listener in listeners:
+            listener(event)
+        for subscription in subscribers:
+            subscription.put(event)
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def _run(self) -> None:
+        if not self.mongo.ready.wait(timeout=60):
+            logger.warning("Event feed: MongoDB not ready, falling back to polling")
+        delay = 1.0
+        while not self._stop.is_set():
+            try:
+                if self._watch_change_stream():
+                    return
+                self._poll()
+                return
+            except mongodb.PyMongoError as e:
+                logger.error(f"Event feed interrupted, retrying in {delay:.0f}s: {e}")
+                self._stop.wait(delay)
+                delay = min(delay * 2, 30.0)
+
+    def _watch_change_stream(self) -> bool:
+        """Stream changes until stopped. Returns False if unsupported."""
+        # Raw asteroids only matter when new; their updates are claim bookkeeping
+        pipeline = [{"$match": {"$or": [
+            {"ns.coll": "asteroid_analyses"},
+            {"ns.coll": "asteroids_raw", "operationType": "insert"},
+        ]}}]
+        resume_token = None
+        try:
+            while not self._stop.is_set():
+                with self.mongo.db.watch(
+                    pipeline, resume_after=resume_token, max_await_time_ms=1000
+                ) as stream:
+                    self.mode = "change_stream"
+                    logger.info("Event feed: watching MongoDB change stream")
+                    while not self._stop.is_set() and stream.alive:
+                        change = stream.try_next()
+                        if change is None:
+                            continue
+                        resume_token = stream.resume_token
+                        self.publish(_to_event(
+                            change["ns"]["coll"],
+                            change["operationType"],
+                            change.get("fullDocument"),
+                            change.get("documentKey", {}).get("_id"),
+                        ))
+            return True
+        except NotImplementedError:
+            return False
+        except mongodb.PyMongoError as e:
+            if getattr(e, "code", None) == CHANGE_STREAM_UNSUPPORTED:
+                return False
+            raise
+
+    def _poll(self) -> None:
+        db = self.mongo.db
+        last_ids = {}
+        for name in WATCHED_COLLECTIONS:
+            latest = db[name].find_one({}, {"_id": 1}, sort=[("_id", -1)])
+            last_ids[name] = latest["_id"] if latest else None
+        # Only once the starting point is known: inserts from here on are reported
+        self.mode = "polling"
+        logger.info(
+            f"Event feed: change streams unavailable, polling every {self.poll_interval_s}s"
+        )
+
+        while not self._stop.wait(self.poll_interval_s):
+            for name in WATCHED_COLLECTIONS:
+                query = {"_id": {"$gt": last_ids[name]}} if last_ids[name] is not None else {}
+                for doc in db[name].find(query).sort("_id", 1).limit(1000):
+                    last_ids[name] = doc["_id"]
+                    self.publish(_to_event(name, "insert", doc, doc["_id"]))
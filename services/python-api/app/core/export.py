@@ -0,0 +1,108 @@
+import io
+from typing import IO, Iterable, Iterator
+
+from app.models.analysis_result import flatten_analysis
+
+EXPORT_FORMATS = {
+    # Arrow IPC file format (Feather v2): pyarrow.feather / pandas.read_feather / polars.read_ipc
+    "arrow": {"mimetype": "application/vnd.apache.arrow.file", "extension": "arrow"},
+    "parquet": {"mimetype": "application/vnd.apache.parquet", "extension": "parquet"},
+}
+DEFAULT_EXPORT_BATCH_SIZE = 10_000
+
+# Only what flatten_analysis reads
+ANALYSIS_EXPORT_PROJECTION = {"_id": 0, "neo_reference_id": 1, "risk_data": 1, "analysis_timestamp": 1}
+
+
+def analysis_schema():
+    """Arrow schema of the rows `flatten_analysis` produces."""
+    import pyarrow as pa
+
+    return pa.schema([
+        ("id", pa.string()),
+        ("name", pa.string()),
+        ("risk_level", pa.dictionary(pa.int8(), pa.string())),
+        ("risk_score", pa.float64()),
+        ("energy_mt", pa.float64()),
+        ("distance_km", pa.float64()),
+        ("diameter_km", pa.float64()),
+        ("velocity_kps", pa.float64()),
+        ("hazardous", pa.bool_()),
+        ("analyzed_at", pa.timestamp("ms", tz="UTC")),
+    ])
+
+
+def iter_record_batches(docs: Iterable[dict], batch_size: int = DEFAULT_EXPORT_BATCH_SIZE) -> Iterator:
+    """Record batches of at most `batch_size` rows from analysis documents;
+    only one batch is held in memory at a time."""
+    import pyarrow as pa
+
+    schema = analysis_schema()
+    columns: dict[str, list] = {name: [] for name in schema.names}
+    rows = 0
+    for doc in docs:
+        row = flatten_analysis(doc)
+        for name, column in columns.items():
+            column.append(row[name])
+        rows += 1
+        if rows == batch_size:
+            yield pa.RecordBatch.from_pydict(columns, schema=schema)
+            columns = {name: [] for name in schema.names}
+            rows = 0
+    if rows:
+        yield pa.RecordBatch.from_pydict(columns, schema=schema)
+
+
+def _open_writer(fmt: str, sink, schema):
+    import pyarrow as pa
+
+    if fmt == "parquet":
+        import pyarrow.parquet as pq
+
+        # One row group per record batch
+        return pq.ParquetWriter(sink, schema, compression="zstd")
+    return pa.ipc.new_file(sink, schema)
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only stream whose bytes are handed out in chunks by `drain`."""
+
+    def __init__(self):
+        self._chunks: list[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def stream_export(docs: Iterable[dict], fmt: str, batch_size: int = DEFAULT_EXPORT_BATCH_SIZE) -> Iterator[bytes]:
+    """The export file of `docs` in `fmt`, as chunks produced batch by batch."""
+    import pyarrow as pa
+
+    sink = _ChunkSink()
+    writer = _open_writer(fmt, pa.PythonFile(sink, mode="w"), analysis_schema())
+    for batch in iter_record_batches(docs, batch_size):
+        writer.write_batch(batch)
+        chunk = sink.drain()
+        if chunk:
+            yield chunk
+    writer.close()
+    yield sink.drain()
+
+
+def write_export(docs: Iterable[dict], fmt: str, out: IO[bytes], batch_size: int = DEFAULT_EXPORT_BATCH_SIZE) -> None:
+    for chunk in stream_export(docs, fmt, batch_size):
+        out.write(chunk)
@@ -0,0 +1,146 @@
+import heapq
+import threading
+from datetime import datetime, timezone
+
+from app.core import mongodb
+from app.models.analysis_result import DEFAULT_ANALYSIS_SORT_FIELD, flatten_analysis
+from app.utils.logger import logger
+
+
+def _entry(doc: dict) -> tuple[float, str, dict] | None:
+    """(score, _id, row) of an analysis document; ordered like Mongo's
+    (score, _id) sort since ObjectId hex strings compare like ObjectIds."""
+    try:
+        row = flatten_analysis(doc)
+        return float(row["risk_score"]), str(doc["_id"]), row
+    except (KeyError, TypeError, ValueError, AttributeError):
+        return None
+
+
+class RiskLeaderboard:
+    """The `k` highest-risk analyses, kept in a bounded min-heap.
+
+    Rebuilt from Mongo at startup, then updated as results are written: an
+    offer costs O(log k) and reading the ranking O(k), since the sorted view
+    is kept between writes. Analyses written by other processes arrive
+    through the event feed, watched by every serving process, and in any
+    case through the periodic `verify`, which rebuilds on drift."""
+
+    def __init__(self, mongo, k: int, verify_interval_s: float):
+        self.mongo = mongo
+        self.k = k
+        self.verify_interval_s = verify_interval_s
+        self.loaded_at: datetime | None = None
+        self.last_check: dict | None = None
+        self._heap: list[tuple[float, str, dict]] = []
+        self._ids: set[str] = set()
+        self._ranked: list[dict] = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def loaded(self) -> bool:
+        return self.loaded_at is not None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, daemon=True, name="risk-leaderboard")
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def offer(self, doc: dict) -> bool:
+        """Consider one persisted analysis document. True if it entered the top k."""
+        entry = _entry(doc)
+        return entry is not None and self._offer(entry)
+
+    def offer_event(self, event: dict) -> None:
+        """Event-feed listener: analyses written by other processes."""
+        if event.get("type") != "analysis" or "row" not in event or "key" not in event:
+            return
+        try:
+            self._offer((float(event["row"]["risk_score"]), event["key"], event["row"]))
+        except (TypeError, ValueError):
+            pass
+
+    def _offer(self, entry: tuple[float, str, dict]) -> bool:
+        with self._lock:
+            if not self.loaded or entry[1] in self._ids:
+                # Before the first load, the rebuild picks it up from Mongo
+                return False
+            if len(self._heap) < self.k:
+                heapq.heappush(self._heap, entry)
+            elif entry[:2] > self._heap[0][:2]:
+                evicted = heapq.heapreplace(self._heap, entry)
+                self._ids.discard(evicted[1])
+            else:
+                return False
+            self._ids.add(entry[1])
+            self._rank()
+            return True
+
+    def top(self, limit: int | None = None) -> list[dict]:
+        ranked = self._ranked
+        return ranked[:limit] if limit is not None else list(ranked)
+
+    def _rank(self) -> None:
+        self._ranked = [row for _, _, row in sorted(self._heap, key=lambda e: e[:2], reverse=True)]
+
+    def _query_mongo(self) -> list[tuple[float, str, dict]]:
+        if self.mongo.db is None:
+            raise RuntimeError("Database not initialized")
+        cursor = (
+            self.mongo.db["asteroid_analyses"]
+            .find({})
+            .sort([(DEFAULT_ANALYSIS_SORT_FIELD, -1), ("_id", -1)])
+            .limit(self.k)
+        )
+        return [entry for entry in map(_entry, cursor) if entry is not None]
+
+    def rebuild(self) -> None:
+        entries = self._query_mongo()
+        with self._lock:
+            self._heap = entries
+            heapq.heapify(self._heap)
+            self._ids = {entry[1] for entry in entries}
+            self._rank()
+            self.loaded_at = datetime.now(timezone.utc)
+        logger.info(f"Risk leaderboard rebuilt with {len(entries)} entries")
+
+    def verify(self, repair: bool = True) -> dict:
+        """Compare the ranking with Mongo's top k; with `repair`, rebuild on mismatch."""
+        expected = [entry[1] for entry in self._query_mongo()]
+        with self._lock:
+            actual = [entry[1] for entry in sorted(self._heap, key=lambda e: e[:2], reverse=True)]
+        check = {
+            "consistent": expected == actual,
+            "checked_at": datetime.now(timezone.utc).isoformat(),
+            "size": len(actual),
+            "missing": sorted(set(expected) - set(actual)),
+            "unexpected": sorted(set(actual) - set(expected)),
+            "repaired": False,
+        }
+        if not check["consistent"] and repair:
+            logger.warning(
+                f"Risk leaderboard drifted from MongoDB ({len(check['missing'])} missing), rebuilding"
+            )
+            self.rebuild()
+            check["repaired"] = True
+        self.last_check = check
+        return check
+
+    def _run(self) -> None:
+        if not self.mongo.ready.wait(timeout=60):
+            logger.warning("Risk leaderboard: MongoDB not ready, first load may fail")
+
+        while not self._stop.is_set():
+            try:
+                if self.loaded:
+                    self.verify()
+                else:
+                    self.rebuild()
+            except (mongodb.PyMongoError, RuntimeError) as e:
+                logger.error(f"Risk leaderboard refresh failed: {e}")
+            if self._stop.wait(self.verify_interval_s):
+                return
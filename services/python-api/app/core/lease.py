@@ -0,0 +1,118 @@
+import os
+import socket
+import threading
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Iterator
+
+from app.core import mongodb
+from app.utils.logger import logger
+
+LOCKS_COLLECTION = "locks"
+
+
+class LeaseHeldError(Exception):
+    """Raised when another process holds the lease (or already ran the slot)."""
+
+    def __init__(self, name: str, holder: dict | None):
+        self.name = name
+        self.holder = holder
+        owner = holder["owner"] if holder else "another process"
+        super().__init__(f"Lease '{name}' is held by {owner}")
+
+
+def owner_id() -> str:
+    """Unique id of this process (host:pid:random), used to tag leases and claims."""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+class MongoLease:
+    """Named lease in the `locks` collection, held by one process at a time.
+
+    It expires `ttl_s` after the last renewal, so a crashed holder blocks
+    others for at most one TTL. `hold()` renews it in a background thread
+    for as long as the block runs."""
+
+    def __init__(self, mongo, name: str, ttl_s: float):
+        self.mongo = mongo
+        self.name = name
+        self.ttl_s = ttl_s
+        self.owner = owner_id()
+
+    def _collection(self):
+        if self.mongo.db is None:
+            raise RuntimeError("Database not initialized")
+        return self.mongo.db[LOCKS_COLLECTION]
+
+    def acquire(self, slot: datetime | None = None) -> bool:
+        """Take the lease if it is free or expired.
+
+        With `slot`, the lease is only granted if no holder ran that slot
+        yet, so processes sharing a schedule run each slot once."""
+        from pymongo.errors import DuplicateKeyError
+
+        now = datetime.now(timezone.utc)
+        query = {"_id": self.name, "expires_at": {"$not": {"$gt": now}}}
+        fields = {
+            "owner": self.owner,
+            "acquired_at": now,
+            "expires_at": now + timedelta(seconds=self.ttl_s),
+        }
+        if slot is not None:
+            query["last_slot"] = {"$not": {"$gte": slot}}
+            fields["last_slot"] = slot
+
+        try:
+            # No match while someone holds it: the upsert then collides on _id
+            self._collection().update_one(query, {"$set": fields}, upsert=True)
+            return True
+        except DuplicateKeyError:
+            return False
+
+    def renew(self) -> bool:
+        expires_at = datetime.now(timezone.utc) + timedelta(seconds=self.ttl_s)
+        result = self._collection().update_one(
+            {"_id": self.name, "owner": self.owner}, {"$set": {"expires_at": expires_at}}
+        )
+        return result.matched_count == 1
+
+    def release(self) -> None:
+        # Expire rather than delete, so last_slot survives
+        self._collection().update_one(
+            {"_id": self.name, "owner": self.owner},
+            {"$set": {"expires_at": datetime.now(timezone.utc)}},
+        )
+
+    def holder(self) -> dict | None:
+        """Current holder (owner, acquired_at, expires_at), if any."""
+        return self._collection().find_one(
+            {"_id": self.name, "expires_at": {"$gt": datetime.now(timezone.utc)}},
+            {"_id": 0, "owner": 1, "acquired_at": 1, "expires_at": 1},
+        )
+
+    @contextmanager
+    def hold(self, slot: datetime | None = None) -> Iterator["MongoLease"]:
+        if not self.acquire(slot):
+            raise LeaseHeldError(self.name, self.holder())
+
+        stop = threading.Event()
+        keeper = threading.Thread(
+            target=self._keep_alive, args=(stop,), daemon=True, name=f"lease-{self.name}"
+        )
+        keeper.start()
+        try:
+            yield self
+        finally:
+            stop.set()
+            keeper.join()
+            self.release()
+
+    def _keep_alive(self, stop: threading.Event) -> None:
+        while not stop.wait(self.ttl_s / 3):
+            try:
+                if not self.renew():
+                    logger.warning(f"Lease '{self.name}' was lost before the work finished")
+                    return
+            except mongodb.PyMongoError as e:
+                logger.error(f"Failed to renew lease '{self.name}': {e}")
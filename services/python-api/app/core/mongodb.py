@@ -1,37 +1,161 @@
-from pymongo import MongoClient
-from pymongo.database import Database
-from pymongo.errors import PyMongoError
-from flask import current_app
-from datetime import datetime, timezone
+import threading
+import time
+import zlib
+from datetime import date, datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Callable
 
+from app.core.dto_mapper import normalize_nasa_raw
+from app.models.analysis_result import (
+    ANALYSIS_SORT_FIELDS,
+    DEFAULT_ANALYSIS_SORT_FIELD,
+    flatten_analysis,
+    start_of_today_utc,
+)
+from app.models.close_approach import explode_close_approaches
+from app.models.risk_rollup import (
+    rollup_rebuild_pipeline,
+    rollup_update,
+    stats_from_rollups,
+    stats_rollup_filter,
+)
 from app.utils.logger import logger
 
+if TYPE_CHECKING:
+    from pymongo import MongoClient
+    from pymongo.database import Database
+
+
+class _DriverNotLoaded(Exception):
+    """Stand-in until pymongo is imported; nothing can raise its errors before."""
+
+
+# pymongo costs ~90ms to import, so it is loaded on first connect()
+PyMongoError: type[Exception] = _DriverNotLoaded
+
+
+def load_driver():
+    """Import pymongo and return MongoClient. Pre-fork servers call this in
+    the master so workers share the loaded modules."""
+    global PyMongoError
+    from pymongo import MongoClient
+    from pymongo.errors import PyMongoError as _PyMongoError
+
+    PyMongoError = _PyMongoError
+    return MongoClient
+
+
+# Raw asteroids are spread over fixed buckets; a worker owns the buckets
+# congruent to its partition, so any partition count up to this splits evenly
+PROCESSING_BUCKETS = 1024
+
+
+def processing_bucket(asteroid_id: str) -> int:
+    return zlib.crc32(asteroid_id.encode()) % PROCESSING_BUCKETS
+
+
+def new_processing_state(asteroid_id: str, invalid_reason: str | None = None) -> dict:
+    """`processing` sub-document of a raw asteroid that awaits analysis, or
+    that failed validation at ingest (never claimed).
+
+    state: pending -> claimed (owner, claimed_until) -> done | failed (reason)"""
+    processing = {"state": "pending", "bucket": processing_bucket(asteroid_id), "attempts": 0}
+    if invalid_reason is not None:
+        processing.update(
+            state="failed", reason=invalid_reason, finished_at=datetime.now(timezone.utc)
+        )
+    return processing
+
+
+# Raw asteroids not analyzed yet: waiting, or claimed by a running batch
+BACKLOG_FILTER = {"processing.state": {"$in": ["pending", "claimed"]}}
+
+
+def mark_analyzed_update(raw_id) -> tuple[dict, dict]:
+    """Filter and update marking a raw asteroid done outside a claim
+    (single-asteroid analysis); shared with the async clients."""
+    return (
+        {"_id": raw_id, "processing.state": {"$in": ["pending", "failed"]}},
+        {"$set": {
+            "processing.state": "done",
+            "processing.finished_at": datetime.now(timezone.utc),
+        }},
+    )
+
+
+# What the pipeline reads of a claimed raw asteroid: never the NASA payload
+CLAIM_PROJECTION = {"normalized": 1, "processing": 1}
+
 
 class MongoDBClient:
-    def __init__(self, uri: str, db_name: str):
+    def __init__(self, uri: str, db_name: str, max_pool_size: int = 100):
         self.uri = uri
         self.db_name = db_name
+        self.max_pool_size = max_pool_size
 
-        self.client: MongoClient | None = None
-        self.db: Database | None = None
+        self.client: "MongoClient | None" = None
+        self.db: "Database | None" = None
+
+        # Set once collections and indexes exist
+        self.ready = threading.Event()
+        self._analysis_listeners: list[Callable[[dict], None]] = []
         
     # Flask
-    def init_app(self, app):
-        try:
-            self.client = MongoClient(self.uri, serverSelectionTimeoutMS=3000)
-            self.db = self.client[self.db_name]
+    def init_app(self, app, connect: bool = True):
+        """Register on the app; with `connect=False` the caller connects later
+        (pre-fork servers must open one MongoClient per worker process)."""
+        if connect:
+            self.connect()
 
-            logger.info(f"Connected to MongoDB at {self.uri}, using DB '{self.db_name}'")
+        if not hasattr(app, 'extensions'):
+            app.extensions = {}
+        app.extensions["mongo"] = self
 
-            self._ensure_collections()
+    def connect(self, background: bool = True):
+        """Create the client (no network I/O) and prepare collections and
+        indexes, in a background thread unless `background=False`."""
+        MongoClient = load_driver()
 
-            if not hasattr(app, 'extensions'):
-                app.extensions = {}
-            app.extensions["mongo"] = self
+        self.client = MongoClient(
+            self.uri,
+            serverSelectionTimeoutMS=3000,
+            maxPoolSize=self.max_pool_size,
+        )
+        self.db = self.client[self.db_name]
 
-        except PyMongoError as e:
-            logger.critical(f"Failed to initialize MongoDB: {e}")
-            raise
+        logger.info(
+            f"MongoDB client created for {self.uri}, using DB '{self.db_name}' "
+            f"(maxPoolSize={self.max_pool_size})"
+        )
+
+        if not background:
+            try:
+                self._ensure_collections()
+            except PyMongoError as e:
+                logger.critical(f"Failed to initialize MongoDB: {e}")
+                raise
+            return
+
+        threading.Thread(
+            target=self._ensure_collections_with_retry, daemon=True, name="mongo-indexes"
+        ).start()
+
+    def _ensure_collections_with_retry(self):
+        delay = 1.0
+        while not self.ready.is_set():
+            try:
+                self._ensure_collections()
+            except PyMongoError as e:
+                logger.critical(f"Failed to initialize MongoDB, retrying in {delay:.0f}s: {e}")
+                time.sleep(delay)
+                delay = min(delay * 2, 30.0)
+
+    def is_ready(self) -> bool:
+        return self.ready.is_set()
+
+    def ping(self) -> None:
+        if self.client is None:
+            raise RuntimeError("Database not initialized")
+        self.client.admin.command("ping")
         
     # DB
     def _ensure_collections(self):
@@ -42,6 +166,9 @@ class MongoDBClient:
             "nasa_feeds": self._init_nasa_feeds,
             "asteroid_analyses": self._init_asteroid_analyses,
             "asteroids_raw": self._init_asteroids_raw,
+            "close_approaches": self._init_close_approaches,
+            "risk_rollups": self._init_risk_rollups,
+            "apod_entries": self._init_apod_entries,
         }
 
         existing = self.db.list_collection_names()
@@ -52,6 +179,14 @@ class MongoDBClient:
                 logger.info(f"Created MongoDB collection '{name}'")
             initializer()
 
+        self._backfill_processing_state()
+        if "close_approaches" not in existing:
+            self._backfill_close_approaches()
+        if "risk_rollups" not in existing and self.db["asteroid_analyses"].estimated_document_count():
+            self.rebuild_risk_rollups()
+        self.ready.set()
+        logger.info(f"MongoDB collections and indexes ready in '{self.db_name}'")
+
     def _init_nasa_feeds(self):
         if self.db is None:
             raise RuntimeError("Database not initialized")
@@ -69,6 +204,9 @@ class MongoDBClient:
         collection = self.db["asteroid_analyses"]
         collection.create_index("neo_reference_id")
         collection.create_index("analysis_timestamp")
+        for field in sorted(set(ANALYSIS_SORT_FIELDS.values())):
+            # With _id as tiebreak, serves paginated listings in either direction
+            collection.create_index([(field, -1), ("_id", -1)])
         logger.debug("Initialized indexes for 'asteroid_analyses'")
 
     def _init_asteroids_raw(self):
@@ -79,8 +217,92 @@ class MongoDBClient:
         collection.create_index("date")
         collection.create_index("asteroid.id")
         collection.create_index("stored_at")
+        # Claims filter on state and bucket; expired claims on claimed_until
+        collection.create_index([("processing.state", 1), ("processing.bucket", 1)])
+        collection.create_index([("processing.state", 1), ("processing.claimed_until", 1)])
         logger.debug("Initialized indexes for 'asteroids_raw'")
 
+    def _init_close_approaches(self):
+        if self.db is None:
+            raise RuntimeError("Database not initialized")
+
+        collection = self.db["close_approaches"]
+        # Window queries range over the date, threshold queries over the
+        # distance; the planner picks whichever bound is more selective
+        collection.create_index(
+            [("orbiting_body", 1), ("approach_at", 1), ("miss_distance_km", 1)]
+        )
+        collection.create_index(
+            [("orbiting_body", 1), ("miss_distance_km", 1), ("approach_at", 1)]
+        )
+        collection.create_index([("neo_id", 1), ("approach_at", 1)])
+        logger.debug("Initialized indexes for 'close_approaches'")
+
+    def _init_risk_rollups(self):
+        if self.db is None:
+            raise RuntimeError("Database not initialized")
+
+        # _id is "<day>:<level>"; histograms select by day range and level
+        self.db["risk_rollups"].create_index([("day", 1), ("level", 1)])
+        logger.debug("Initialized indexes for 'risk_rollups'")
+
+    def _init_apod_entries(self):
+        if self.db is None:
+            raise RuntimeError("Database not initialized")
+
+        # _id is the APOD date; only entries fetched as "latest" carry latest_at
+        self.db["apod_entries"].create_index("latest_at", sparse=True)
+        logger.debug("Initialized indexes for 'apod_entries'")
+
+    def _backfill_close_approaches(self):
+        """Explode the approaches of raw asteroids stored before the collection existed."""
+        from pymongo import ReplaceOne
+
+        documents = 0
+        batch = []
+        for doc in self.db["asteroids_raw"].find({}, {"asteroid": 1}):
+            for approach in explode_close_approaches(doc.get("asteroid", {})):
+                batch.append(ReplaceOne({"_id": approach["_id"]}, approach, upsert=True))
+            if len(batch) >= 1000:
+                self.db["close_approaches"].bulk_write(batch, ordered=False)
+                documents += len(batch)
+                batch = []
+        if batch:
+            self.db["close_approaches"].bulk_write(batch, ordered=False)
+            documents += len(batch)
+        if documents:
+            logger.info(f"Backfilled {documents} close approaches from raw asteroids")
+
+    def _backfill_processing_state(self):
+        """Give raw asteroids stored before claim tracking a `processing` state."""
+        from pymongo import UpdateOne
+
+        collection = self.db["asteroids_raw"]
+        # Null also matches a missing field, and unlike $exists can use the index
+        legacy = collection.find({"processing.state": None}, {"asteroid.id": 1})
+        analyzed: set[str] | None = None
+        updates = []
+        backfilled = 0
+        for doc in legacy:
+            if analyzed is None:
+                analyzed = set(self.db["asteroid_analyses"].distinct("neo_reference_id"))
+            asteroid_id = str(doc.get("asteroid", {}).get("id", ""))
+            processing = new_processing_state(asteroid_id)
+            if asteroid_id in analyzed:
+                processing["state"] = "done"
+            updates.append(UpdateOne(
+                {"_id": doc["_id"], "processing.state": None},
+                {"$set": {"processing": processing}},
+            ))
+            backfilled += 1
+            if len(updates) == 1000:
+                collection.bulk_write(updates, ordered=False)
+                updates = []
+        if updates:
+            collection.bulk_write(updates, ordered=False)
+        if backfilled:
+            logger.info(f"Backfilled processing state for {backfilled} raw asteroids")
+
     # CRUD
     def save_nasa_feed(self, feed: dict):
         if self.db is None:
@@ -99,20 +321,50 @@ class MongoDBClient:
         if self.db is None:
             raise RuntimeError("Database not initialized. Call init_app() first.")
 
+        normalized, invalid_reason = normalize_nasa_raw(asteroid)
+        if invalid_reason is not None:
+            logger.warning(
+                f"Raw asteroid {asteroid.get('id', 'unknown')} failed validation: {invalid_reason}"
+            )
+
         try:
             collection = self.db["asteroids_raw"]
             document = {
                 "date": date,
                 "asteroid": asteroid,
                 "stored_at": datetime.now(timezone.utc),
+                "processing": new_processing_state(str(asteroid.get("id", "")), invalid_reason),
             }
+            if normalized is not None:
+                document["normalized"] = normalized
             result = collection.insert_one(document)
+            self.save_close_approaches(asteroid)
             logger.info(f"Inserted raw asteroid for {date} with id {result.inserted_id}")
             return result.inserted_id
         except PyMongoError as e:
             logger.error(f"Failed to save raw asteroid: {e}")
             raise
 
+    def save_close_approaches(self, asteroid: dict) -> int:
+        """Upsert one `close_approaches` document per approach of a NASA NEO."""
+        if self.db is None:
+            raise RuntimeError("Database not initialized")
+
+        from pymongo import ReplaceOne
+
+        approaches = explode_close_approaches(asteroid)
+        if not approaches:
+            return 0
+        try:
+            self.db["close_approaches"].bulk_write(
+                [ReplaceOne({"_id": a["_id"]}, a, upsert=True) for a in approaches],
+                ordered=False,
+            )
+            return len(approaches)
+        except PyMongoError as e:
+            logger.error(f"Failed to save close approaches: {e}")
+            raise
+
     def count_raw_asteroids(self) -> int:
         """Return the total number of raw asteroids stored in the DB."""
         if self.db is None:
@@ -146,57 +398,356 @@ class MongoDBClient:
             logger.error(f"Failed to fetch asteroid {asteroid_id}: {e}")
             raise
 
-    def get_unprocessed_asteroids(self, limit: int = 100) -> list[dict]:
+    def get_orbital_data(self, asteroid_ids: list[str]) -> dict[str, dict]:
+        """`orbital_data` stored on raw asteroids, by asteroid id."""
         if self.db is None:
             raise RuntimeError("Database not initialized")
 
         try:
-            collection = self.db["asteroids_raw"]
-            analyses_collection = self.db["asteroid_analyses"]
-            
-            analyzed_ids = set(
-                doc["neo_reference_id"] 
-                for doc in analyses_collection.find({}, {"neo_reference_id": 1})
+            cursor = self.db["asteroids_raw"].find(
+                {"asteroid.id": {"$in": asteroid_ids}, "asteroid.orbital_data": {"$exists": True}},
+                {"_id": 0, "asteroid.id": 1, "asteroid.orbital_data": 1},
             )
-            
-            unprocessed = []
-            cursor = collection.find({})
-            
-            for doc in cursor:
-                asteroid_data = doc.get("asteroid", {})
-                asteroid_id = asteroid_data.get("id")
-                
-                if asteroid_id and asteroid_id not in analyzed_ids:
-                    unprocessed.append(doc)
-                    
-                if len(unprocessed) >= limit:
+            return {doc["asteroid"]["id"]: doc["asteroid"]["orbital_data"] for doc in cursor}
+        except PyMongoError as e:
+            logger.error(f"Failed to fetch orbital data: {e}")
+            raise
+
+    def save_orbital_data(self, asteroid_id: str, orbital_data: dict) -> None:
+        """Keep elements fetched from a NASA lookup on the raw asteroid."""
+        if self.db is None:
+            raise RuntimeError("Database not initialized")
+
+        try:
+            self.db["asteroids_raw"].update_many(
+                {"asteroid.id": asteroid_id}, {"$set": {"asteroid.orbital_data": orbital_data}}
+            )
+        except PyMongoError as e:
+            logger.error(f"Failed to save orbital data for {asteroid_id}: {e}")
+            raise
+
+    def estimate_backlog(self) -> int:
+        """Number of raw asteroids waiting for analysis."""
+        if self.db is None:
+            raise RuntimeError("Database not initialized")
+
+        return self.db["asteroids_raw"].count_documents({"processing.state": "pending"})
+
+    def count_processing_states(self) -> dict[str, int]:
+        """Raw asteroids per processing state (pending, claimed, done, failed)."""
+        if self.db is None:
+            raise RuntimeError("Database not initialized")
+
+        counts = {"pending": 0, "claimed": 0, "done": 0, "failed": 0}
+        for row in self.db["asteroids_raw"].aggregate(
+            [{"$group": {"_id": "$processing.state", "count": {"$sum": 1}}}]
+        ):
+            if row["_id"] in counts:
+                counts[row["_id"]] = row["count"]
+        return counts
+
+    def claim_unprocessed(
+        self,
+        owner: str,
+        limit: int,
+        ttl_s: float,
+        partition: int | None = None,
+        partitions: int = 1,
+        max_attempts: int | None = None,
+    ) -> list[dict]:
+        """Atomically claim up to `limit` pending raw asteroids for `owner`.
+
+        Claims expire `ttl_s` after the last renewal, so asteroids held by a
+        crashed worker become claimable again. With `partition`, only buckets
+        congruent to it modulo `partitions` are considered. Asteroids claimed
+        more than `max_attempts` times are marked failed instead."""
+        from pymongo import ReturnDocument
+
+        if self.db is None:
+            raise RuntimeError("Database not initialized")
+
+        collection = self.db["asteroids_raw"]
+        # Explicit bucket list rather than $mod, so the index bounds the scan
+        buckets = (
+            list(range(partition, PROCESSING_BUCKETS, partitions)) if partition is not None else None
+        )
+        claimed: list[dict] = []
+        try:
+            while len(claimed) < limit:
+                now = datetime.now(timezone.utc)
+                query = {
+                    "$or": [
+                        {"processing.state": "pending"},
+                        {
+                            "processing.state": "claimed",
+                            "processing.claimed_until": {"$lte": now},
+                            "processing.owner": {"$ne": owner},
+                        },
+                    ]
+                }
+                if buckets is not None:
+                    query["processing.bucket"] = {"$in": buckets}
+
+                doc = collection.find_one_and_update(
+                    query,
+                    {
+                        "$set": {
+                            "processing.state": "claimed",
+                            "processing.owner": owner,
+                            "processing.claimed_until": now + timedelta(seconds=ttl_s),
+                        },
+                        "$inc": {"processing.attempts": 1},
+                    },
+                    projection=CLAIM_PROJECTION,
+                    return_document=ReturnDocument.AFTER,
+                )
+                if doc is None:
                     break
-            
-            logger.info(f"Found {len(unprocessed)} unprocessed asteroids")
-            return unprocessed
+
+                if max_attempts is not None and doc["processing"]["attempts"] > max_attempts:
+                    logger.warning(
+                        f"Raw asteroid {doc.get('normalized', {}).get('id', doc['_id'])} "
+                        f"failed {max_attempts} attempts, giving up"
+                    )
+                    self.finish_claim(doc["_id"], owner, "failed", reason="max_attempts")
+                    continue
+
+                claimed.append(doc)
+
+            logger.info(f"Claimed {len(claimed)} unprocessed asteroids for {owner}")
+            return claimed
 
         except PyMongoError as e:
-            logger.error(f"Failed to fetch unprocessed asteroids: {e}")
+            logger.error(f"Failed to claim unprocessed asteroids: {e}")
             raise
 
+    def normalize_raw_asteroid(self, raw_id) -> tuple[dict | None, str | None]:
+        """Compute and store `normalized` for a raw asteroid stored without it
+        (before normalize-at-ingest); returns (normalized, invalid reason)."""
+        if self.db is None:
+            raise RuntimeError("Database not initialized")
+
+        collection = self.db["asteroids_raw"]
+        doc = collection.find_one({"_id": raw_id}, {"asteroid": 1})
+        if doc is None or not doc.get("asteroid"):
+            return None, "missing_asteroid"
+        normalized, invalid_reason = normalize_nasa_raw(doc["asteroid"])
+        if normalized is not None:
+            collection.update_one({"_id": raw_id}, {"$set": {"normalized": normalized}})
+        return normalized, invalid_reason
+
+    def renew_claims(self, owner: str, ttl_s: float) -> int:
+        """Extend every claim held by `owner`; returns how many it holds."""
+        if self.db is None:
+            raise RuntimeError("Database not initialized")
+
+        result = self.db["asteroids_raw"].update_many(
+            {"processing.state": "claimed", "processing.owner": owner},
+            {"$set": {
+                "processing.claimed_until": datetime.now(timezone.utc) + timedelta(seconds=ttl_s)
+            }},
+        )
+        return result.matched_count
+
+    def finish_claim(self, raw_id, owner: str, state: str, reason: str | None = None) -> bool:
+        """Mark a claimed raw asteroid done or failed. False if the claim was
+        lost (expired and taken by another worker) meanwhile."""
+        if self.db is None:
+            raise RuntimeError("Database not initialized")
+
+        fields = {"processing.state": state, "processing.finished_at": datetime.now(timezone.utc)}
+        if reason is not None:
+            fields["processing.reason"] = reason
+        result = self.db["asteroids_raw"].update_one(
+            {"_id": raw_id, "processing.state": "claimed", "processing.owner": owner},
+            {"$set": fields, "$unset": {"processing.claimed_until": ""}},
+        )
+        return result.matched_count == 1
+
+    def release_claim(self, raw_id, owner: str, count_attempt: bool = True) -> bool:
+        """Put a claimed raw asteroid back to pending. Without `count_attempt`
+        (work deferred, not tried) its attempt counter is restored."""
+        if self.db is None:
+            raise RuntimeError("Database not initialized")
+
+        update = {
+            "$set": {"processing.state": "pending"},
+            "$unset": {"processing.owner": "", "processing.claimed_until": ""},
+        }
+        if not count_attempt:
+            update["$inc"] = {"processing.attempts": -1}
+        result = self.db["asteroids_raw"].update_one(
+            {"_id": raw_id, "processing.state": "claimed", "processing.owner": owner}, update
+        )
+        return result.matched_count == 1
+
+    def mark_analyzed(self, raw_id) -> None:
+        """Mark a raw asteroid done outside a claim (single-asteroid analysis)."""
+        if self.db is None:
+            raise RuntimeError("Database not initialized")
+
+        self.db["asteroids_raw"].update_one(*mark_analyzed_update(raw_id))
+
+    @staticmethod
+    def build_analysis_document(asteroid_id: str, risk_result: dict) -> dict:
+        return {
+            "neo_reference_id": asteroid_id,
+            "analysis_timestamp": datetime.now(timezone.utc),
+            "risk_data": risk_result,
+        }
+
+    def add_analysis_listener(self, listener: Callable[[dict], None]) -> None:
+        """Called with every analysis document this client inserts (with _id)."""
+        self._analysis_listeners.append(listener)
+
     def save_analysis_result(self, asteroid_id: str, risk_result: dict) -> str:
         if self.db is None:
             raise RuntimeError("Database not initialized")
 
         try:
             collection = self.db["asteroid_analyses"]
-            document = {
-                "neo_reference_id": asteroid_id,
-                "analysis_timestamp": datetime.now(timezone.utc),
-                "risk_data": risk_result,
-            }
+            document = self.build_analysis_document(asteroid_id, risk_result)
             result = collection.insert_one(document)
+            rollup_filter, rollup = rollup_update(document)
+            self.db["risk_rollups"].update_one(rollup_filter, rollup, upsert=True)
             logger.info(f"Saved analysis for asteroid {asteroid_id}")
-            return str(result.inserted_id)
         except PyMongoError as e:
             logger.error(f"Failed to save analysis result: {e}")
             raise
 
+        for listener in self._analysis_listeners:
+            listener(document)
+        return str(result.inserted_id)
+
+    def get_pipeline_stats(self) -> dict:
+        if self.db is None:
+            raise RuntimeError("Database not initialized")
+
+        raw_collection = self.db["asteroids_raw"]
+        analysis_collection = self.db["asteroid_analyses"]
+
+        unprocessed_count = raw_collection.count_documents(BACKLOG_FILTER)
+
+        # Day x level rollups instead of counting analyses
+        today = start_of_today_utc().strftime("%Y-%m-%d")
+        analyzed_today, high_risk_count = stats_from_rollups(
+            self.db["risk_rollups"].find(stats_rollup_filter(today), {"day": 1, "level": 1, "count": 1}),
+            today,
+        )
+
+        last_run = analysis_collection.find_one(
+            sort=[("analysis_timestamp", -1)]
+        )
+
+        return {
+            "status": "ok",
+            "unprocessed": unprocessed_count,
+            "analyzed_today": analyzed_today,
+            "high_risks": high_risk_count,
+            "last_pipeline_run": (
+                last_run["analysis_timestamp"].isoformat()
+                if last_run else None
+            ),
+        }
+
+    def rebuild_risk_rollups(self, start: date | None = None, end: date | None = None) -> int:
+        """Recompute the rollups of days [start, end] (default: all) from
+        `asteroid_analyses` with a $merge aggregation. Returns the number of
+        rollups in that range.
+
+        The range is cleared first, so day x level rollups whose analyses were
+        deleted or archived go away. Histograms over the range read low until
+        the merge completes, and analyses saved while it runs may be counted
+        twice or not at all until the next rebuild."""
+        if self.db is None:
+            raise RuntimeError("Database not initialized")
+
+        match: dict = {}
+        day_range: dict = {}
+        if start is not None:
+            match["$gte"] = datetime(start.year, start.month, start.day, tzinfo=timezone.utc)
+            day_range["$gte"] = start.isoformat()
+        if end is not None:
+            match["$lt"] = datetime(end.year, end.month, end.day, tzinfo=timezone.utc) + timedelta(days=1)
+            day_range["$lte"] = end.isoformat()
+
+        try:
+            started = time.monotonic()
+            self.db["risk_rollups"].delete_many({"day": day_range} if day_range else {})
+            self.db["asteroid_analyses"].aggregate(
+                rollup_rebuild_pipeline({"analysis_timestamp": match} if match else {})
+            )
+            rollups = self.db["risk_rollups"].count_documents({"day": day_range} if day_range else {})
+            logger.info(f"Rebuilt {rollups} risk rollups in {time.monotonic() - started:.2f}s")
+            return rollups
+        except PyMongoError as e:
+            logger.error(f"Failed to rebuild risk rollups: {e}")
+            raise
+
+    def get_risk_rollups(self, start: date, end: date, levels: list[str] | None = None) -> list[dict]:
+        if self.db is None:
+            raise RuntimeError("Database not initialized")
+
+        query: dict = {"day": {"$gte": start.isoformat(), "$lte": end.isoformat()}}
+        if levels:
+            query["level"] = {"$in": levels}
+        return list(self.db["risk_rollups"].find(query, {"_id": 0}))
+
+    def get_apod_entries(self, dates: list[str]) -> dict[str, dict]:
+        """Cached APOD documents ({entry, final, fetched_at}) by date."""
+        if self.db is None:
+            raise RuntimeError("Database not initialized")
+        return {doc["_id"]: doc for doc in self.db["apod_entries"].find({"_id": {"$in": dates}})}
+
+    def get_latest_apod(self, max_age_s: float) -> dict | None:
+        """The entry last fetched as NASA's current APOD, if younger than `max_age_s`."""
+        if self.db is None:
+            raise RuntimeError("Database not initialized")
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=max_age_s)
+        return self.db["apod_entries"].find_one({"latest_at": {"$gte": cutoff}}, sort=[("latest_at", -1)])
+
+    def save_apod_entries(self, entries: dict[str, dict | None], final: dict[str, bool], latest: bool = False) -> None:
+        """Cache APOD entries by date; None records a date without an APOD."""
+        if self.db is None:
+            raise RuntimeError("Database not initialized")
+
+        if not entries:
+            return
+
+        from pymongo import UpdateOne
+
+        now = datetime.now(timezone.utc)
+        fields = {"fetched_at": now}
+        if latest:
+            fields["latest_at"] = now
+        try:
+            self.db["apod_entries"].bulk_write(
+                [
+                    UpdateOne(
+                        {"_id": day},
+                        {"$set": {"entry": entry, "final": final[day], **fields}},
+                        upsert=True,
+                    )
+                    for day, entry in entries.items()
+                ],
+                ordered=False,
+            )
+        except PyMongoError as e:
+            logger.error(f"Failed to cache APOD entries: {e}")
+            raise
+
+    def get_top_risks(self, limit: int = 10) -> list[dict]:
+        if self.db is None:
+            raise RuntimeError("Database not initialized")
+
+        cursor = (
+            self.db["asteroid_analyses"]
+            .find({}, {"_id": 0})
+            .sort(DEFAULT_ANALYSIS_SORT_FIELD, -1)
+            .limit(limit)
+        )
+        return [flatten_analysis(doc) for doc in cursor]
+
     def close(self):
         if self.client:
             self.client.close()
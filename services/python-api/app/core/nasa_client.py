@@ -2,12 +2,22 @@ import requests
 from typing import Optional, Dict, Any
 from datetime import date, timedelta
 
-from app.core.config import NASA_API_KEY, NASA_BASE_URL, NASA_APOD_ENDPOINT, NASA_NEO_FEED_ENDPOINT, REQUEST_TIMEOUT
+from app.core.config import (
+    NASA_API_KEY,
+    NASA_BASE_URL,
+    NASA_APOD_ENDPOINT,
+    NASA_NEO_FEED_ENDPOINT,
+    NASA_NEO_LOOKUP_ENDPOINT,
+    REQUEST_TIMEOUT,
+)
 
 from app.utils.logger import logger
 
 
 def _build_nasa_url(endpoint: str, params: Optional[Dict[str, str]] = None) -> tuple[str, Dict[str, str]]:
+    if not NASA_API_KEY:
+        raise ValueError("NASA_API_KEY is not set in environment variables.")
+
     final_params = {"api_key": NASA_API_KEY}
     if params:
         final_params.update({k: str(v) for k, v in params.items()})
@@ -31,7 +41,33 @@ def get_apod(date_str: Optional[str] = None) -> Dict[str, Any]:
     return response.json()
 
 
-def get_neo_feed(start_date: Optional[str] = None, end_date: Optional[str] = None) -> Dict[str, Any]:
+def get_apod_range(start_date: str, end_date: str) -> list[Dict[str, Any]]:
+    """APOD entries for every date in [start_date, end_date], one request."""
+    url, query = _build_nasa_url(NASA_APOD_ENDPOINT, {"start_date": start_date, "end_date": end_date})
+
+    logger.info(f"Calling NASA APOD range: {url} params={query}")
+
+    response = requests.get(url, params=query, timeout=REQUEST_TIMEOUT)
+    response.raise_for_status()
+
+    return response.json()
+
+
+def download_media(url: str, max_bytes: int) -> bytes:
+    """Body of an APOD image URL (no API key), refused past `max_bytes`."""
+    with requests.get(url, timeout=REQUEST_TIMEOUT, stream=True) as response:
+        response.raise_for_status()
+        chunks = []
+        size = 0
+        for chunk in response.iter_content(chunk_size=64 * 1024):
+            size += len(chunk)
+            if size > max_bytes:
+                raise ValueError(f"{url} exceeds {max_bytes} bytes")
+            chunks.append(chunk)
+    return b"".join(chunks)
+
+
+def _neo_feed_params(start_date: Optional[str] = None, end_date: Optional[str] = None) -> Dict[str, str]:
     if start_date is None:
         start_date = date.today().strftime("%Y-%m-%d")
 
@@ -39,11 +75,15 @@ def get_neo_feed(start_date: Optional[str] = None, end_date: Optional[str] = Non
         end_date_date = date.fromisoformat(start_date) + timedelta(days=7)
         end_date = end_date_date.strftime("%Y-%m-%d")
 
-    params = {
+    return {
         "start_date": start_date,
         "end_date": end_date,
     }
 
+
+def get_neo_feed(start_date: Optional[str] = None, end_date: Optional[str] = None) -> Dict[str, Any]:
+    params = _neo_feed_params(start_date, end_date)
+
     url, query = _build_nasa_url(NASA_NEO_FEED_ENDPOINT, params)
 
     logger.info(f"Calling NASA NEO Feed: {url} params={query}")
@@ -52,3 +92,15 @@ def get_neo_feed(start_date: Optional[str] = None, end_date: Optional[str] = Non
     response.raise_for_status()
 
     return response.json()
+
+
+def get_neo_lookup(asteroid_id: str) -> Dict[str, Any]:
+    """Full NEO record, including `orbital_data` (the feed omits it)."""
+    url, query = _build_nasa_url(f"{NASA_NEO_LOOKUP_ENDPOINT}/{asteroid_id}")
+
+    logger.info(f"Calling NASA NEO Lookup: {url}")
+
+    response = requests.get(url, params=query, timeout=REQUEST_TIMEOUT)
+    response.raise_for_status()
+
+    return response.json()
@@ -1,9 +1,18 @@
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any
+
 from flask import current_app
 from requests.exceptions import RequestException
 
+from app.core.config import RUST_MAX_CONCURRENCY, WORKER_CLAIM_TTL, WORKER_MAX_ATTEMPTS
 from app.core.dto_mapper import map_mongo_document_to_asteroid
+from app.core.lease import owner_id
 from app.core.mongodb import MongoDBClient
-from app.core.rust_client import process_asteroid_with_rust
+from app.core.resilience import CircuitOpenError
+from app.core.rust_client import is_rust_available, process_asteroid_with_rust
+from app.models.asteroid import Asteroid
 from app.utils.logger import logger
 
 
@@ -17,60 +26,131 @@ class AnalysisPipeline:
         
         logger.info(f"Starting analysis pipeline for up to {limit} asteroids")
         
+        try:
+            owner = owner_id()
+            claimed = mongo.claim_unprocessed(
+                owner, limit, WORKER_CLAIM_TTL, max_attempts=WORKER_MAX_ATTEMPTS
+            )
+            return AnalysisPipeline.process_claimed(mongo, claimed, owner)
+            
+        except Exception as e:
+            logger.critical(f"Pipeline failed: {e}")
+            raise
+
+    @staticmethod
+    def process_claimed(mongo: MongoDBClient, raw_asteroids: list[dict], owner: str) -> dict:
+        """Analyze raw asteroids claimed by `owner` and settle each claim.
+
+        Claims are renewed while the batch runs; whatever is not analyzed
+        goes back to pending for a later run or another worker."""
         stats = {
-            "total_fetched": 0,
+            "total_fetched": len(raw_asteroids),
             "processed": 0,
             "failed": 0,
             "skipped": 0,
+            "deferred": 0,
+            "aborted": False,
         }
         
-        try:
-            raw_asteroids = mongo.get_unprocessed_asteroids(limit=limit)
-            stats["total_fetched"] = len(raw_asteroids)
+        logger.info(f"Fetched {len(raw_asteroids)} unprocessed asteroids")
+        
+        queue: deque[tuple[Any, Asteroid]] = deque()
+        for raw_doc in raw_asteroids:
+            # Claims only return `normalized`, computed at ingest
+            normalized, invalid_reason = raw_doc.get("normalized"), None
+            if normalized is None:
+                normalized, invalid_reason = mongo.normalize_raw_asteroid(raw_doc["_id"])
+            if normalized is None:
+                logger.warning(f"Skipping raw asteroid {raw_doc['_id']}: {invalid_reason}")
+                mongo.finish_claim(raw_doc["_id"], owner, "failed", reason=invalid_reason)
+                stats["skipped"] += 1
+                continue
             
-            logger.info(f"Fetched {len(raw_asteroids)} unprocessed asteroids")
+            queue.append((raw_doc["_id"], Asteroid.from_normalized(normalized)))
+        
+        renew_every = WORKER_CLAIM_TTL / 3
+        renewed_at = time.monotonic()
+        
+        # Engine calls run concurrently; the AIMD limiter inside the Rust
+        # client decides how many are actually in flight at any time.
+        with ThreadPoolExecutor(
+            max_workers=RUST_MAX_CONCURRENCY, thread_name_prefix="rust-call"
+        ) as executor:
+            in_flight: dict[Future, tuple[Any, Asteroid]] = {}
             
-            for raw_doc in raw_asteroids:
-                asteroid_id = raw_doc.get("asteroid", {}).get("id", "unknown")
+            while queue or in_flight:
+                while queue and not stats["aborted"] and len(in_flight) < RUST_MAX_CONCURRENCY:
+                    if not is_rust_available():
+                        stats["aborted"] = True
+                        break
+                    raw_id, asteroid = queue.popleft()
+                    future = executor.submit(process_asteroid_with_rust, asteroid.to_dto_dict())
+                    in_flight[future] = (raw_id, asteroid)
                 
-                try:
-                    asteroid = map_mongo_document_to_asteroid(raw_doc)
-                    
-                    if asteroid is None:
-                        logger.warning(f"Skipping asteroid {asteroid_id}: mapping failed")
-                        stats["skipped"] += 1
-                        continue
-                    
-                    asteroid_dto = asteroid.to_dto_dict()
-                    
-                    risk_result = process_asteroid_with_rust(asteroid_dto)
-                    
-                    mongo.save_analysis_result(asteroid.id, risk_result)
-                    
-                    stats["processed"] += 1
-                    logger.info(
-                        f"Successfully analyzed asteroid {asteroid.id} "
-                        f"(risk: {risk_result.get('risk_level', 'unknown')})"
-                    )
-                    
-                except RequestException as e:
-                    logger.error(f"Rust engine error for asteroid {asteroid_id}: {e}")
-                    stats["failed"] += 1
-                    
-                except Exception as e:
-                    logger.error(f"Unexpected error processing asteroid {asteroid_id}: {e}")
-                    stats["failed"] += 1
+                if stats["aborted"]:
+                    # Let calls already in flight finish, schedule nothing new
+                    stats["deferred"] += len(queue)
+                    for raw_id, _ in queue:
+                        mongo.release_claim(raw_id, owner, count_attempt=False)
+                    queue.clear()
+                
+                if not in_flight:
+                    break
+                
+                done, _ = wait(in_flight, timeout=renew_every, return_when=FIRST_COMPLETED)
+                for future in done:
+                    raw_id, asteroid = in_flight.pop(future)
+                    AnalysisPipeline._record_result(mongo, owner, raw_id, asteroid, future, stats)
+                
+                if time.monotonic() - renewed_at >= renew_every:
+                    mongo.renew_claims(owner, WORKER_CLAIM_TTL)
+                    renewed_at = time.monotonic()
+        
+        if stats["aborted"]:
+            logger.error(
+                f"Pipeline aborted: Rust Engine circuit open, "
+                f"{stats['deferred']} asteroids deferred to the next run"
+            )
+        
+        logger.info(
+            f"Pipeline completed: {stats['processed']} processed, "
+            f"{stats['failed']} failed, {stats['skipped']} skipped, "
+            f"{stats['deferred']} deferred"
+        )
+        
+        return stats
+
+    @staticmethod
+    def _record_result(
+        mongo: MongoDBClient, owner: str, raw_id, asteroid: Asteroid, future: Future, stats: dict
+    ) -> None:
+        try:
+            risk_result = future.result()
+            
+            mongo.save_analysis_result(asteroid.id, risk_result)
+            if not mongo.finish_claim(raw_id, owner, "done"):
+                logger.warning(f"Claim on asteroid {asteroid.id} expired before it was analyzed")
             
+            stats["processed"] += 1
             logger.info(
-                f"Pipeline completed: {stats['processed']} processed, "
-                f"{stats['failed']} failed, {stats['skipped']} skipped"
+                f"Successfully analyzed asteroid {asteroid.id} "
+                f"(risk: {risk_result.get('risk_level', 'unknown')})"
             )
             
-            return stats
+        except CircuitOpenError:
+            mongo.release_claim(raw_id, owner, count_attempt=False)
+            stats["aborted"] = True
+            stats["deferred"] += 1
+            
+        except RequestException as e:
+            logger.error(f"Rust engine error for asteroid {asteroid.id}: {e}")
+            mongo.release_claim(raw_id, owner)
+            stats["failed"] += 1
             
         except Exception as e:
-            logger.critical(f"Pipeline failed: {e}")
-            raise
+            logger.error(f"Unexpected error processing asteroid {asteroid.id}: {e}")
+            mongo.release_claim(raw_id, owner)
+            stats["failed"] += 1
 
 
     @staticmethod
@@ -96,6 +176,7 @@ class AnalysisPipeline:
         risk_result = process_asteroid_with_rust(asteroid_dto)
         
         mongo.save_analysis_result(asteroid.id, risk_result)
+        mongo.mark_analyzed(raw_doc["_id"])
         
         logger.info(f"Single asteroid analysis complete: {asteroid_id}")
         
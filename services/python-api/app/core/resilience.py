@@ -0,0 +1,183 @@
+import threading
+import time
+from typing import Callable
+
+from requests import RequestException
+
+from app.utils.logger import logger
+
+
+class CircuitOpenError(RequestException):
+    """Raised instead of calling a dependency whose circuit is open."""
+
+
+class CircuitBreaker:
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int,
+        reset_timeout: float,
+        probe: Callable[[], bool] | None = None,
+    ):
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.probe = probe
+
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == self.OPEN and self._reset_elapsed():
+                return self.HALF_OPEN
+            return self._state
+
+    def _reset_elapsed(self) -> bool:
+        return time.monotonic() - self._opened_at >= self.reset_timeout
+
+    def _open(self) -> None:
+        self._state = self.OPEN
+        self._opened_at = time.monotonic()
+
+    def allow_request(self) -> bool:
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+            if not self._reset_elapsed() or self._probing:
+                return False
+            # One caller probes while everyone else keeps failing fast
+            self._state = self.HALF_OPEN
+            self._probing = True
+
+        healthy = False
+        try:
+            healthy = self.probe() if self.probe else True
+        except Exception as e:
+            logger.warning(f"Circuit '{self.name}' probe raised: {e}")
+
+        with self._lock:
+            self._probing = False
+            if healthy:
+                logger.info(f"Circuit '{self.name}' probe succeeded, closing circuit")
+                self._state = self.CLOSED
+                self._consecutive_failures = 0
+            else:
+                logger.warning(f"Circuit '{self.name}' probe failed, staying open")
+                self._open()
+        return healthy
+
+    def trip(self) -> None:
+        """Force the circuit open regardless of the failure count."""
+        with self._lock:
+            self._open()
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._consecutive_failures = 0
+            self._state = self.CLOSED
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._consecutive_failures += 1
+            if self._state != self.OPEN and self._consecutive_failures >= self.failure_threshold:
+                logger.error(
+                    f"Circuit '{self.name}' opened after "
+                    f"{self._consecutive_failures} consecutive failures"
+                )
+                self._open()
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "state": self._state,
+                "consecutive_failures": self._consecutive_failures,
+                "retry_in_s": (
+                    round(max(0.0, self.reset_timeout - (time.monotonic() - self._opened_at)), 1)
+                    if self._state == self.OPEN else 0.0
+                ),
+            }
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD limit on in-flight calls: +1 per window of fast successes,
+    halved when a call fails or exceeds the latency target."""
+
+    def __init__(
+        self,
+        min_limit: int,
+        max_limit: int,
+        latency_target_s: float,
+        backoff_ratio: float = 0.5,
+    ):
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.latency_target_s = latency_target_s
+        self.backoff_ratio = backoff_ratio
+
+        self._cond = threading.Condition()
+        self._limit = float(self.min_limit)
+        self._in_flight = 0
+        self._last_decrease = 0.0
+        self._latency_ewma_s = 0.0
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    def acquire(self) -> None:
+        with self._cond:
+            while self._in_flight >= int(self._limit):
+                self._cond.wait()
+            self._in_flight += 1
+
+    def try_acquire(self) -> bool:
+        """Take a slot without waiting; False when the limit is reached."""
+        with self._cond:
+            if self._in_flight >= int(self._limit):
+                return False
+            self._in_flight += 1
+            return True
+
+    def cancel(self) -> None:
+        """Give a slot back without a latency sample (the call never happened)."""
+        with self._cond:
+            self._in_flight -= 1
+            self._cond.notify_all()
+
+    def release(self, latency_s: float, ok: bool) -> None:
+        with self._cond:
+            self._in_flight -= 1
+            self._latency_ewma_s = (
+                latency_s if self._latency_ewma_s == 0.0
+                else 0.8 * self._latency_ewma_s + 0.2 * latency_s
+            )
+
+            now = time.monotonic()
+            if not ok or latency_s > self.latency_target_s:
+                # Calls that were already in flight report the same congestion;
+                # only back off once per latency window.
+                if now - self._last_decrease >= self.latency_target_s:
+                    self._limit = max(float(self.min_limit), self._limit * self.backoff_ratio)
+                    self._last_decrease = now
+            else:
+                self._limit = min(float(self.max_limit), self._limit + 1.0 / self._limit)
+
+            self._cond.notify_all()
+
+    def snapshot(self) -> dict:
+        with self._cond:
+            return {
+                "limit": int(self._limit),
+                "in_flight": self._in_flight,
+                "latency_ewma_ms": round(self._latency_ewma_s * 1000.0, 2),
+                "latency_target_ms": round(self.latency_target_s * 1000.0, 2),
+            }
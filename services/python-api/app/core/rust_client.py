@@ -1,33 +1,151 @@
+import time
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Dict, Any
 
-from app.core.config import RUST_ENGINE_URL, REQUEST_TIMEOUT
+from app.core.config import (
+    RUST_ENGINE_URLS,
+    REQUEST_TIMEOUT,
+    RUST_CONNECT_TIMEOUT,
+    RUST_HEALTH_TIMEOUT,
+    RUST_HEALTH_CHECK_INTERVAL,
+    RUST_SLOW_EJECT_FACTOR,
+    RUST_BREAKER_FAILURE_THRESHOLD,
+    RUST_BREAKER_RESET_TIMEOUT,
+    RUST_MIN_CONCURRENCY,
+    RUST_MAX_CONCURRENCY,
+    RUST_LATENCY_TARGET_MS,
+    RUST_WIRE_FORMAT,
+)
+from app.core.engine_pool import EnginePool
+from app.core.resilience import AdaptiveConcurrencyLimiter, CircuitOpenError
+from app.core.wire_format import (
+    MSGPACK_REJECTED_STATUS,
+    WIRE_FORMATS,
+    decode_body,
+    encode_body,
+    request_headers,
+    resolve_wire_format,
+)
 from app.utils.logger import logger
 
+WIRE_FORMAT = resolve_wire_format(RUST_WIRE_FORMAT)
+_wire_headers = {wire_format: request_headers(wire_format) for wire_format in WIRE_FORMATS}
+
+_session = requests.Session()
+_session.mount("http://", HTTPAdapter(pool_maxsize=RUST_MAX_CONCURRENCY))
+
+
+def check_instance_health(base_url: str) -> str:
+    try:
+        response = _session.get(f"{base_url}/api/health", timeout=RUST_HEALTH_TIMEOUT)
+        if response.status_code == 200:
+            return "ok"
+        logger.warning(f"Rust Engine {base_url} returned status {response.status_code}")
+        return "unhealthy"
+    except requests.RequestException as e:
+        logger.warning(f"Rust Engine {base_url} health check failed: {e}")
+        return "unreachable"
+
+
+pool = EnginePool(
+    RUST_ENGINE_URLS,
+    health_check=check_instance_health,
+    failure_threshold=RUST_BREAKER_FAILURE_THRESHOLD,
+    reset_timeout=RUST_BREAKER_RESET_TIMEOUT,
+    slow_eject_factor=RUST_SLOW_EJECT_FACTOR,
+)
+
+limiter = AdaptiveConcurrencyLimiter(
+    min_limit=RUST_MIN_CONCURRENCY,
+    max_limit=RUST_MAX_CONCURRENCY,
+    latency_target_s=RUST_LATENCY_TARGET_MS / 1000.0,
+)
+
+
+def start_rust_health_checks() -> None:
+    pool.start_health_checks(RUST_HEALTH_CHECK_INTERVAL)
+
+
+def is_rust_available() -> bool:
+    """Cheap pre-check for callers that want to stop scheduling work early."""
+    return pool.is_available()
+
+
+def _instance_wire_format(instance) -> str:
+    return "json" if instance.json_only else WIRE_FORMAT
+
+
+def _retry_as_json(wire_format: str, status_code: int) -> bool:
+    return wire_format == "msgpack" and status_code == MSGPACK_REJECTED_STATUS
+
+
+def _downgrade_to_json(instance) -> None:
+    """Remember that `instance` only reads JSON bodies (mixed-version deploys)."""
+    if not instance.json_only:
+        instance.json_only = True
+        logger.warning(f"Rust Engine {instance.url} rejects MessagePack bodies, sending it JSON")
+
+
+def _is_engine_failure(error: requests.RequestException) -> bool:
+    # 4xx means the engine is up and rejected the payload; that must not trip the breaker
+    response = getattr(error, "response", None)
+    return response is None or response.status_code >= 500
+
+
+def _post_asteroid(url: str, asteroid_dto: Dict[str, Any], wire_format: str) -> requests.Response:
+    return _session.post(
+        url,
+        data=encode_body(asteroid_dto, wire_format),
+        headers=_wire_headers[wire_format],
+        timeout=(RUST_CONNECT_TIMEOUT, REQUEST_TIMEOUT),
+    )
+
 
 def process_asteroid_with_rust(asteroid_dto: Dict[str, Any]) -> Dict[str, Any]:
-    if not RUST_ENGINE_URL:
+    if not pool.instances:
         raise ValueError("RUST_ENGINE_URL is not configured.")
 
-    url = f"{RUST_ENGINE_URL}/api/process/asteroid"
     asteroid_id = asteroid_dto.get("id", "unknown")
 
-    logger.info(f"Sending asteroid {asteroid_id} to Rust Engine")
+    limiter.acquire()
+    # Picked after acquiring a slot: instances may have been ejected while queued
+    try:
+        instance = pool.acquire()
+    except CircuitOpenError as e:
+        limiter.cancel()
+        raise CircuitOpenError(f"{e}, not sending asteroid {asteroid_id}") from e
+
+    url = f"{instance.url}/api/process/asteroid"
+    logger.info(f"Sending asteroid {asteroid_id} to Rust Engine at {instance.url}")
 
+    started = time.monotonic()
+    engine_failed = True
     try:
-        response = requests.post(url, json=asteroid_dto, timeout=REQUEST_TIMEOUT)
+        wire_format = _instance_wire_format(instance)
+        response = _post_asteroid(url, asteroid_dto, wire_format)
+        if _retry_as_json(wire_format, response.status_code):
+            response = _post_asteroid(url, asteroid_dto, "json")
+            if response.ok:
+                _downgrade_to_json(instance)
         response.raise_for_status()
+        engine_failed = False
     except requests.RequestException as e:
+        engine_failed = _is_engine_failure(e)
         logger.error(f"Rust Engine request failed for asteroid {asteroid_id}: {e}")
         raise
+    finally:
+        latency = time.monotonic() - started
+        pool.release(instance, latency, ok=not engine_failed)
+        limiter.release(latency, ok=not engine_failed)
 
     try:
-        result = response.json()
+        result = decode_body(response.content, response.headers.get("Content-Type"))
     except ValueError as e:
         logger.error(
-            f"Invalid JSON response from Rust Engine for asteroid {asteroid_id}"
+            f"Invalid response body from Rust Engine for asteroid {asteroid_id}: {e}"
         )
-        raise RuntimeError("Rust Engine returned invalid JSON") from e
+        raise RuntimeError("Rust Engine returned an undecodable response") from e
 
     if "asteroid_id" not in result:
         logger.warning(
@@ -42,21 +160,26 @@ def process_asteroid_with_rust(asteroid_dto: Dict[str, Any]) -> Dict[str, Any]:
 
 
 def check_rust_health() -> str:
-    """Check if Rust engine is reachable and healthy."""
-    if not RUST_ENGINE_URL:
+    """Check if at least one Rust engine instance is reachable and healthy."""
+    if not pool.instances:
         return "unconfigured"
-    
-    try:
-        # Try to reach the Rust engine health endpoint
-        response = requests.get(
-            f"{RUST_ENGINE_URL}/api/health",
-            timeout=5
-        )
-        if response.status_code == 200:
-            return "ok"
-        else:
-            logger.warning(f"Rust Engine returned status {response.status_code}")
-            return "unhealthy"
-    except requests.RequestException as e:
-        logger.warning(f"Rust Engine health check failed: {e}")
-        return "unreachable"
\ No newline at end of file
+
+    statuses = [check_instance_health(instance.url) for instance in pool.instances]
+    if "ok" in statuses:
+        return "ok"
+    return "unhealthy" if "unhealthy" in statuses else "unreachable"
+
+
+def cached_rust_health() -> str:
+    """Engine health kept fresh by the background health checks (no I/O)."""
+    if not pool.instances:
+        return "unconfigured"
+    return pool.health_status()
+
+
+def rust_client_status() -> dict:
+    return {
+        "wire_format": WIRE_FORMAT,
+        "concurrency": limiter.snapshot(),
+        "instances": pool.snapshot(),
+    }
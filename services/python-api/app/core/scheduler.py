@@ -0,0 +1,177 @@
+import math
+import random
+import re
+import threading
+from datetime import datetime, timedelta, timezone
+
+from flask import Flask
+
+from app.core.config import PIPELINE_BATCH_MAX, PIPELINE_BATCH_MIN
+from app.core.lease import LeaseHeldError, MongoLease
+from app.core.pipeline import AnalysisPipeline
+from app.utils.logger import logger
+
+_INTERVAL = re.compile(r"^(\d+)\s*([smh]?)$")
+_UNIT_SECONDS = {"": 1, "s": 1, "m": 60, "h": 3600}
+_CRON_ALIASES = {"@hourly": "0 * * * *", "@daily": "0 0 * * *", "@weekly": "0 0 * * 0"}
+
+
+class IntervalSchedule:
+    def __init__(self, seconds: int, spec: str):
+        if seconds <= 0:
+            raise ValueError("Schedule interval must be positive")
+        self.seconds = seconds
+        self.spec = spec
+
+    def next_after(self, moment: datetime) -> datetime:
+        # Aligned to the epoch so every process computes the same slots
+        slot = (math.floor(moment.timestamp() / self.seconds) + 1) * self.seconds
+        return datetime.fromtimestamp(slot, timezone.utc)
+
+
+def _parse_cron_field(field: str, low: int, high: int) -> set[int]:
+    values: set[int] = set()
+    for part in field.split(","):
+        step = 1
+        if "/" in part:
+            part, step_str = part.split("/", 1)
+            step = int(step_str)
+        if part == "*":
+            start, end = low, high
+        elif "-" in part:
+            start, end = (int(v) for v in part.split("-", 1))
+        else:
+            start = end = int(part)
+        if start < low or end > high or start > end or step < 1:
+            raise ValueError(f"Invalid cron field '{field}'")
+        values.update(range(start, end + 1, step))
+    return values
+
+
+class CronSchedule:
+    """Five-field cron expression (minute hour day month weekday), in UTC.
+
+    Supports `*`, lists, ranges and steps; weekday 0 and 7 are Sunday."""
+
+    def __init__(self, expression: str, spec: str):
+        fields = expression.split()
+        if len(fields) != 5:
+            raise ValueError(f"Cron expression needs 5 fields, got '{expression}'")
+        self.spec = spec
+        self.minutes = _parse_cron_field(fields[0], 0, 59)
+        self.hours = _parse_cron_field(fields[1], 0, 23)
+        self.days = _parse_cron_field(fields[2], 1, 31)
+        self.months = _parse_cron_field(fields[3], 1, 12)
+        self.weekdays = {d % 7 for d in _parse_cron_field(fields[4], 0, 7)}
+        # Like cron: when both day fields are restricted, either may match
+        self._days_or = fields[2] != "*" and fields[4] != "*"
+
+    def _day_matches(self, moment: datetime) -> bool:
+        day_ok = moment.day in self.days
+        weekday_ok = (moment.weekday() + 1) % 7 in self.weekdays
+        return (day_ok or weekday_ok) if self._days_or else (day_ok and weekday_ok)
+
+    def next_after(self, moment: datetime) -> datetime:
+        t = moment.astimezone(timezone.utc).replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = t + timedelta(days=366 * 5)
+        while t < limit:
+            if t.month not in self.months:
+                t = (t.replace(day=1, hour=0, minute=0) + timedelta(days=32)).replace(day=1)
+            elif not self._day_matches(t):
+                t = t.replace(hour=0, minute=0) + timedelta(days=1)
+            elif t.hour not in self.hours:
+                t = t.replace(minute=0) + timedelta(hours=1)
+            elif t.minute not in self.minutes:
+                t += timedelta(minutes=1)
+            else:
+                return t
+        raise ValueError(f"Cron expression '{self.spec}' never fires")
+
+
+def parse_schedule(spec: str) -> IntervalSchedule | CronSchedule | None:
+    """`300`, `90s`, `5m`, `1h`, a cron expression or an @alias; empty disables."""
+    spec = spec.strip()
+    if not spec:
+        return None
+    match = _INTERVAL.match(spec)
+    if match:
+        return IntervalSchedule(int(match.group(1)) * _UNIT_SECONDS[match.group(2)], spec)
+    return CronSchedule(_CRON_ALIASES.get(spec, spec), spec)
+
+
+def batch_size_for(backlog: int) -> int:
+    """Drain the backlog in one run when it fits, within the configured bounds."""
+    return max(PIPELINE_BATCH_MIN, min(backlog, PIPELINE_BATCH_MAX))
+
+
+class PipelineScheduler:
+    """Runs the analysis pipeline on a schedule.
+
+    Every serving process runs a scheduler; the `pipeline` lease makes sure
+    each slot is executed by one of them and never overlaps a manual run.
+    A random jitter spreads the processes' wake-ups."""
+
+    def __init__(self, app: Flask, lease: MongoLease, schedule, jitter_s: float):
+        self.app = app
+        self.lease = lease
+        self.schedule = schedule
+        self.jitter_s = jitter_s
+        self.next_run: datetime | None = None
+        self.last_run: dict | None = None
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, daemon=True, name="pipeline-scheduler")
+        self._thread.start()
+        logger.info(f"Pipeline scheduler started ({self.schedule.spec})")
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def status(self) -> dict:
+        return {
+            "schedule": self.schedule.spec,
+            "next_run": self.next_run.isoformat() if self.next_run else None,
+            "last_run": self.last_run,
+        }
+
+    def _run(self) -> None:
+        mongo = self.app.extensions["mongo"]
+        if not mongo.ready.wait(timeout=60):
+            logger.warning("Pipeline scheduler: MongoDB not ready, first run may fail")
+
+        while not self._stop.is_set():
+            now = datetime.now(timezone.utc)
+            slot = self.schedule.next_after(now)
+            self.next_run = slot
+            delay = (slot - now).total_seconds() + random.uniform(0, self.jitter_s)
+            if self._stop.wait(delay):
+                return
+            self.run_slot(slot)
+
+    def run_slot(self, slot: datetime) -> None:
+        with self.app.app_context():
+            try:
+                with self.lease.hold(slot=slot):
+                    self._run_pipeline(slot)
+            except LeaseHeldError as e:
+                logger.info(f"Scheduled pipeline run for {slot.isoformat()} skipped: {e}")
+            except Exception as e:
+                logger.error(f"Scheduled pipeline run failed: {e}")
+
+    def _run_pipeline(self, slot: datetime) -> None:
+        backlog = self.app.extensions["mongo"].estimate_backlog()
+        if backlog == 0:
+            logger.info("Scheduled pipeline run: nothing to analyze")
+            return
+
+        limit = batch_size_for(backlog)
+        logger.info(f"Scheduled pipeline run: backlog {backlog}, limit {limit}")
+        stats = AnalysisPipeline.analyze_unprocessed_asteroids(limit=limit)
+        self.last_run = {
+            "slot": slot.isoformat(),
+            "finished_at": datetime.now(timezone.utc).isoformat(),
+            "limit": limit,
+            "statistics": stats,
+        }
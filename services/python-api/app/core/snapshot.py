@@ -0,0 +1,70 @@
+import hashlib
+import threading
+import time
+from typing import Callable
+
+from app.utils.json_provider import dumps
+
+
+# Left out of the ETag digest
+_UNVERSIONED_FIELDS = ("generated_at", "logs")
+
+
+class CachedSnapshot:
+    def __init__(self, body: bytes, etag: str):
+        self.body = body
+        self.etag = etag
+        self.created_at = time.monotonic()
+
+
+class SnapshotCache:
+    """Holds one serialized payload for `ttl_s` seconds, shared by every
+    request in the process. Only one thread rebuilds an expired payload;
+    concurrent callers wait for it instead of querying Mongo themselves.
+
+    An invalidated payload is rebuilt early, but never before it is
+    `min_age_s` old, so invalidations in a burst are coalesced."""
+
+    def __init__(self, ttl_s: float, build: Callable[[], dict], min_age_s: float = 0.0):
+        self.ttl_s = ttl_s
+        self.min_age_s = min(min_age_s, ttl_s)
+        self.build = build
+        self._lock = threading.Lock()
+        self._current: CachedSnapshot | None = None
+        self._dirty = False
+
+    def _fresh(self) -> CachedSnapshot | None:
+        current = self._current
+        if current is None:
+            return None
+        age = time.monotonic() - current.created_at
+        if age >= self.ttl_s or (self._dirty and age >= self.min_age_s):
+            return None
+        return current
+
+    def get(self) -> CachedSnapshot:
+        current = self._fresh()
+        if current is not None:
+            return current
+
+        with self._lock:
+            current = self._fresh()
+            if current is None:
+                # Cleared first: an invalidation during the build marks it stale again
+                self._dirty = False
+                current = self._serialize(self.build())
+                self._current = current
+            return current
+
+    def invalidate(self) -> None:
+        """Mark the cached payload stale (see `min_age_s`)."""
+        self._dirty = True
+
+    @staticmethod
+    def _serialize(payload: dict) -> CachedSnapshot:
+        body = dumps(payload, sort_keys=True)
+        # generated_at changes every build and the log tail with every log line
+        # (the running pipeline logs constantly); unchanged data keeps its ETag
+        content = {k: v for k, v in payload.items() if k not in _UNVERSIONED_FIELDS}
+        digest = hashlib.sha1(dumps(content, sort_keys=True)).hexdigest()
+        return CachedSnapshot(body, digest)
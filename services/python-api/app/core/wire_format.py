@@ -0,0 +1,62 @@
+import json
+from typing import Any
+
+from app.utils.logger import logger
+
+try:
+    import msgpack
+except ImportError:  # optional dependency, JSON is always available
+    msgpack = None
+
+JSON_CONTENT_TYPE = "application/json"
+MSGPACK_CONTENT_TYPE = "application/msgpack"
+
+WIRE_FORMATS = ("json", "msgpack")
+
+# Answer of an engine that predates MessagePack to a MessagePack body (the
+# axum Json extractor). 400/422 mean the body was read and is invalid: a
+# JSON retry would get the same answer
+MSGPACK_REJECTED_STATUS = 415
+
+
+def resolve_wire_format(preferred: str) -> str:
+    preferred = (preferred or "json").lower()
+    if preferred not in WIRE_FORMATS:
+        logger.warning(f"Unknown wire format '{preferred}', using JSON")
+        return "json"
+    if preferred == "msgpack" and msgpack is None:
+        logger.warning("msgpack is not installed, falling back to JSON for the Rust Engine")
+        return "json"
+    return preferred
+
+
+def request_headers(wire_format: str) -> dict[str, str]:
+    if wire_format == "msgpack":
+        return {
+            "Content-Type": MSGPACK_CONTENT_TYPE,
+            # Lets an engine that cannot encode MessagePack answer in JSON. The
+            # request body is another matter: see MSGPACK_REJECTED_STATUS
+            "Accept": f"{MSGPACK_CONTENT_TYPE}, {JSON_CONTENT_TYPE};q=0.5",
+        }
+    return {"Content-Type": JSON_CONTENT_TYPE, "Accept": JSON_CONTENT_TYPE}
+
+
+def encode_body(payload: Any, wire_format: str) -> bytes:
+    if wire_format == "msgpack":
+        return msgpack.packb(payload, use_bin_type=True)
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+
+def decode_body(content: bytes, content_type: str | None) -> Any:
+    """Decode a response body based on its Content-Type. Raises ValueError."""
+    content_type = (content_type or "").lower()
+
+    if "msgpack" in content_type:
+        if msgpack is None:
+            raise ValueError("Received MessagePack but msgpack is not installed")
+        try:
+            return msgpack.unpackb(content, raw=False)
+        except (msgpack.UnpackException, ValueError, TypeError) as e:
+            raise ValueError(f"Invalid MessagePack body: {e}") from e
+
+    return json.loads(content)
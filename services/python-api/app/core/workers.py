@@ -0,0 +1,119 @@
+import signal
+import sys
+import threading
+import time
+
+from app.core.config import (
+    MONGO_DB_NAME,
+    MONGO_URI,
+    WORKER_BATCH_SIZE,
+    WORKER_CLAIM_TTL,
+    WORKER_ENGINE_WAIT,
+    WORKER_IDLE_INTERVAL,
+    WORKER_MAX_ATTEMPTS,
+)
+from app.core.lease import owner_id
+from app.core.mongodb import MongoDBClient
+from app.core.pipeline import AnalysisPipeline
+from app.core.rust_client import is_rust_available, start_rust_health_checks
+from app.utils.logger import logger
+
+# Exit code of a --drain worker that gave up waiting for the engine
+ENGINE_UNAVAILABLE_EXIT = 3
+
+
+class PartitionWorker:
+    """Analyzes the raw asteroids of one partition in batches.
+
+    Batches are claimed atomically in Mongo, so workers on any number of
+    processes or hosts never analyze the same asteroid twice while their
+    claims are live. Without `drain` the worker keeps polling for new data
+    once its partition is empty; with it, the worker also gives up once the
+    engine has been unavailable for WORKER_ENGINE_WAIT seconds."""
+
+    def __init__(
+        self,
+        mongo: MongoDBClient,
+        partition: int,
+        partitions: int,
+        batch_size: int = WORKER_BATCH_SIZE,
+        drain: bool = False,
+        stop: threading.Event | None = None,
+    ):
+        if not 0 <= partition < partitions:
+            raise ValueError(f"Partition {partition} out of range for {partitions} partitions")
+        self.mongo = mongo
+        self.partition = partition
+        self.partitions = partitions
+        self.batch_size = batch_size
+        self.drain = drain
+        self.stop = stop or threading.Event()
+        self.owner = f"{owner_id()}:p{partition}"
+        self.totals = {
+            "batches": 0,
+            "processed": 0,
+            "failed": 0,
+            "skipped": 0,
+            "deferred": 0,
+            "engine_unavailable": False,
+        }
+
+    def run(self) -> dict:
+        logger.info(f"Worker {self.owner} started on partition {self.partition}/{self.partitions}")
+        unavailable_since = None
+        while not self.stop.is_set():
+            if not is_rust_available():
+                now = time.monotonic()
+                if unavailable_since is None:
+                    unavailable_since = now
+                if self.drain and now - unavailable_since >= WORKER_ENGINE_WAIT:
+                    logger.warning(
+                        f"Worker {self.owner} giving up: engine unavailable for {WORKER_ENGINE_WAIT:.0f}s"
+                    )
+                    self.totals["engine_unavailable"] = True
+                    break
+                # Claiming now would only defer the batch straight back
+                self.stop.wait(WORKER_IDLE_INTERVAL)
+                continue
+            unavailable_since = None
+
+            claimed = self.mongo.claim_unprocessed(
+                self.owner,
+                self.batch_size,
+                WORKER_CLAIM_TTL,
+                partition=self.partition,
+                partitions=self.partitions,
+                max_attempts=WORKER_MAX_ATTEMPTS,
+            )
+            if not claimed:
+                if self.drain:
+                    break
+                self.stop.wait(WORKER_IDLE_INTERVAL)
+                continue
+
+            stats = AnalysisPipeline.process_claimed(self.mongo, claimed, self.owner)
+            self.totals["batches"] += 1
+            for key in ("processed", "failed", "skipped", "deferred"):
+                self.totals[key] += stats[key]
+
+        logger.info(f"Worker {self.owner} stopped: {self.totals}")
+        return self.totals
+
+
+def run_partition_worker(partition: int, partitions: int, batch_size: int, drain: bool) -> None:
+    """Entry point of a worker process (see app/workers.py)."""
+    stop = threading.Event()
+    # The supervisor forwards SIGINT/SIGTERM; finish the current batch, then exit
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+    signal.signal(signal.SIGINT, lambda *_: stop.set())
+
+    mongo = MongoDBClient(MONGO_URI, MONGO_DB_NAME)
+    mongo.connect(background=False)
+    start_rust_health_checks()
+
+    try:
+        totals = PartitionWorker(mongo, partition, partitions, batch_size, drain, stop).run()
+    finally:
+        mongo.close()
+    if totals["engine_unavailable"]:
+        sys.exit(ENGINE_UNAVAILABLE_EXIT)
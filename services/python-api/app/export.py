@@ -0,0 +1,60 @@
+import argparse
+import sys
+
+from app.core.config import MONGO_DB_NAME, MONGO_URI
+from app.core.export import (
+    ANALYSIS_EXPORT_PROJECTION,
+    DEFAULT_EXPORT_BATCH_SIZE,
+    EXPORT_FORMATS,
+    write_export,
+)
+from app.core.mongodb import MongoDBClient
+from app.models.analysis_result import analysis_search_filter, analysis_sort_spec
+from app.utils.logger import logger
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Export asteroid_analyses as a Parquet or Arrow file (same as GET /analysis/export)",
+    )
+    parser.add_argument("output", help="output file, or - for stdout")
+    parser.add_argument("--format", choices=sorted(EXPORT_FORMATS),
+                        help="default: from the output extension, else parquet")
+    parser.add_argument("-q", "--query", help="asteroid id, or substring of the name or risk level")
+    parser.add_argument("--sort", default="risk_score")
+    parser.add_argument("--order", choices=("asc", "desc"), default="desc")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_EXPORT_BATCH_SIZE)
+    args = parser.parse_args(argv)
+
+    if args.format is None:
+        extension = args.output.rsplit(".", 1)[-1]
+        args.format = extension if extension in EXPORT_FORMATS else "parquet"
+    if args.batch_size < 1:
+        parser.error("--batch-size must be positive")
+    return args
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = _parse_args(argv)
+
+    mongo = MongoDBClient(MONGO_URI, MONGO_DB_NAME, max_pool_size=2)
+    mongo.connect(background=False)
+    try:
+        cursor = (
+            mongo.db["asteroid_analyses"]
+            .find(analysis_search_filter(args.query), ANALYSIS_EXPORT_PROJECTION)
+            .sort(analysis_sort_spec(args.sort, args.order))
+            .batch_size(args.batch_size)
+        )
+        if args.output == "-":
+            write_export(cursor, args.format, sys.stdout.buffer, args.batch_size)
+        else:
+            with open(args.output, "wb") as out:
+                write_export(cursor, args.format, out, args.batch_size)
+            logger.info(f"Exported analyses to {args.output} ({args.format})")
+    finally:
+        mongo.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,43 @@
+import argparse
 import threading
 from datetime import date, timedelta
 from flask import Flask
-from app.core.mongodb import MongoDBClient
-from app.core.config import DEBUG, MONGO_URI, MONGO_DB_NAME
+from app.core.mongodb import MongoDBClient, load_driver
+from app.core.config import (
+    DEBUG,
+    MONGO_URI,
+    MONGO_DB_NAME,
+    MONGO_MAX_POOL_SIZE,
+    NASA_API_KEY,
+    PIPELINE_LEASE_TTL,
+    PIPELINE_SCHEDULE,
+    PIPELINE_SCHEDULE_JITTER,
+    SEED_LOCK_FILE,
+)
+from app.core.lease import MongoLease
 from app.core.nasa_client import get_neo_feed
+from app.core.rust_client import start_rust_health_checks
 from app.routes.nasa import nasa_bp
 from app.routes.analysis import analysis_bp
 from app.routes.orchestration import orchestration_bp
 from app.routes.logs import logs_bp
+from app.routes.health import health_bp
+from app.routes.dashboard import dashboard_bp
+from app.routes.events import events_bp
+from app.routes.orbits import orbits_bp
+from app.routes.close_approaches import close_approaches_bp
+from app.utils.compression import init_compression
+from app.utils.json_provider import FastJSONProvider
 from app.utils.logger import logger
 
+try:
+    import fcntl
+except ImportError:  # Windows: single-process dev server only
+    fcntl = None
+
+# Held open for the life of the process that won the seeder election
+_seed_lock_handle = None
+
 
 def _seed_asteroids_on_startup(app: Flask) -> None:
     """Fetch the last 7 days of NASA NEO data and save only new asteroids."""
@@ -20,6 +48,11 @@ def _seed_asteroids_on_startup(app: Flask) -> None:
                 logger.warning("Startup seed skipped: MongoDB not ready")
                 return
 
+            # The existing-id scan below needs the collections and indexes in place
+            if not mongo.ready.wait(timeout=60):
+                logger.warning("Startup seed skipped: MongoDB indexes not ready after 60s")
+                return
+
             # Fetch last 7 days from today
             end_date = date.today()
             start_date = end_date - timedelta(days=7)
@@ -62,16 +95,51 @@ def _seed_asteroids_on_startup(app: Flask) -> None:
             logger.error(f"Startup seed failed: {e}")
 
 
-def create_app():
-    app = Flask(__name__)
+def _elect_seeder() -> bool:
+    """True in exactly one process per host: the first to lock SEED_LOCK_FILE.
 
-    mongo = MongoDBClient(MONGO_URI, MONGO_DB_NAME)
-    mongo.init_app(app)
+    The lock is released when that process exits, so a recycled worker may
+    seed again, which is harmless since seeding skips existing asteroids."""
+    global _seed_lock_handle
 
-    app.register_blueprint(nasa_bp)
-    app.register_blueprint(analysis_bp)
-    app.register_blueprint(orchestration_bp)
-    app.register_blueprint(logs_bp)
+    if fcntl is None:
+        return True
+    if _seed_lock_handle is not None:
+        return True
+
+    handle = open(SEED_LOCK_FILE, "a")
+    try:
+        fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        handle.close()
+        return False
+
+    _seed_lock_handle = handle
+    return True
+
+
+def start_background_services(app: Flask) -> None:
+    """Threads owned by a serving process; must run after any fork."""
+    start_rust_health_checks()
+
+    schedule = app.extensions.get("pipeline_schedule")
+    if schedule is not None:
+        from app.core.scheduler import PipelineScheduler
+
+        scheduler = PipelineScheduler(
+            app, app.extensions["pipeline_lease"], schedule, PIPELINE_SCHEDULE_JITTER
+        )
+        app.extensions["pipeline_scheduler"] = scheduler
+        scheduler.start()
+
+    app.extensions["risk_leaderboard"].start()
+    # Feeds the leaderboard with analyses written by other processes, whether
+    # or not an event feed client is connected
+    app.extensions["events"].start()
+
+    if not _elect_seeder():
+        logger.info("Startup seed skipped: another worker is seeding")
+        return
 
     seed_thread = threading.Thread(
         target=_seed_asteroids_on_startup,
@@ -81,9 +149,67 @@ def create_app():
     )
     seed_thread.start()
 
+
+def create_app(preload: bool = False):
+    """Build the Flask app.
+
+    With `preload=True` (pre-fork servers, see app/wsgi.py) no connection or
+    thread is started; each worker calls `init_worker` after forking."""
+    app = Flask(__name__)
+    app.json = FastJSONProvider(app)
+    init_compression(app)
+
+    mongo = MongoDBClient(MONGO_URI, MONGO_DB_NAME, max_pool_size=MONGO_MAX_POOL_SIZE)
+    mongo.init_app(app, connect=not preload)
+
+    # Held by every pipeline run, scheduled or manual, across all processes
+    app.extensions["pipeline_lease"] = MongoLease(mongo, "pipeline", PIPELINE_LEASE_TTL)
+    if PIPELINE_SCHEDULE:
+        from app.core.scheduler import parse_schedule
+
+        # Parsed here so a bad expression fails at startup, not in a thread
+        app.extensions["pipeline_schedule"] = parse_schedule(PIPELINE_SCHEDULE)
+
+    app.register_blueprint(nasa_bp)
+    app.register_blueprint(analysis_bp)
+    app.register_blueprint(orchestration_bp)
+    app.register_blueprint(logs_bp)
+    app.register_blueprint(health_bp)
+    app.register_blueprint(dashboard_bp)
+    app.register_blueprint(events_bp)
+    app.register_blueprint(orbits_bp)
+    app.register_blueprint(close_approaches_bp)
+
+    if not NASA_API_KEY:
+        logger.warning("NASA_API_KEY is not set: NASA routes and the startup seed will fail")
+
+    if preload:
+        # Imported once in the master instead of in every worker
+        load_driver()
+    else:
+        start_background_services(app)
+
     return app
 
 
+def init_worker(app: Flask) -> None:
+    app.extensions["mongo"].connect()
+    start_background_services(app)
+
+
 if __name__ == "__main__":
-    app = create_app()
-    app.run(host="0.0.0.0", port=5001, debug=DEBUG)
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="AstroForge python-api development server")
+    parser.add_argument(
+        "--startup-report",
+        action="store_true",
+        help="print a cold-start breakdown (startup phases, slowest imports) and exit",
+    )
+    args = parser.parse_args()
+
+    if args.startup_report:
+        from app.utils.startup_report import main as startup_report
+
+        startup_report()
+    else:
+        app = create_app()
+        app.run(host="0.0.0.0", port=5001, debug=DEBUG)
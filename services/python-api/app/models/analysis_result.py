@@ -1 +1,76 @@
-# Analysis results model
+import re
+from datetime import datetime, timezone
+
+ANALYSIS_SORT_FIELDS = {
+    "risk": "risk_data.risk_score_0_to_100",
+    "energy": "risk_data.impact_energy_megatons",
+    "date": "analysis_timestamp",
+    # Column names of the flattened rows
+    "risk_score": "risk_data.risk_score_0_to_100",
+    "energy_mt": "risk_data.impact_energy_megatons",
+    "analyzed_at": "analysis_timestamp",
+}
+DEFAULT_ANALYSIS_SORT_FIELD = "risk_data.risk_score_0_to_100"
+
+# Listing pages: a JSON array is built in memory, NDJSON streams any length
+MAX_JSON_PAGE = 1000
+
+HIGH_RISK_LEVELS = ["High", "Critical"]
+HIGH_RISK_FILTER = {"risk_data.risk_level": {"$in": HIGH_RISK_LEVELS}}
+
+
+def analysis_sort_field(sort_by: str) -> str:
+    return ANALYSIS_SORT_FIELDS.get(sort_by, DEFAULT_ANALYSIS_SORT_FIELD)
+
+
+def analysis_sort_spec(sort_by: str, order: str) -> list[tuple[str, int]]:
+    direction = -1 if order == "desc" else 1
+    # _id breaks ties so consecutive offset pages neither repeat nor skip rows
+    return [(analysis_sort_field(sort_by), direction), ("_id", direction)]
+
+
+def analysis_page_error(limit: int, offset: int, streamed: bool) -> str | None:
+    """Why a listing page request is rejected (400), if it is."""
+    if offset < 0:
+        return "offset must be >= 0"
+    if limit < 1:
+        return "limit must be >= 1"
+    if not streamed and limit > MAX_JSON_PAGE:
+        return f"limit must be between 1 and {MAX_JSON_PAGE} (stream application/x-ndjson for more)"
+    return None
+
+
+def analysis_search_filter(query: str | None) -> dict:
+    """Match an exact asteroid id, or a case-insensitive substring of the
+    name or risk level."""
+    if not query:
+        return {}
+    pattern = {"$regex": re.escape(query), "$options": "i"}
+    return {
+        "$or": [
+            {"neo_reference_id": query},
+            {"risk_data.asteroid_name": pattern},
+            {"risk_data.risk_level": pattern},
+        ]
+    }
+
+
+def start_of_today_utc() -> datetime:
+    return datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def flatten_analysis(doc: dict) -> dict:
+    """Flat row served to the dashboard for one `asteroid_analyses` document."""
+    risk = doc["risk_data"]
+    return {
+        "id": doc["neo_reference_id"],
+        "name": risk["asteroid_name"],
+        "risk_level": risk["risk_level"],
+        "risk_score": risk["risk_score_0_to_100"],
+        "energy_mt": risk["impact_energy_megatons"],
+        "distance_km": risk["miss_distance_km"],
+        "diameter_km": risk["diameter_km"],
+        "velocity_kps": risk["velocity_kps"],
+        "hazardous": risk["is_potentially_hazardous"],
+        "analyzed_at": doc["analysis_timestamp"],
+    }
@@ -12,6 +12,22 @@ class Asteroid:
     close_approach_date: str
     orbiting_body: str
 
+    @classmethod
+    def from_normalized(cls, normalized: dict) -> "Asteroid":
+        """From the `normalized` sub-document stored on raw asteroids at ingest."""
+        approach_at = normalized["approach_at"]
+        return cls(
+            id=normalized["id"],
+            name=normalized["name"],
+            absolute_magnitude_h=normalized["absolute_magnitude_h"],
+            diameter_km=normalized["diameter_km"],
+            velocity_kps=normalized["velocity_kps"],
+            distance_km=normalized["distance_km"],
+            is_potentially_hazardous=normalized["is_potentially_hazardous"],
+            close_approach_date=approach_at.strftime("%Y-%m-%d") if approach_at else "",
+            orbiting_body=normalized["orbiting_body"],
+        )
+
     def to_dto_dict(self) -> dict:
         return {
             "id": self.id,
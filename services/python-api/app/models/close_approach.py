@@ -0,0 +1,78 @@
+from datetime import datetime, timezone
+
+CLOSE_APPROACH_SORT_FIELDS = {
+    "date": "approach_at",
+    "distance": "miss_distance_km",
+    "velocity": "relative_velocity_kps",
+}
+
+
+def _float(value) -> float | None:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def approach_time(approach: dict) -> datetime | None:
+    epoch_ms = approach.get("epoch_date_close_approach")
+    if epoch_ms is not None:
+        return datetime.fromtimestamp(epoch_ms / 1000.0, timezone.utc)
+    for field, fmt in (("close_approach_date_full", "%Y-%b-%d %H:%M"), ("close_approach_date", "%Y-%m-%d")):
+        try:
+            return datetime.strptime(approach[field], fmt).replace(tzinfo=timezone.utc)
+        except (KeyError, TypeError, ValueError):
+            continue
+    return None
+
+
+def explode_close_approaches(asteroid: dict) -> list[dict]:
+    """One `close_approaches` document per entry of a NASA NEO's
+    `close_approach_data` (feed or lookup payload).
+
+    The _id is derived from the NEO, body and time, so ingesting the same
+    approach again overwrites it."""
+    neo_id = str(asteroid.get("id", ""))
+    if not neo_id:
+        return []
+
+    documents = []
+    for approach in asteroid.get("close_approach_data") or []:
+        approach_at = approach_time(approach)
+        miss_distance_km = _float(approach.get("miss_distance", {}).get("kilometers"))
+        if approach_at is None or miss_distance_km is None:
+            continue
+        body = approach.get("orbiting_body", "Earth")
+        documents.append({
+            "_id": f"{neo_id}:{body}:{approach_at.strftime('%Y%m%dT%H%M')}",
+            "neo_id": neo_id,
+            "name": asteroid.get("name", ""),
+            "approach_at": approach_at,
+            "miss_distance_km": miss_distance_km,
+            "relative_velocity_kps": _float(
+                approach.get("relative_velocity", {}).get("kilometers_per_second")
+            ),
+            "orbiting_body": body,
+            "is_potentially_hazardous": asteroid.get("is_potentially_hazardous_asteroid", False),
+        })
+    return documents
+
+
+def close_approach_filter(
+    start: datetime,
+    end: datetime,
+    max_km: float | None = None,
+    body: str = "Earth",
+    hazardous: bool | None = None,
+) -> dict:
+    """Approaches to `body` in [start, end), optionally within `max_km`."""
+    query: dict = {"orbiting_body": body, "approach_at": {"$gte": start, "$lt": end}}
+    if max_km is not None:
+        query["miss_distance_km"] = {"$lte": max_km}
+    if hazardous is not None:
+        query["is_potentially_hazardous"] = hazardous
+    return query
+
+
+def serialize_close_approach(doc: dict) -> dict:
+    return {key: value for key, value in doc.items() if key != "_id"}
@@ -1 +1,242 @@
 # Orbit data model
+from dataclasses import asdict, dataclass
+from datetime import date, datetime, timedelta, timezone
+from typing import Sequence
+
+import numpy as np
+
+AU_KM = 149_597_870.7
+# Gaussian gravitational constant, rad/day for a = 1 AU
+GAUSS_K = 0.01720209895
+J2000_JD = 2451545.0
+_UNIX_EPOCH_JD = 2440587.5
+
+# Object x epoch pairs propagated at once, ~70 bytes each; small blocks also
+# stay in CPU cache, so going larger is not faster (benchmarks/orbits.py)
+DEFAULT_BLOCK_SIZE = 100_000
+# The coarse minimum is refined on a grid this fine around it
+REFINE_POINTS = 201
+
+# Earth-Moon barycenter mean elements at J2000 and their rates per Julian
+# century (Standish, JPL): a, e, I, L, long. perihelion, node
+_EARTH_ELEMENTS = np.array([1.00000261, 0.01671123, -0.00001531, 100.46457166, 102.93768193, 0.0])
+_EARTH_RATES = np.array([0.00000562, -0.00004392, -0.01294668, 35999.37244981, 0.32327364, 0.0])
+
+
+def julian_date(moment: date | datetime) -> float:
+    if not isinstance(moment, datetime):
+        moment = datetime(moment.year, moment.month, moment.day, tzinfo=timezone.utc)
+    elif moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.timestamp() / 86400.0 + _UNIX_EPOCH_JD
+
+
+def from_julian_date(jd: float) -> datetime:
+    seconds = round((jd - _UNIX_EPOCH_JD) * 86400.0)
+    return datetime(1970, 1, 1, tzinfo=timezone.utc) + timedelta(seconds=seconds)
+
+
+@dataclass
+class OrbitalElements:
+    """Heliocentric osculating elements (ecliptic J2000), as in the
+    `orbital_data` of a NASA NEO lookup."""
+    semi_major_axis_au: float
+    eccentricity: float
+    inclination_deg: float
+    ascending_node_deg: float
+    perihelion_argument_deg: float
+    mean_anomaly_deg: float
+    epoch_jd: float
+    mean_motion_deg_per_day: float
+
+    @classmethod
+    def from_nasa(cls, orbital_data: dict) -> "OrbitalElements":
+        try:
+            a = float(orbital_data["semi_major_axis"])
+            e = float(orbital_data["eccentricity"])
+            n = orbital_data.get("mean_motion")
+            elements = cls(
+                semi_major_axis_au=a,
+                eccentricity=e,
+                inclination_deg=float(orbital_data["inclination"]),
+                ascending_node_deg=float(orbital_data["ascending_node_longitude"]),
+                perihelion_argument_deg=float(orbital_data["perihelion_argument"]),
+                mean_anomaly_deg=float(orbital_data["mean_anomaly"]),
+                epoch_jd=float(orbital_data["epoch_osculation"]),
+                mean_motion_deg_per_day=(
+                    float(n) if n is not None else np.degrees(GAUSS_K / a**1.5)
+                ),
+            )
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValueError(f"Invalid orbital data: {e}") from e
+
+        if not 0 <= e < 1 or a <= 0:
+            raise ValueError(f"Only elliptical orbits are supported (e={e}, a={a})")
+        return elements
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def solve_kepler(mean_anomaly: np.ndarray, eccentricity: np.ndarray, tol: float = 1e-12,
+                 max_iter: int = 50) -> np.ndarray:
+    """Eccentric anomaly E with E - e sin E = M, elementwise (Newton).
+
+    Inputs broadcast against each other; angles in radians."""
+    M = np.remainder(mean_anomaly, 2 * np.pi)
+    e = np.broadcast_to(eccentricity, M.shape)
+    # Starting at pi converges for every e < 1; M + e sin M is closer for low e
+    E = np.where(e < 0.8, M + e * np.sin(M), np.pi)
+    for _ in range(max_iter):
+        delta = (E - e * np.sin(E) - M) / (1 - e * np.cos(E))
+        E -= delta
+        if np.max(np.abs(delta), initial=0.0) < tol:
+            break
+    return E
+
+
+class _ElementArrays:
+    """Elements of many objects as column arrays, with the orientation
+    vectors P (to perihelion) and Q of each orbit plane precomputed."""
+
+    def __init__(self, elements: Sequence[OrbitalElements]):
+        self.a = np.array([el.semi_major_axis_au for el in elements], dtype=float)
+        self.e = np.array([el.eccentricity for el in elements], dtype=float)
+        self.m0 = np.radians([el.mean_anomaly_deg for el in elements])
+        self.n = np.radians([el.mean_motion_deg_per_day for el in elements])
+        self.epoch = np.array([el.epoch_jd for el in elements], dtype=float)
+        self.p, self.q = _orientation(
+            np.radians([el.inclination_deg for el in elements]),
+            np.radians([el.ascending_node_deg for el in elements]),
+            np.radians([el.perihelion_argument_deg for el in elements]),
+        )
+
+    def __len__(self) -> int:
+        return len(self.a)
+
+    def _plane_coordinates(self, jd: np.ndarray, rows: slice) -> tuple[np.ndarray, np.ndarray]:
+        """In-plane coordinates (AU) of objects `rows` at epochs `jd`, shape
+        (objects, epochs); `jd` is shared (1-D) or per object (2-D)."""
+        jd = np.asarray(jd, dtype=float)
+        if jd.ndim == 1:
+            jd = jd[None, :]
+        a, e = self.a[rows, None], self.e[rows, None]
+        E = solve_kepler(self.m0[rows, None] + self.n[rows, None] * (jd - self.epoch[rows, None]), e)
+        x = np.cos(E)
+        x -= e
+        x *= a
+        y = np.sin(E, out=E)
+        y *= a * np.sqrt(1 - e * e)
+        return x, y
+
+    def positions(self, jd: np.ndarray, rows: slice = slice(None)) -> np.ndarray:
+        """Positions in AU of objects `rows` at epochs `jd`, shape (objects, epochs, 3)."""
+        x, y = self._plane_coordinates(jd, rows)
+        return x[..., None] * self.p[rows, None, :] + y[..., None] * self.q[rows, None, :]
+
+    def squared_distance(self, jd: np.ndarray, rows: slice, target: np.ndarray) -> np.ndarray:
+        """Squared distance (AU^2) of objects `rows` to `target` positions at
+        `jd`, one axis at a time to keep temporaries at (objects, epochs)."""
+        x, y = self._plane_coordinates(jd, rows)
+        total = np.zeros_like(x)
+        for axis in range(3):
+            delta = x * self.p[rows, None, axis]
+            delta += y * self.q[rows, None, axis]
+            delta -= target[..., axis]
+            delta *= delta
+            total += delta
+        return total
+
+
+def _orientation(i: np.ndarray, node: np.ndarray, peri: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    cos_o, sin_o = np.cos(node), np.sin(node)
+    cos_w, sin_w = np.cos(peri), np.sin(peri)
+    cos_i, sin_i = np.cos(i), np.sin(i)
+    p = np.stack([
+        cos_o * cos_w - sin_o * sin_w * cos_i,
+        sin_o * cos_w + cos_o * sin_w * cos_i,
+        sin_w * sin_i,
+    ], axis=-1)
+    q = np.stack([
+        -cos_o * sin_w - sin_o * cos_w * cos_i,
+        -sin_o * sin_w + cos_o * cos_w * cos_i,
+        cos_w * sin_i,
+    ], axis=-1)
+    return p, q
+
+
+def propagate(elements: Sequence[OrbitalElements], jd: np.ndarray) -> np.ndarray:
+    """Heliocentric positions in AU, shape (objects, epochs, 3).
+
+    Unchunked; see `min_earth_distance` for large inputs."""
+    return _ElementArrays(elements).positions(np.asarray(jd, dtype=float))
+
+
+def earth_position(jd: np.ndarray) -> np.ndarray:
+    """Heliocentric Earth-Moon barycenter in AU, shape jd.shape + (3,).
+
+    Mean elements with linear rates: arcminute accuracy 1800-2050, far
+    below the sampling error of a daily grid."""
+    jd = np.asarray(jd, dtype=float)
+    centuries = (jd - J2000_JD) / 36525.0
+    a, e, i, mean_longitude, perihelion_longitude, node = (
+        base + rate * centuries for base, rate in zip(_EARTH_ELEMENTS, _EARTH_RATES)
+    )
+    M = np.radians(mean_longitude - perihelion_longitude)
+    E = solve_kepler(M, e)
+    x = a * (np.cos(E) - e)
+    y = a * np.sqrt(1 - e * e) * np.sin(E)
+    p, q = _orientation(np.radians(i), np.radians(node), np.radians(perihelion_longitude - node))
+    return x[..., None] * p + y[..., None] * q
+
+
+def min_earth_distance(
+    elements: Sequence[OrbitalElements],
+    start_jd: float,
+    end_jd: float,
+    step_days: float = 1.0,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    refine: bool = True,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Minimum distance to Earth (AU) of each object over [start, end] and
+    the Julian date it occurs at.
+
+    Objects and epochs are swept in blocks of at most `block_size` pairs,
+    so memory is bounded whatever the input size. With `refine`, each
+    minimum is then searched on a grid `REFINE_POINTS` times finer around
+    the best sample."""
+    orbits = _ElementArrays(elements)
+    epochs = np.arange(start_jd, end_jd + step_days / 2, step_days)
+    count = len(orbits)
+    best = np.full(count, np.inf)
+    best_jd = np.full(count, start_jd)
+    if count == 0 or len(epochs) == 0:
+        return np.sqrt(best), best_jd
+
+    epoch_chunk = max(1, min(len(epochs), block_size))
+    object_chunk = max(1, block_size // epoch_chunk)
+    for t0 in range(0, len(epochs), epoch_chunk):
+        jd = epochs[t0:t0 + epoch_chunk]
+        earth = earth_position(jd)
+        for o0 in range(0, count, object_chunk):
+            rows = slice(o0, o0 + object_chunk)
+            distance = orbits.squared_distance(jd, rows, earth)
+            index = np.argmin(distance, axis=1)
+            closest = distance[np.arange(len(index)), index]
+            improved = closest < best[rows]
+            best[rows] = np.where(improved, closest, best[rows])
+            best_jd[rows] = np.where(improved, jd[index], best_jd[rows])
+
+    if refine and len(epochs) > 1:
+        offsets = np.linspace(-step_days, step_days, REFINE_POINTS)
+        # Earth is propagated per object here, which about quadruples memory per pair
+        object_chunk = max(1, block_size // (REFINE_POINTS * 4))
+        for o0 in range(0, count, object_chunk):
+            rows = slice(o0, o0 + object_chunk)
+            jd = np.clip(best_jd[rows, None] + offsets, start_jd, end_jd)
+            distance = orbits.squared_distance(jd, rows, earth_position(jd))
+            index = np.argmin(distance, axis=1)
+            best[rows] = distance[np.arange(len(index)), index]
+            best_jd[rows] = jd[np.arange(len(index)), index]
+
+    return np.sqrt(best), best_jd
@@ -0,0 +1,156 @@
+from datetime import date, timedelta
+
+from app.models.analysis_result import HIGH_RISK_LEVELS
+
+HISTOGRAM_INTERVALS = ("day", "week", "month")
+# Rollup of analyses without a risk level
+UNKNOWN_LEVEL = "Unknown"
+
+# Summed and maximized fields of a rollup, by analysis document field
+_SUM_FIELDS = {
+    "risk_score_sum": "risk_score_0_to_100",
+    "energy_mt_sum": "impact_energy_megatons",
+}
+_MAX_FIELDS = {
+    "risk_score_max": "risk_score_0_to_100",
+    "energy_mt_max": "impact_energy_megatons",
+}
+_MIN_FIELDS = {
+    "miss_distance_km_min": "miss_distance_km",
+}
+
+
+def rollup_id(day: str, level: str) -> str:
+    return f"{day}:{level}"
+
+
+def rollup_update(document: dict) -> tuple[dict, dict]:
+    """(filter, update) folding one analysis document into its
+    `risk_rollups` document (one per UTC day and risk level), for an upsert."""
+    risk = document["risk_data"]
+    day = document["analysis_timestamp"].strftime("%Y-%m-%d")
+    level = risk.get("risk_level") or UNKNOWN_LEVEL
+
+    increments = {"count": 1, "hazardous": int(bool(risk.get("is_potentially_hazardous")))}
+    increments.update({field: risk.get(source) or 0 for field, source in _SUM_FIELDS.items()})
+    update = {"$setOnInsert": {"day": day, "level": level}, "$inc": increments}
+    # Missing values are skipped, as $max/$min do in the rebuild's $group
+    for operator, fields in (("$max", _MAX_FIELDS), ("$min", _MIN_FIELDS)):
+        values = {field: risk[source] for field, source in fields.items() if risk.get(source) is not None}
+        if values:
+            update[operator] = values
+    return {"_id": rollup_id(day, level)}, update
+
+
+def rollup_rebuild_pipeline(match: dict, into: str = "risk_rollups") -> list[dict]:
+    """Aggregation recomputing the rollups of the analyses matching `match`
+    and merging them over the stored ones (MongoDB 4.2+)."""
+    group: dict = {
+        "_id": {
+            "day": {"$dateToString": {"date": "$analysis_timestamp", "format": "%Y-%m-%d"}},
+            "level": {"$ifNull": ["$risk_data.risk_level", UNKNOWN_LEVEL]},
+        },
+        "count": {"$sum": 1},
+        "hazardous": {"$sum": {"$cond": ["$risk_data.is_potentially_hazardous", 1, 0]}},
+    }
+    group.update({field: {"$sum": f"$risk_data.{source}"} for field, source in _SUM_FIELDS.items()})
+    group.update({field: {"$max": f"$risk_data.{source}"} for field, source in _MAX_FIELDS.items()})
+    group.update({field: {"$min": f"$risk_data.{source}"} for field, source in _MIN_FIELDS.items()})
+
+    fields = [field for field in group if field != "_id"]
+    return [
+        {"$match": match},
+        {"$group": group},
+        {
+            "$project": {
+                "_id": {"$concat": ["$_id.day", ":", "$_id.level"]},
+                "day": "$_id.day",
+                "level": "$_id.level",
+                **{field: 1 for field in fields},
+            }
+        },
+        {"$merge": {"into": into, "on": "_id", "whenMatched": "replace", "whenNotMatched": "insert"}},
+    ]
+
+
+def stats_rollup_filter(today: str) -> dict:
+    """Rollups needed for the pipeline stats' `analyzed_today` and `high_risks`."""
+    return {"$or": [{"day": today}, {"level": {"$in": HIGH_RISK_LEVELS}}]}
+
+
+def stats_from_rollups(rollups, today: str) -> tuple[int, int]:
+    """(analyzed today, high risks overall) from `stats_rollup_filter` matches."""
+    analyzed_today = high_risks = 0
+    for rollup in rollups:
+        if rollup["day"] == today:
+            analyzed_today += rollup["count"]
+        if rollup["level"] in HIGH_RISK_LEVELS:
+            high_risks += rollup["count"]
+    return analyzed_today, high_risks
+
+
+def bucket_start(day: date, interval: str) -> date:
+    if interval == "week":
+        return day - timedelta(days=day.weekday())
+    if interval == "month":
+        return day.replace(day=1)
+    return day
+
+
+def _next_bucket(start: date, interval: str) -> date:
+    if interval == "week":
+        return start + timedelta(days=7)
+    if interval == "month":
+        return (start + timedelta(days=32)).replace(day=1)
+    return start + timedelta(days=1)
+
+
+def _empty_bucket(start: date) -> dict:
+    return {
+        "start": start.isoformat(),
+        "count": 0,
+        "hazardous": 0,
+        "by_level": {},
+        "risk_score_sum": 0,
+        "risk_score_max": None,
+        "energy_mt_sum": 0,
+        "energy_mt_max": None,
+        "miss_distance_km_min": None,
+    }
+
+
+def _fold(current, value, pick):
+    if value is None:
+        return current
+    return value if current is None else pick(current, value)
+
+
+def build_histogram(rollups, start: date, end: date, interval: str) -> list[dict]:
+    """Buckets of `interval` covering [start, end], empty ones included,
+    summed from per-day rollup documents."""
+    buckets: dict[date, dict] = {}
+    cursor = bucket_start(start, interval)
+    while cursor <= end:
+        buckets[cursor] = _empty_bucket(cursor)
+        cursor = _next_bucket(cursor, interval)
+
+    for rollup in rollups:
+        bucket = buckets.get(bucket_start(date.fromisoformat(rollup["day"]), interval))
+        if bucket is None:
+            continue
+        bucket["count"] += rollup.get("count", 0)
+        bucket["hazardous"] += rollup.get("hazardous", 0)
+        bucket["by_level"][rollup["level"]] = (
+            bucket["by_level"].get(rollup["level"], 0) + rollup.get("count", 0)
+        )
+        for field in _SUM_FIELDS:
+            bucket[field] += rollup.get(field) or 0
+        for field in _MAX_FIELDS:
+            bucket[field] = _fold(bucket[field], rollup.get(field), max)
+        for field in _MIN_FIELDS:
+            bucket[field] = _fold(bucket[field], rollup.get(field), min)
+
+    for bucket in buckets.values():
+        total = bucket.pop("risk_score_sum")
+        bucket["risk_score_avg"] = total / bucket["count"] if bucket["count"] else None
+    return list(buckets.values())
@@ -1,7 +1,14 @@
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, Response, current_app, jsonify, request, stream_with_context
 from requests.exceptions import RequestException
 
+from app.core.export import (
+    ANALYSIS_EXPORT_PROJECTION,
+    DEFAULT_EXPORT_BATCH_SIZE,
+    EXPORT_FORMATS,
+    stream_export,
+)
 from app.core.rust_client import process_asteroid_with_rust
+from app.models.analysis_result import analysis_search_filter, analysis_sort_spec
 from app.utils.logger import logger
 
 analysis_bp = Blueprint("analysis", __name__, url_prefix="/analysis")
@@ -48,3 +55,61 @@ def analyze_asteroid_feed():
     except Exception as e:
         logger.critical(f"Unexpected error in asteroid feed analysis: {e}")
         return jsonify({"error": "Internal server error"}), 500
+
+
+@analysis_bp.route("/export", methods=["GET"])
+def export_analyses():
+    """Every analysis (or those matching `q`) as one Parquet or Arrow file,
+    streamed in record batches of `batch_size` rows straight from the cursor.
+
+    Same columns and `q`/`sort`/`order` as /pipeline/analysis/asteroids,
+    without its `limit`."""
+    logger.info("Received request: GET /analysis/export")
+
+    mongo = current_app.extensions.get("mongo")
+    if not mongo:
+        return jsonify({"error": "MongoDB not initialized"}), 500
+
+    fmt = request.args.get("format", default="parquet", type=str)
+    sort_by = request.args.get("sort", default="risk_score", type=str)
+    order = request.args.get("order", default="desc", type=str)
+    batch_size = request.args.get("batch_size", default=DEFAULT_EXPORT_BATCH_SIZE, type=int)
+    query = analysis_search_filter(request.args.get("q", type=str))
+
+    if fmt not in EXPORT_FORMATS:
+        return jsonify({"error": f"format must be one of {', '.join(EXPORT_FORMATS)}"}), 400
+    if batch_size < 1 or batch_size > 100_000:
+        return jsonify({"error": "batch_size must be between 1 and 100000"}), 400
+
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return jsonify({"error": "Export requires pyarrow, which is not installed"}), 501
+
+    try:
+        cursor = (
+            mongo.db["asteroid_analyses"]
+            .find(query, ANALYSIS_EXPORT_PROJECTION)
+            .sort(analysis_sort_spec(sort_by, order))
+            .batch_size(batch_size)
+        )
+    except Exception as e:
+        logger.error(f"Failed to start analysis export: {e}")
+        return jsonify({"error": "Internal server error"}), 500
+
+    def generate():
+        try:
+            yield from stream_export(cursor, fmt, batch_size)
+        except Exception as e:
+            # Headers are sent; the client sees a truncated file
+            logger.error(f"Analysis export failed mid-stream: {e}")
+            raise
+        finally:
+            cursor.close()
+
+    spec = EXPORT_FORMATS[fmt]
+    return Response(
+        stream_with_context(generate()),
+        mimetype=spec["mimetype"],
+        headers={"Content-Disposition": f"attachment; filename=asteroid_analyses.{spec['extension']}"},
+    )
@@ -0,0 +1,245 @@
+import asyncio
+
+import httpx
+from quart import Blueprint, current_app, jsonify, make_response, request
+from requests.exceptions import RequestException
+
+from app.core.async_clients import AsyncClients
+from app.core.config import EVENTS_KEEPALIVE
+from app.core.dto_mapper import map_mongo_document_to_asteroid
+from app.core.events import Subscription
+from app.core.mongodb import BACKLOG_FILTER, MongoDBClient
+from app.core.rust_client import cached_rust_health, rust_client_status
+from app.models.analysis_result import (
+    analysis_page_error,
+    analysis_search_filter,
+    analysis_sort_spec,
+    flatten_analysis,
+    start_of_today_utc,
+)
+from app.models.risk_rollup import stats_from_rollups, stats_rollup_filter
+from app.routes.events import SSE_HEADERS, format_sse
+from app.routes.nasa import feed_records
+from app.utils.logger import logger
+from app.utils.ndjson import NDJSON_MIMETYPE, ndjson_lines, ndjson_lines_async, wants_ndjson
+
+async_pipeline_bp = Blueprint("async_pipeline", __name__, url_prefix="/pipeline")
+async_nasa_bp = Blueprint("async_nasa", __name__, url_prefix="/nasa")
+async_events_bp = Blueprint("async_events", __name__)
+
+
+def _clients() -> AsyncClients:
+    return current_app.extensions["async_clients"]
+
+
+@async_nasa_bp.route("/neo/feed", methods=["GET"])
+async def neo_feed():
+    logger.info("Received request: GET /nasa/neo/feed (async)")
+
+    try:
+        data = await _clients().get_neo_feed(
+            start_date=request.args.get("start_date"),
+            end_date=request.args.get("end_date"),
+        )
+        if wants_ndjson(request.accept_mimetypes):
+            response = await make_response(ndjson_lines(feed_records(data)))
+            response.mimetype = NDJSON_MIMETYPE
+        else:
+            response = jsonify(data)
+        response.vary.add("Accept")
+        return response, 200
+
+    except httpx.HTTPError as e:
+        logger.error(f"NASA API network error: {e}")
+        return (
+            jsonify({"error": "Failed to connect to NASA API", "details": str(e)}),
+            503,
+        )
+
+    except Exception as e:
+        logger.critical(f"Unexpected error in /nasa/neo/feed: {e}")
+        return jsonify({"error": "Internal server error"}), 500
+
+
+@async_pipeline_bp.route("/neo/analyze/<asteroid_id>", methods=["POST"])
+async def analyze_single_neo(asteroid_id: str):
+    logger.info(f"Received request: POST /pipeline/neo/analyze/{asteroid_id} (async)")
+
+    clients = _clients()
+    try:
+        raw_doc = await clients.get_raw_asteroid_by_id(asteroid_id)
+        if not raw_doc:
+            raise ValueError(f"Asteroid {asteroid_id} not found in database")
+
+        asteroid = map_mongo_document_to_asteroid(raw_doc)
+        if asteroid is None:
+            raise ValueError(f"Asteroid {asteroid_id} mapping failed")
+
+        result = await clients.process_asteroid_with_rust(asteroid.to_dto_dict())
+        document = MongoDBClient.build_analysis_document(asteroid.id, result)
+        await clients.insert_analysis(document)
+        await clients.mark_analyzed(raw_doc["_id"])
+        current_app.extensions["risk_leaderboard"].offer(document)
+
+        return (
+            jsonify({"status": "success", "asteroid_id": asteroid_id, "risk_analysis": result}),
+            200,
+        )
+
+    except ValueError as e:
+        logger.warning(f"Asteroid {asteroid_id} not found or invalid: {e}")
+        return jsonify({"error": "Asteroid not found or invalid", "details": str(e)}), 404
+
+    except (httpx.HTTPError, RequestException) as e:
+        # RequestException covers CircuitOpenError from the shared engine pool
+        logger.error(f"Rust Engine communication error: {e}")
+        return jsonify({"error": "Rust Engine unreachable", "details": str(e)}), 503
+
+    except Exception as e:
+        logger.critical(f"Unexpected error analyzing asteroid {asteroid_id}: {e}")
+        return jsonify({"error": "Internal server error"}), 500
+
+
+async def _collect_pipeline_stats(db) -> dict:
+    raw_collection = db["asteroids_raw"]
+    analysis_collection = db["asteroid_analyses"]
+
+    today = start_of_today_utc().strftime("%Y-%m-%d")
+    unprocessed_count, rollups, last_run = await asyncio.gather(
+        raw_collection.count_documents(BACKLOG_FILTER),
+        db["risk_rollups"]
+        .find(stats_rollup_filter(today), {"day": 1, "level": 1, "count": 1})
+        .to_list(None),
+        analysis_collection.find_one(sort=[("analysis_timestamp", -1)]),
+    )
+    analyzed_today, high_risk_count = stats_from_rollups(rollups, today)
+
+    return {
+        "status": "ok",
+        "unprocessed": unprocessed_count,
+        "analyzed_today": analyzed_today,
+        "high_risks": high_risk_count,
+        "last_pipeline_run": (
+            last_run["analysis_timestamp"].isoformat()
+            if last_run else None
+        ),
+    }
+
+
+@async_pipeline_bp.route("/status", methods=["GET"])
+async def pipeline_status():
+    logger.info("Received request: GET /pipeline/status (async)")
+
+    clients = _clients()
+    try:
+        await clients.ping_mongo()
+
+        payload = {
+            "status": "healthy",
+            "components": {
+                "mongodb": "connected",
+                "rust_engine": cached_rust_health(),
+            },
+            "rust_client": rust_client_status(),
+        }
+
+        if request.args.get("include") == "stats":
+            try:
+                payload["stats"] = await _collect_pipeline_stats(clients.db)
+            except Exception as e:
+                logger.error(f"Failed to compute pipeline stats: {e}")
+                payload["stats"] = {"status": "error", "details": str(e)}
+
+        return jsonify(payload), 200
+
+    except Exception as e:
+        logger.error(f"Pipeline status check failed: {e}")
+        return jsonify({"status": "unhealthy", "error": str(e)}), 503
+
+
+@async_pipeline_bp.route("/stats", methods=["GET"])
+async def pipeline_stats():
+    logger.info("Received request: GET /pipeline/stats (async)")
+
+    try:
+        return jsonify(await _collect_pipeline_stats(_clients().db)), 200
+
+    except Exception as e:
+        logger.error(f"Failed to compute pipeline stats: {e}")
+        return jsonify({"status": "error", "details": str(e)}), 500
+
+
+@async_pipeline_bp.route("/analysis/asteroids", methods=["GET"])
+async def list_analyzed_asteroids():
+    limit = request.args.get("limit", default=200, type=int)
+    offset = request.args.get("offset", default=0, type=int)
+    sort_by = request.args.get("sort", default="risk_score", type=str)
+    order = request.args.get("order", default="desc", type=str)
+    query = analysis_search_filter(request.args.get("q", type=str))
+
+    streamed = wants_ndjson(request.accept_mimetypes)
+    error = analysis_page_error(limit, offset, streamed)
+    if error:
+        return jsonify({"error": error}), 400
+
+    try:
+        collection = _clients().db["asteroid_analyses"]
+        cursor = (
+            collection
+            .find(query, {"_id": 0})
+            .sort(analysis_sort_spec(sort_by, order))
+            .skip(offset)
+            .limit(limit)
+        )
+
+        if query:
+            total = await collection.count_documents(query)
+        else:
+            total = await collection.estimated_document_count()
+
+        if streamed:
+            response = await make_response(
+                ndjson_lines_async(flatten_analysis(doc) async for doc in cursor)
+            )
+            response.mimetype = NDJSON_MIMETYPE
+            response.timeout = None
+        else:
+            response = jsonify([flatten_analysis(doc) async for doc in cursor])
+        response.headers["X-Total-Count"] = str(total)
+        response.vary.add("Accept")
+        return response, 200
+
+    except Exception as e:
+        logger.error(f"Failed to list analyzed asteroids: {e}")
+        return jsonify({"error": "Internal server error"}), 500
+
+
+@async_events_bp.route("/events", methods=["GET"])
+async def event_feed():
+    # Same feed as the sync route, without holding a thread per client
+    broker = current_app.extensions["events"]
+    events: asyncio.Queue = asyncio.Queue(maxsize=1000)
+    subscription = broker.subscribe(
+        Subscription.for_event_loop(asyncio.get_running_loop(), events)
+    )
+    logger.info(f"Event feed client connected ({broker.subscriber_count()} total, async)")
+
+    async def stream():
+        try:
+            yield "retry: 3000\n\n"
+            yield format_sse({"type": "hello", "mode": broker.mode})
+            while True:
+                try:
+                    event = await asyncio.wait_for(events.get(), timeout=EVENTS_KEEPALIVE)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                yield format_sse(event)
+        finally:
+            broker.unsubscribe(subscription)
+            logger.info("Event feed client disconnected (async)")
+
+    response = await make_response(stream(), SSE_HEADERS)
+    response.mimetype = "text/event-stream"
+    response.timeout = None
+    return response
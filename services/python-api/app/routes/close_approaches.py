@@ -0,0 +1,77 @@
+from datetime import datetime, timedelta, timezone
+
+from flask import Blueprint, current_app, jsonify, request
+
+from app.models.close_approach import (
+    CLOSE_APPROACH_SORT_FIELDS,
+    close_approach_filter,
+    serialize_close_approach,
+)
+from app.utils.logger import logger
+
+close_approaches_bp = Blueprint("close_approaches", __name__, url_prefix="/close-approaches")
+
+DEFAULT_WINDOW_DAYS = 7
+MAX_LIMIT = 1000
+
+
+def _parse_datetime(value: str) -> datetime:
+    moment = datetime.fromisoformat(value)
+    return moment if moment.tzinfo else moment.replace(tzinfo=timezone.utc)
+
+
+@close_approaches_bp.route("", methods=["GET"])
+def list_close_approaches():
+    """Approaches in [start, end) (default: the next 7 days), optionally
+    within `max_km`, sorted by `sort` (date, distance, velocity)."""
+    mongo = current_app.extensions.get("mongo")
+    if not mongo:
+        return jsonify({"error": "MongoDB not initialized"}), 500
+
+    try:
+        start_param = request.args.get("start")
+        start = _parse_datetime(start_param) if start_param else datetime.now(timezone.utc)
+        end_param = request.args.get("end")
+        end = _parse_datetime(end_param) if end_param else start + timedelta(days=DEFAULT_WINDOW_DAYS)
+    except ValueError as e:
+        return jsonify({"error": f"Invalid date: {e}"}), 400
+
+    max_km = request.args.get("max_km", type=float)
+    hazardous_param = request.args.get("hazardous")
+    hazardous = None if hazardous_param is None else hazardous_param.lower() == "true"
+    body = request.args.get("body", default="Earth", type=str)
+    sort_by = request.args.get("sort", default="date", type=str)
+    order = request.args.get("order", default="asc", type=str)
+    limit = request.args.get("limit", default=100, type=int)
+    offset = request.args.get("offset", default=0, type=int)
+
+    if end <= start:
+        return jsonify({"error": "end must be after start"}), 400
+    if limit < 1 or limit > MAX_LIMIT:
+        return jsonify({"error": f"limit must be between 1 and {MAX_LIMIT}"}), 400
+    if offset < 0:
+        return jsonify({"error": "offset must be >= 0"}), 400
+    if sort_by not in CLOSE_APPROACH_SORT_FIELDS:
+        return jsonify({"error": f"sort must be one of {', '.join(CLOSE_APPROACH_SORT_FIELDS)}"}), 400
+
+    try:
+        collection = mongo.db["close_approaches"]
+        query = close_approach_filter(start, end, max_km, body, hazardous)
+        direction = -1 if order == "desc" else 1
+
+        cursor = (
+            collection
+            .find(query)
+            .sort([(CLOSE_APPROACH_SORT_FIELDS[sort_by], direction), ("_id", direction)])
+            .skip(offset)
+            .limit(limit)
+        )
+        results = [serialize_close_approach(doc) for doc in cursor]
+
+        response = jsonify(results)
+        response.headers["X-Total-Count"] = str(collection.count_documents(query))
+        return response, 200
+
+    except Exception as e:
+        logger.error(f"Failed to list close approaches: {e}")
+        return jsonify({"error": "Internal server error"}), 500
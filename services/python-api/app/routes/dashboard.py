@@ -0,0 +1,78 @@
+from datetime import datetime, timezone
+
+from flask import Blueprint, Flask, current_app, request
+
+from app.core.config import (
+    DASHBOARD_LOG_TAIL,
+    DASHBOARD_SNAPSHOT_MIN_AGE,
+    DASHBOARD_SNAPSHOT_TTL,
+    DASHBOARD_TOP_RISKS,
+)
+from app.core.rust_client import cached_rust_health
+from app.core.snapshot import SnapshotCache
+from app.routes.logs import read_log_tail
+from app.utils.logger import logger
+
+dashboard_bp = Blueprint("dashboard", __name__, url_prefix="/dashboard")
+
+
+def _top_risks(app: Flask, mongo) -> list[dict]:
+    # From the in-memory leaderboard once loaded; same rows as Mongo's sort
+    leaderboard = app.extensions.get("risk_leaderboard")
+    if leaderboard is not None and leaderboard.loaded and DASHBOARD_TOP_RISKS <= leaderboard.k:
+        return leaderboard.top(DASHBOARD_TOP_RISKS)
+    return mongo.get_top_risks(DASHBOARD_TOP_RISKS)
+
+
+def _build_snapshot(app: Flask) -> dict:
+    mongo = app.extensions.get("mongo")
+
+    mongodb = "unavailable"
+    stats = {"status": "error", "details": "MongoDB unavailable"}
+    top_risks: list[dict] = []
+
+    if mongo:
+        try:
+            mongo.ping()
+            mongodb = "connected"
+            stats = mongo.get_pipeline_stats()
+            top_risks = _top_risks(app, mongo)
+        except Exception as e:
+            logger.error(f"Failed to build dashboard snapshot: {e}")
+            stats = {"status": "error", "details": str(e)}
+
+    return {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "health": {
+            "status": "healthy" if mongodb == "connected" else "unhealthy",
+            "components": {
+                "mongodb": mongodb,
+                "rust_engine": cached_rust_health(),
+            },
+        },
+        "stats": stats,
+        "top_risks": top_risks,
+        "logs": read_log_tail(DASHBOARD_LOG_TAIL),
+    }
+
+
+@dashboard_bp.record_once
+def _register_snapshot_cache(state) -> None:
+    app = state.app
+    app.extensions["dashboard_snapshot"] = SnapshotCache(
+        DASHBOARD_SNAPSHOT_TTL, lambda: _build_snapshot(app), DASHBOARD_SNAPSHOT_MIN_AGE
+    )
+
+
+@dashboard_bp.route("/snapshot", methods=["GET"])
+def dashboard_snapshot():
+    """Health, stats, top risks and the log tail in one payload.
+
+    The ETag covers everything but the log tail, so a 304 may carry an older
+    tail; GET /logs serves the current one."""
+    snapshot = current_app.extensions["dashboard_snapshot"].get()
+
+    response = current_app.response_class(snapshot.body, mimetype="application/json")
+    response.set_etag(snapshot.etag)
+    response.headers["Cache-Control"] = "no-cache"
+    return response.make_conditional(request)
@@ -0,0 +1,64 @@
+import queue
+
+from flask import Blueprint, Response, current_app
+
+from app.core.config import EVENTS_KEEPALIVE, EVENTS_POLL_INTERVAL
+from app.core.events import EventBroker
+from app.utils.json_provider import dumps
+from app.utils.logger import logger
+
+events_bp = Blueprint("events", __name__)
+
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    # Keep reverse proxies from buffering the stream
+    "X-Accel-Buffering": "no",
+}
+
+
+def format_sse(event: dict) -> str:
+    return f"event: {event['type']}\ndata: {dumps(event).decode()}\n\n"
+
+
+@events_bp.record_once
+def _register_event_broker(state) -> None:
+    app = state.app
+    broker = EventBroker(app.extensions["mongo"], EVENTS_POLL_INTERVAL)
+    leaderboard = app.extensions.get("risk_leaderboard")
+    if leaderboard is not None:
+        # Analyses inserted by other processes (pipeline workers); first, so
+        # a snapshot rebuilt after this event ranks them. The watcher is
+        # started for it with the other background services
+        broker.add_listener(leaderboard.offer_event)
+    snapshot = app.extensions.get("dashboard_snapshot")
+    if snapshot is not None:
+        # Dashboards refresh right after an event; rebuild the snapshot early
+        # (coalesced: at most once per DASHBOARD_SNAPSHOT_MIN_AGE)
+        broker.add_listener(lambda event: snapshot.invalidate())
+    app.extensions["events"] = broker
+
+
+@events_bp.route("/events", methods=["GET"])
+def event_feed():
+    """Server-sent events for inserts and updates on asteroid_analyses and
+    asteroids_raw. Holds one server thread per connected client."""
+    broker: EventBroker = current_app.extensions["events"]
+    subscription = broker.subscribe()
+    logger.info(f"Event feed client connected ({broker.subscriber_count()} total)")
+
+    def stream():
+        try:
+            yield "retry: 3000\n\n"
+            yield format_sse({"type": "hello", "mode": broker.mode})
+            while True:
+                try:
+                    event = subscription.get(timeout=EVENTS_KEEPALIVE)
+                except queue.Empty:
+                    yield ": keepalive\n\n"
+                    continue
+                yield format_sse(event)
+        finally:
+            broker.unsubscribe(subscription)
+            logger.info("Event feed client disconnected")
+
+    return Response(stream(), mimetype="text/event-stream", headers=SSE_HEADERS)
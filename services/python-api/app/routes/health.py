@@ -0,0 +1,40 @@
+from flask import Blueprint, current_app, jsonify
+
+from app.core.rust_client import cached_rust_health
+from app.utils.logger import logger
+
+health_bp = Blueprint("health", __name__)
+
+
+@health_bp.route("/healthz", methods=["GET"])
+def healthz():
+    # Liveness: the process serves requests, nothing else is checked
+    return jsonify({"status": "ok"}), 200
+
+
+@health_bp.route("/readyz", methods=["GET"])
+def readyz():
+    mongo = current_app.extensions.get("mongo")
+
+    mongodb = "unavailable"
+    if mongo:
+        try:
+            mongo.ping()
+            mongodb = "ready" if mongo.is_ready() else "initializing"
+        except Exception as e:
+            logger.warning(f"Readiness check: MongoDB ping failed: {e}")
+
+    # Reads are served without the engine, so it is reported but not required
+    ready = mongodb == "ready"
+    return (
+        jsonify(
+            {
+                "status": "ready" if ready else "not_ready",
+                "components": {
+                    "mongodb": mongodb,
+                    "rust_engine": cached_rust_health(),
+                },
+            }
+        ),
+        200 if ready else 503,
+    )
@@ -29,6 +29,31 @@ def _parse_log_line(line: str) -> Dict[str, str]:
     }
 
 
+def read_log_tail(limit: int = 20, chunk_size: int = 64 * 1024) -> List[Dict[str, str]]:
+    """Last `limit` entries, newest first, reading backwards from the end of
+    the file instead of parsing all of it."""
+    log_path = os.path.join(LOG_DIRECTORY, "python_api.log")
+    if not os.path.exists(log_path) or limit <= 0:
+        return []
+
+    with open(log_path, "rb") as fh:
+        fh.seek(0, os.SEEK_END)
+        position = fh.tell()
+        data = b""
+        # One extra line: the first one in the buffer may be cut in half
+        while position > 0 and data.count(b"\n") <= limit:
+            step = min(chunk_size, position)
+            position -= step
+            fh.seek(position)
+            data = fh.read(step) + data
+
+    lines = [line for line in data.decode("utf-8", errors="ignore").splitlines() if line.strip()]
+    if position > 0:
+        lines = lines[1:]
+
+    return [_parse_log_line(line) for line in reversed(lines[-limit:])]
+
+
 def _read_log_file(limit: int = 100, level: Optional[str] = None, query: Optional[str] = None) -> List[Dict[str, str]]:
     log_path = os.path.join(LOG_DIRECTORY, "python_api.log")
     if not os.path.exists(log_path):
@@ -65,7 +90,10 @@ def recent_logs():
     level = request.args.get("level", default=None, type=str)
     query = request.args.get("query", default=None, type=str)
 
-    logs = _read_log_file(limit=limit, level=level, query=query)
-    logs.reverse()
+    if level or query:
+        logs = _read_log_file(limit=limit, level=level, query=query)
+        logs.reverse()
+    else:
+        logs = read_log_tail(limit=limit)
 
     return jsonify(logs), 200
@@ -1,11 +1,51 @@
-from flask import Blueprint, jsonify, request, current_app
-from requests.exceptions import RequestException
+import mimetypes
+from datetime import date, datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
 
-from app.core.nasa_client import get_neo_feed
+from flask import Blueprint, Response, jsonify, redirect, request, current_app, send_file
+from requests.exceptions import HTTPError, RequestException
+
+from app.core.blob_store import BlobStore, Prefetcher
+from app.core.config import (
+    APOD_BLOB_DIR,
+    APOD_BLOB_MAX_BYTES,
+    APOD_MAX_RANGE_DAYS,
+    APOD_MEDIA_MAX_BYTES,
+    APOD_PREFETCH,
+    APOD_PREFETCH_QUEUE,
+    APOD_RECENT_TTL,
+)
+from app.core.nasa_client import download_media, get_apod, get_apod_range, get_neo_feed
 from app.utils.logger import logger
+from app.utils.ndjson import NDJSON_MIMETYPE, ndjson_lines, wants_ndjson
 
 nasa_bp = Blueprint("nasa", __name__, url_prefix="/nasa")
 
+APOD_FIRST_DATE = date(1995, 6, 16)
+# APOD days change at midnight US Eastern, hours after UTC
+APOD_TIMEZONE = ZoneInfo("America/New_York")
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+@nasa_bp.record_once
+def _register_apod_prefetcher(state) -> None:
+    if APOD_PREFETCH:
+        store = BlobStore(APOD_BLOB_DIR, APOD_BLOB_MAX_BYTES)
+        state.app.extensions["apod_media"] = Prefetcher(
+            store, lambda url: download_media(url, APOD_MEDIA_MAX_BYTES), APOD_PREFETCH_QUEUE
+        )
+
+
+def feed_records(feed: dict):
+    """The asteroids of a NASA feed one by one, each with its `feed_date`.
+
+    Dates are dropped from the feed once streamed, so their serialized and
+    parsed forms are never held together."""
+    by_date = feed.get("near_earth_objects", {})
+    for feed_date in sorted(by_date):
+        for asteroid in by_date.pop(feed_date):
+            yield {**asteroid, "feed_date": feed_date}
+
 
 @nasa_bp.route("/neo/feed", methods=["GET"])
 def neo_feed():
@@ -18,7 +58,12 @@ def neo_feed():
         data = get_neo_feed(start_date=start_date, end_date=end_date)
 
         logger.info("Returning response for /nasa/neo/feed")
-        return jsonify(data), 200
+        if wants_ndjson(request.accept_mimetypes):
+            response = Response(ndjson_lines(feed_records(data)), mimetype=NDJSON_MIMETYPE)
+        else:
+            response = jsonify(data)
+        response.vary.add("Accept")
+        return response, 200
 
     except RequestException as e:
         logger.error(f"NASA API network error: {e}")
@@ -70,3 +115,209 @@ def save_neo_data():
     except Exception as e:
         logger.critical(f"Unexpected error in /nasa/neo/save: {e}")
         return jsonify({"error": "Internal server error"}), 500
+
+
+def apod_today() -> date:
+    """NASA's current APOD date; later dates are answered with 400."""
+    return datetime.now(APOD_TIMEZONE).date()
+
+
+def _is_final(day: date) -> bool:
+    # Days before NASA's current one are published and never change
+    return day < apod_today()
+
+
+def _is_fresh(cached: dict | None) -> bool:
+    if cached is None:
+        return False
+    if cached["final"]:
+        return True
+    fetched_at = cached["fetched_at"]
+    if fetched_at.tzinfo is None:
+        fetched_at = fetched_at.replace(tzinfo=timezone.utc)
+    return datetime.now(timezone.utc) - fetched_at < timedelta(seconds=APOD_RECENT_TTL)
+
+
+def _missing_runs(days: list[str], missing: set[str]) -> list[tuple[str, str]]:
+    """(first, last) of each run of consecutive `days` that are `missing`."""
+    runs = []
+    run_start = None
+    for i, day in enumerate(days):
+        if day in missing:
+            if run_start is None:
+                run_start = day
+            if i + 1 == len(days) or days[i + 1] not in missing:
+                runs.append((run_start, day))
+                run_start = None
+    return runs
+
+
+def _fetch_apod_run(first: str, last: str) -> list[dict]:
+    if first != last:
+        return get_apod_range(first, last)
+    try:
+        return [get_apod(first)]
+    except HTTPError as e:
+        # Today's APOD before it is published: no entry yet, not an upstream failure
+        if e.response is not None and e.response.status_code == 404:
+            logger.info(f"NASA has no APOD for {first} yet")
+            return []
+        raise
+
+
+def _apod_entries(mongo, start: date, end: date) -> tuple[list[dict], bool]:
+    """APOD entries for [start, end] (dates without one are left out) and
+    whether all of them are final. Only dates missing from the Mongo cache
+    are fetched, one request per run of consecutive missing dates."""
+    days = [(start + timedelta(days=n)).isoformat() for n in range((end - start).days + 1)]
+    cached = mongo.get_apod_entries(days)
+    missing = [day for day in days if not _is_fresh(cached.get(day))]
+
+    if missing:
+        by_date: dict[str, dict | None] = {}
+        for first, last in _missing_runs(days, set(missing)):
+            by_date.update((entry["date"], entry) for entry in _fetch_apod_run(first, last))
+        # Dates NASA has no entry for are cached too, so they are not asked again
+        for day in missing:
+            by_date.setdefault(day, None)
+        final = {day: _is_final(date.fromisoformat(day)) for day in by_date}
+        mongo.save_apod_entries(by_date, final)
+        for day, entry in by_date.items():
+            cached[day] = {"entry": entry, "final": final[day]}
+
+    entries = [cached[day]["entry"] for day in days if cached.get(day) and cached[day]["entry"]]
+    all_final = all(cached[day]["final"] for day in days if day in cached)
+    return entries, all_final
+
+
+def _prefetch_media(entries: list[dict]) -> None:
+    prefetcher = current_app.extensions.get("apod_media")
+    if prefetcher is None:
+        return
+    for entry in entries:
+        if entry.get("media_type") == "image" and entry.get("url"):
+            prefetcher.submit(entry["url"])
+
+
+def _cache_control(final: bool) -> str:
+    return IMMUTABLE_CACHE_CONTROL if final else f"public, max-age={int(APOD_RECENT_TTL)}"
+
+
+def _cacheable(response, final: bool):
+    response.headers["Cache-Control"] = _cache_control(final)
+    response.add_etag()
+    return response.make_conditional(request)
+
+
+def _parse_apod_date(value: str) -> date:
+    day = date.fromisoformat(value)
+    if not APOD_FIRST_DATE <= day <= apod_today():
+        raise ValueError(f"{value} is outside {APOD_FIRST_DATE.isoformat()}..today")
+    return day
+
+
+@nasa_bp.route("/apod", methods=["GET"])
+def apod():
+    """Astronomy Picture of the Day: the latest one, `date`, or every entry
+    from `start_date` to `end_date` (a list).
+
+    Past entries are served from the Mongo cache with immutable cache
+    headers; only dates never fetched before reach NASA."""
+    logger.info("Received request: GET /nasa/apod")
+
+    mongo = current_app.extensions.get("mongo")
+    if not mongo:
+        return jsonify({"error": "MongoDB not initialized"}), 500
+
+    date_param = request.args.get("date")
+    start_param = request.args.get("start_date")
+    end_param = request.args.get("end_date")
+
+    try:
+        if start_param:
+            start = _parse_apod_date(start_param)
+            end = _parse_apod_date(end_param) if end_param else apod_today()
+            if end < start:
+                raise ValueError("end_date must not be before start_date")
+            if (end - start).days >= APOD_MAX_RANGE_DAYS:
+                raise ValueError(f"range exceeds {APOD_MAX_RANGE_DAYS} days")
+        elif date_param:
+            start = end = _parse_apod_date(date_param)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    try:
+        if start_param:
+            entries, final = _apod_entries(mongo, start, end)
+            _prefetch_media(entries)
+            return _cacheable(jsonify(entries), final)
+
+        if date_param:
+            entries, final = _apod_entries(mongo, start, end)
+        else:
+            cached = mongo.get_latest_apod(APOD_RECENT_TTL)
+            if cached is not None:
+                entries, final = [cached["entry"]], False
+            else:
+                entry = get_apod()
+                mongo.save_apod_entries(
+                    {entry["date"]: entry}, {entry["date"]: _is_final(date.fromisoformat(entry["date"]))}, latest=True
+                )
+                entries, final = [entry], False
+
+        if not entries:
+            return jsonify({"error": f"No APOD for {date_param}"}), 404
+        _prefetch_media(entries)
+        return _cacheable(jsonify(entries[0]), final)
+
+    except HTTPError as e:
+        logger.error(f"NASA APOD request rejected: {e}")
+        return jsonify({"error": "NASA API rejected the request", "details": str(e)}), 502
+
+    except RequestException as e:
+        logger.error(f"NASA API network error: {e}")
+        return jsonify({"error": "Failed to connect to NASA API", "details": str(e)}), 503
+
+    except Exception as e:
+        logger.critical(f"Unexpected error in /nasa/apod: {e}")
+        return jsonify({"error": "Internal server error"}), 500
+
+
+@nasa_bp.route("/apod/<apod_date>/media", methods=["GET"])
+def apod_media(apod_date: str):
+    """The image of an APOD from the local blob store, or a redirect to
+    NASA while it is not stored (the download is queued)."""
+    mongo = current_app.extensions.get("mongo")
+    if not mongo:
+        return jsonify({"error": "MongoDB not initialized"}), 500
+
+    try:
+        day = _parse_apod_date(apod_date)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    try:
+        entries, final = _apod_entries(mongo, day, day)
+        if not entries or entries[0].get("media_type") != "image":
+            return jsonify({"error": f"No APOD image for {apod_date}"}), 404
+
+        url = entries[0]["url"]
+        prefetcher = current_app.extensions.get("apod_media")
+        path = prefetcher.store.get(url) if prefetcher else None
+        if path is None:
+            if prefetcher:
+                prefetcher.submit(url)
+            return redirect(url, code=302)
+
+        # send_file answers If-None-Match / If-Modified-Since itself
+        response = send_file(path, mimetype=mimetypes.guess_type(url)[0] or "application/octet-stream")
+        response.headers["Cache-Control"] = _cache_control(final)
+        return response
+
+    except RequestException as e:
+        logger.error(f"NASA API network error: {e}")
+        return jsonify({"error": "Failed to connect to NASA API", "details": str(e)}), 503
+
+    except Exception as e:
+        logger.critical(f"Unexpected error in /nasa/apod/{apod_date}/media: {e}")
+        return jsonify({"error": "Internal server error"}), 500
@@ -0,0 +1,169 @@
+from datetime import date, datetime, timedelta, timezone
+
+from flask import Blueprint, current_app, jsonify, request
+from requests.exceptions import HTTPError, RequestException
+
+from app.core.config import ORBIT_BLOCK_SIZE, ORBIT_LOOKUP_LIMIT, ORBIT_MAX_EPOCHS, ORBIT_MAX_IDS
+from app.core.nasa_client import get_neo_lookup
+from app.utils.logger import logger
+
+orbits_bp = Blueprint("orbits", __name__, url_prefix="/orbits")
+
+DEFAULT_WINDOW_DAYS = 365
+
+
+def _parse_window(params) -> tuple[date, date, float]:
+    """start/end (YYYY-MM-DD, default: the next year) and step_days."""
+    # Epochs are UTC Julian dates
+    start = date.fromisoformat(params.get("start") or datetime.now(timezone.utc).date().isoformat())
+    end_param = params.get("end")
+    end = date.fromisoformat(end_param) if end_param else start + timedelta(days=DEFAULT_WINDOW_DAYS)
+    step_days = float(params.get("step_days", 1.0))
+
+    if end <= start:
+        raise ValueError("end must be after start")
+    if step_days <= 0:
+        raise ValueError("step_days must be positive")
+    if (end - start).days / step_days > ORBIT_MAX_EPOCHS:
+        raise ValueError(f"window / step_days exceeds {ORBIT_MAX_EPOCHS} epochs")
+    return start, end, step_days
+
+
+def _load_elements(mongo, asteroid_ids: list[str]) -> tuple[dict, dict]:
+    """Elements per asteroid id from stored raw docs, falling back to a NASA
+    lookup (cached on the raw doc) for up to ORBIT_LOOKUP_LIMIT ids.
+
+    Returns (elements by id, error by id)."""
+    from app.models.orbit import OrbitalElements
+
+    stored = mongo.get_orbital_data(asteroid_ids)
+    elements: dict = {}
+    errors: dict = {}
+    lookups = 0
+
+    for asteroid_id in asteroid_ids:
+        orbital_data = stored.get(asteroid_id)
+        if orbital_data is None:
+            if lookups >= ORBIT_LOOKUP_LIMIT:
+                errors[asteroid_id] = "no stored orbital data (lookup limit reached)"
+                continue
+            lookups += 1
+            try:
+                lookup = get_neo_lookup(asteroid_id)
+            except HTTPError as e:
+                errors[asteroid_id] = f"NASA lookup failed: {e}"
+                continue
+            # The lookup lists every known approach, the feed only one
+            mongo.save_close_approaches(lookup)
+            orbital_data = lookup.get("orbital_data")
+            if not orbital_data:
+                errors[asteroid_id] = "NASA lookup has no orbital data"
+                continue
+            mongo.save_orbital_data(asteroid_id, orbital_data)
+
+        try:
+            elements[asteroid_id] = OrbitalElements.from_nasa(orbital_data)
+        except ValueError as e:
+            errors[asteroid_id] = str(e)
+
+    return elements, errors
+
+
+def _closest_approaches(elements: dict, start: date, end: date, step_days: float) -> list[dict]:
+    from app.models.orbit import AU_KM, from_julian_date, julian_date, min_earth_distance
+
+    ids = list(elements)
+    distance_au, at_jd = min_earth_distance(
+        [elements[i] for i in ids],
+        julian_date(start),
+        julian_date(end),
+        step_days,
+        block_size=ORBIT_BLOCK_SIZE,
+    )
+    return [
+        {
+            "id": asteroid_id,
+            "min_distance_au": float(au),
+            "min_distance_km": float(au * AU_KM),
+            "closest_at": from_julian_date(float(jd)).isoformat(),
+        }
+        for asteroid_id, au, jd in zip(ids, distance_au, at_jd)
+    ]
+
+
+@orbits_bp.route("/<asteroid_id>/min-distance", methods=["GET"])
+def asteroid_min_distance(asteroid_id: str):
+    logger.info(f"Received request: GET /orbits/{asteroid_id}/min-distance")
+
+    mongo = current_app.extensions.get("mongo")
+    if not mongo:
+        return jsonify({"error": "MongoDB not initialized"}), 500
+
+    try:
+        start, end, step_days = _parse_window(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    try:
+        elements, errors = _load_elements(mongo, [asteroid_id])
+        if asteroid_id not in elements:
+            return jsonify({"error": "Orbital elements unavailable", "details": errors[asteroid_id]}), 404
+
+        result = _closest_approaches(elements, start, end, step_days)[0]
+        result["elements"] = elements[asteroid_id].to_dict()
+        return jsonify(result), 200
+
+    except RequestException as e:
+        logger.error(f"NASA API network error: {e}")
+        return jsonify({"error": "Failed to connect to NASA API", "details": str(e)}), 503
+
+    except Exception as e:
+        logger.critical(f"Unexpected error propagating orbit of {asteroid_id}: {e}")
+        return jsonify({"error": "Internal server error"}), 500
+
+
+@orbits_bp.route("/min-distance", methods=["POST"])
+def batch_min_distance():
+    """Minimum Earth distance of many asteroids over one window.
+
+    Body: {"ids": [...] (at most ORBIT_MAX_IDS), "start", "end", "step_days"}. Results are sorted
+    closest first; ids without usable elements are listed under `errors`."""
+    logger.info("Received request: POST /orbits/min-distance")
+
+    mongo = current_app.extensions.get("mongo")
+    if not mongo:
+        return jsonify({"error": "MongoDB not initialized"}), 500
+
+    body = request.get_json(silent=True) or {}
+    asteroid_ids = body.get("ids")
+    if not isinstance(asteroid_ids, list) or not asteroid_ids:
+        return jsonify({"error": "ids must be a non-empty list"}), 400
+    asteroid_ids = list(dict.fromkeys(str(i) for i in asteroid_ids))
+    if len(asteroid_ids) > ORBIT_MAX_IDS:
+        return jsonify({"error": f"ids exceeds {ORBIT_MAX_IDS} asteroids"}), 400
+
+    try:
+        start, end, step_days = _parse_window(body)
+    except (TypeError, ValueError) as e:
+        return jsonify({"error": str(e)}), 400
+
+    try:
+        elements, errors = _load_elements(mongo, asteroid_ids)
+        results = _closest_approaches(elements, start, end, step_days) if elements else []
+        results.sort(key=lambda row: row["min_distance_au"])
+
+        return jsonify({
+            "start": start.isoformat(),
+            "end": end.isoformat(),
+            "step_days": step_days,
+            "results": results,
+            "errors": errors,
+        }), 200
+
+    except RequestException as e:
+        logger.error(f"NASA API network error: {e}")
+        return jsonify({"error": "Failed to connect to NASA API", "details": str(e)}), 503
+
+    except Exception as e:
+        logger.critical(f"Unexpected error in batch orbit propagation: {e}")
+        return jsonify({"error": "Internal server error"}), 500
@@ -1,13 +1,36 @@
-from flask import Blueprint, jsonify, request
+from datetime import date, datetime, timedelta, timezone
+
+from flask import Blueprint, Response, jsonify, request
 from requests.exceptions import RequestException
 from flask import current_app
-from datetime import datetime, timezone
+from app.core.config import LEADERBOARD_SIZE, LEADERBOARD_VERIFY_INTERVAL
+from app.core.leaderboard import RiskLeaderboard
+from app.core.lease import LeaseHeldError
 from app.core.pipeline import AnalysisPipeline
-from app.core.rust_client import check_rust_health
+from app.core.rust_client import cached_rust_health, rust_client_status
+from app.models.analysis_result import (
+    analysis_page_error,
+    analysis_search_filter,
+    analysis_sort_spec,
+    flatten_analysis,
+)
+from app.models.risk_rollup import HISTOGRAM_INTERVALS, build_histogram
 from app.utils.logger import logger
+from app.utils.ndjson import NDJSON_MIMETYPE, ndjson_lines, wants_ndjson
 
 orchestration_bp = Blueprint("orchestration", __name__, url_prefix="/pipeline")
 
+
+@orchestration_bp.record_once
+def _register_leaderboard(state) -> None:
+    app = state.app
+    mongo = app.extensions["mongo"]
+    leaderboard = RiskLeaderboard(mongo, LEADERBOARD_SIZE, LEADERBOARD_VERIFY_INTERVAL)
+    # Results this process writes enter the ranking as they are persisted
+    mongo.add_analysis_listener(leaderboard.offer)
+    app.extensions["risk_leaderboard"] = leaderboard
+
+
 @orchestration_bp.route("/neo/analyze", methods=["POST"])
 def analyze_neo_pipeline():
     logger.info("Received request: POST /pipeline/neo/analyze")
@@ -18,7 +41,20 @@ def analyze_neo_pipeline():
         return jsonify({"error": "limit must be between 1 and 1000"}), 400
 
     try:
-        stats = AnalysisPipeline.analyze_unprocessed_asteroids(limit=limit)
+        # Same lease as the scheduler: one run at a time across all processes
+        with current_app.extensions["pipeline_lease"].hold():
+            stats = AnalysisPipeline.analyze_unprocessed_asteroids(limit=limit)
+
+        if stats["aborted"]:
+            return (
+                jsonify(
+                    {
+                        "error": "Rust Engine unavailable, remaining asteroids deferred",
+                        "statistics": stats,
+                    }
+                ),
+                503,
+            )
 
         logger.info(f"Pipeline completed successfully: {stats}")
 
@@ -29,6 +65,18 @@ def analyze_neo_pipeline():
             }
         ), 200
 
+    except LeaseHeldError as e:
+        logger.warning(f"Pipeline run rejected: {e}")
+        return (
+            jsonify(
+                {
+                    "error": "A pipeline run is already in progress",
+                    "holder": e.holder,
+                }
+            ),
+            409,
+        )
+
     except RuntimeError as e:
         logger.error(f"Pipeline initialization error: {e}")
         return (
@@ -106,11 +154,13 @@ def analyze_single_neo(asteroid_id: str):
 
 @orchestration_bp.route("/status", methods=["GET"])
 def pipeline_status():
+    """Component status from a Mongo ping and the cached engine health.
+
+    `?include=stats` adds the pipeline statistics so a dashboard refresh
+    needs a single call."""
     logger.info("Received request: GET /pipeline/status")
 
     try:
-        from flask import current_app
-
         mongo = current_app.extensions.get("mongo")
 
         if not mongo:
@@ -124,28 +174,44 @@ def pipeline_status():
                 503,
             )
 
-        mongo.get_unprocessed_asteroids(limit=1)
-        
-        # Check Rust Engine health
-        rust_status = check_rust_health()
+        mongo.ping()
 
-        return (
-            jsonify(
-                {
-                    "status": "healthy",
-                    "components": {
-                        "mongodb": "connected",
-                        "rust_engine": rust_status,
-                    },
-                }
-            ),
-            200,
-        )
+        payload = {
+            "status": "healthy",
+            "components": {
+                "mongodb": "connected",
+                "rust_engine": cached_rust_health(),
+            },
+            "rust_client": rust_client_status(),
+        }
+
+        if request.args.get("include") == "stats":
+            try:
+                payload["stats"] = mongo.get_pipeline_stats()
+            except Exception as e:
+                logger.error(f"Failed to compute pipeline stats: {e}")
+                payload["stats"] = {"status": "error", "details": str(e)}
+
+        return jsonify(payload), 200
 
     except Exception as e:
         logger.error(f"Pipeline status check failed: {e}")
         return jsonify({"status": "unhealthy", "error": str(e)}), 503
 
+@orchestration_bp.route("/schedule", methods=["GET"])
+def pipeline_schedule():
+    lease = current_app.extensions["pipeline_lease"]
+    scheduler = current_app.extensions.get("pipeline_scheduler")
+
+    payload = scheduler.status() if scheduler else {"schedule": None}
+    try:
+        payload["running"] = lease.holder()
+    except Exception as e:
+        logger.error(f"Failed to read pipeline lease: {e}")
+        payload["running"] = None
+
+    return jsonify(payload), 200
+
 @orchestration_bp.route("/stats", methods=["GET"])
 def pipeline_stats():
     
@@ -156,37 +222,7 @@ def pipeline_stats():
         return jsonify({"status": "error", "reason": "MongoDB not initialized"}), 500
 
     try:
-        raw_collection = mongo.db["asteroids_raw"]
-        analysis_collection = mongo.db["asteroid_analyses"]
-
-        unprocessed_count = raw_collection.count_documents({})
-
-        analyzed_today = analysis_collection.count_documents({
-            "analysis_timestamp": {
-                "$gte": datetime.now(timezone.utc).replace(
-                    hour=0, minute=0, second=0, microsecond=0
-                )
-            }
-        })
-
-        high_risk_count = analysis_collection.count_documents({
-            "risk_data.risk_level": {"$in": ["High", "Critical"]}
-        })
-
-        last_run = analysis_collection.find_one(
-            sort=[("analysis_timestamp", -1)]
-        )
-
-        return jsonify({
-            "status": "ok",
-            "unprocessed": unprocessed_count,
-            "analyzed_today": analyzed_today,
-            "high_risks": high_risk_count,
-            "last_pipeline_run": (
-                last_run["analysis_timestamp"].isoformat()
-                if last_run else None
-            ),
-        }), 200
+        return jsonify(mongo.get_pipeline_stats()), 200
 
     except Exception as e:
         logger.error(f"Failed to compute pipeline stats: {e}")
@@ -200,45 +236,154 @@ def list_analyzed_asteroids():
         return jsonify({"error": "MongoDB not initialized"}), 500
 
     limit = request.args.get("limit", default=200, type=int)
+    offset = request.args.get("offset", default=0, type=int)
     sort_by = request.args.get("sort", default="risk_score", type=str)
     order = request.args.get("order", default="desc", type=str)
+    query = analysis_search_filter(request.args.get("q", type=str))
+
+    streamed = wants_ndjson(request.accept_mimetypes)
+    error = analysis_page_error(limit, offset, streamed)
+    if error:
+        return jsonify({"error": error}), 400
 
     try:
         collection = mongo.db["asteroid_analyses"]
 
-        sort_field = {
-            "risk": "risk_data.risk_score_0_to_100",
-            "energy": "risk_data.impact_energy_megatons",
-            "date": "analysis_timestamp",
-        }.get(sort_by, "risk_data.risk_score_0_to_100")
-
-        sort_dir = -1 if order == "desc" else 1
-
         cursor = (
             collection
-            .find({}, {"_id": 0})
-            .sort(sort_field, sort_dir)
+            .find(query, {"_id": 0})
+            .sort(analysis_sort_spec(sort_by, order))
+            .skip(offset)
             .limit(limit)
         )
+        # Unfiltered totals come from collection metadata instead of a count scan
+        total = collection.count_documents(query) if query else collection.estimated_document_count()
 
-        results = []
-        for doc in cursor:
-            risk = doc["risk_data"]
-            results.append({
-                "id": doc["neo_reference_id"],
-                "name": risk["asteroid_name"],
-                "risk_level": risk["risk_level"],
-                "risk_score": risk["risk_score_0_to_100"],
-                "energy_mt": risk["impact_energy_megatons"],
-                "distance_km": risk["miss_distance_km"],
-                "diameter_km": risk["diameter_km"],
-                "velocity_kps": risk["velocity_kps"],
-                "hazardous": risk["is_potentially_hazardous"],
-                "analyzed_at": doc["analysis_timestamp"].isoformat(),
-            })
-
-        return jsonify(results), 200
+        if streamed:
+            # Rows are serialized one at a time as the cursor yields them
+            response = Response(
+                ndjson_lines(flatten_analysis(doc) for doc in cursor), mimetype=NDJSON_MIMETYPE
+            )
+        else:
+            response = jsonify([flatten_analysis(doc) for doc in cursor])
+        response.headers["X-Total-Count"] = str(total)
+        response.vary.add("Accept")
+        return response, 200
 
     except Exception as e:
         logger.error(f"Failed to list analyzed asteroids: {e}")
         return jsonify({"error": "Internal server error"}), 500
+
+
+@orchestration_bp.route("/analysis/top", methods=["GET"])
+def top_analyzed_asteroids():
+    """Highest risk scores first, from the in-memory leaderboard.
+
+    `verify=true` first compares it with MongoDB (rebuilding on mismatch)
+    and reports the check under `consistency`."""
+    leaderboard: RiskLeaderboard = current_app.extensions["risk_leaderboard"]
+
+    limit = request.args.get("limit", default=leaderboard.k, type=int)
+    verify = request.args.get("verify", default="false").lower() == "true"
+
+    if limit < 1 or limit > leaderboard.k:
+        return jsonify({"error": f"limit must be between 1 and {leaderboard.k}"}), 400
+
+    try:
+        if not leaderboard.loaded:
+            # First request before the background load finished
+            leaderboard.rebuild()
+
+        consistency = leaderboard.verify() if verify else None
+        payload = {
+            "results": leaderboard.top(limit),
+            "k": leaderboard.k,
+            "loaded_at": leaderboard.loaded_at.isoformat(),
+        }
+        if consistency is not None:
+            payload["consistency"] = consistency
+        return jsonify(payload), 200
+
+    except Exception as e:
+        logger.error(f"Failed to read risk leaderboard: {e}")
+        return jsonify({"error": "Internal server error"}), 500
+
+
+HISTOGRAM_DEFAULT_DAYS = 30
+HISTOGRAM_MAX_DAYS = 3660
+
+
+def _parse_day_range(params) -> tuple[date, date]:
+    """start/end (YYYY-MM-DD, inclusive; default: the last 30 days)."""
+    # Rollups are keyed by UTC day, whatever the host's timezone
+    end = date.fromisoformat(params.get("end") or datetime.now(timezone.utc).date().isoformat())
+    start_param = params.get("start")
+    start = date.fromisoformat(start_param) if start_param else end - timedelta(days=HISTOGRAM_DEFAULT_DAYS - 1)
+
+    if end < start:
+        raise ValueError("end must not be before start")
+    if (end - start).days >= HISTOGRAM_MAX_DAYS:
+        raise ValueError(f"range exceeds {HISTOGRAM_MAX_DAYS} days")
+    return start, end
+
+
+@orchestration_bp.route("/analysis/histogram", methods=["GET"])
+def analysis_histogram():
+    """Analyses per day, week or month (`interval`) between `start` and
+    `end`, optionally for some risk levels (`levels=High,Critical`).
+
+    Served from the `risk_rollups` day x level documents; no analysis is read."""
+    mongo = current_app.extensions.get("mongo")
+    if not mongo:
+        return jsonify({"error": "MongoDB not initialized"}), 500
+
+    interval = request.args.get("interval", default="day", type=str)
+    levels_param = request.args.get("levels", type=str)
+    levels = [level.strip() for level in levels_param.split(",") if level.strip()] if levels_param else None
+
+    if interval not in HISTOGRAM_INTERVALS:
+        return jsonify({"error": f"interval must be one of {', '.join(HISTOGRAM_INTERVALS)}"}), 400
+    try:
+        start, end = _parse_day_range(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    try:
+        rollups = mongo.get_risk_rollups(start, end, levels)
+        return jsonify({
+            "start": start.isoformat(),
+            "end": end.isoformat(),
+            "interval": interval,
+            "levels": levels,
+            "buckets": build_histogram(rollups, start, end, interval),
+        }), 200
+
+    except Exception as e:
+        logger.error(f"Failed to build analysis histogram: {e}")
+        return jsonify({"error": "Internal server error"}), 500
+
+
+@orchestration_bp.route("/analysis/rollups/rebuild", methods=["POST"])
+def rebuild_risk_rollups():
+    """Recompute `risk_rollups` from the analyses, for all days or for
+    `start`..`end`."""
+    logger.info("Received request: POST /pipeline/analysis/rollups/rebuild")
+
+    mongo = current_app.extensions.get("mongo")
+    if not mongo:
+        return jsonify({"error": "MongoDB not initialized"}), 500
+
+    try:
+        start_param, end_param = request.args.get("start"), request.args.get("end")
+        start = date.fromisoformat(start_param) if start_param else None
+        end = date.fromisoformat(end_param) if end_param else None
+    except ValueError as e:
+        return jsonify({"error": f"Invalid date: {e}"}), 400
+
+    try:
+        rollups = mongo.rebuild_risk_rollups(start, end)
+        return jsonify({"status": "success", "rollups": rollups}), 200
+
+    except Exception as e:
+        logger.error(f"Failed to rebuild risk rollups: {e}")
+        return jsonify({"error": "Internal server error"}), 500
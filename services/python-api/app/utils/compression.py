@@ -0,0 +1,154 @@
+import zlib
+from typing import AsyncIterator, Callable, Iterable, Iterator
+
+from app.core.config import (
+    COMPRESS_BROTLI_QUALITY,
+    COMPRESS_GZIP_LEVEL,
+    COMPRESS_MIN_BYTES,
+    COMPRESS_RESPONSES,
+)
+
+try:
+    import brotli
+except ImportError:  # optional: only gzip is offered without it
+    brotli = None
+
+# Text bodies only: images, Parquet and send_file responses are left alone,
+# and so are server-sent events, which some proxies buffer when compressed
+COMPRESSIBLE_MIMETYPES = {
+    "application/json",
+    "application/x-ndjson",
+    "text/csv",
+    "text/html",
+    "text/plain",
+}
+
+# Server preference when the client accepts both equally
+ENCODINGS = ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def negotiate(accept_encodings) -> str | None:
+    """The content coding to use for a request's Accept-Encoding, if any."""
+    return accept_encodings.best_match(ENCODINGS)
+
+
+def _compressible(response) -> bool:
+    return (
+        200 <= response.status_code < 300
+        and response.status_code not in (204, 206)
+        and "Content-Encoding" not in response.headers
+        and response.mimetype in COMPRESSIBLE_MIMETYPES
+    )
+
+
+def compress_bytes(data: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(data, quality=COMPRESS_BROTLI_QUALITY)
+    compressor = zlib.compressobj(COMPRESS_GZIP_LEVEL, zlib.DEFLATED, 31)
+    return compressor.compress(data) + compressor.flush()
+
+
+def _stream_encoder(encoding: str) -> tuple[Callable[[bytes], bytes], Callable[[], bytes]]:
+    """(compress a chunk, finish) for a streamed body. Every chunk is flushed
+    so the client can decode each one on arrival, as with the uncompressed
+    stream (see app.utils.ndjson)."""
+    if encoding == "br":
+        compressor = brotli.Compressor(quality=COMPRESS_BROTLI_QUALITY)
+        return lambda chunk: compressor.process(chunk) + compressor.flush(), compressor.finish
+    compressor = zlib.compressobj(COMPRESS_GZIP_LEVEL, zlib.DEFLATED, 31)
+    return lambda chunk: compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH), compressor.flush
+
+
+def _encode(chunk) -> bytes:
+    return chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+
+
+def _compress_stream(chunks: Iterable, encoding: str) -> Iterator[bytes]:
+    compress, finish = _stream_encoder(encoding)
+    try:
+        for chunk in chunks:
+            data = compress(_encode(chunk))
+            if data:
+                yield data
+        yield finish()
+    finally:
+        if hasattr(chunks, "close"):
+            chunks.close()
+
+
+async def _compress_async_stream(body, encoding: str) -> AsyncIterator[bytes]:
+    compress, finish = _stream_encoder(encoding)
+    async with body as chunks:
+        async for chunk in chunks:
+            data = compress(_encode(chunk))
+            if data:
+                yield data
+    yield finish()
+
+
+def _mark_encoded(response, encoding: str) -> None:
+    response.headers["Content-Encoding"] = encoding
+    # The compressed body is another representation: keep ETags matching
+    # (If-None-Match uses weak comparison) without claiming byte equality
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+
+
+def compress_response(response):
+    """Flask after_request hook: gzip/brotli bodies of at least
+    COMPRESS_MIN_BYTES, and streamed bodies chunk by chunk."""
+    from flask import request
+
+    if response.direct_passthrough or not _compressible(response):
+        return response
+    response.vary.add("Accept-Encoding")
+    encoding = negotiate(request.accept_encodings)
+    if encoding is None:
+        return response
+
+    if response.is_streamed:
+        response.response = _compress_stream(response.response, encoding)
+        response.headers.pop("Content-Length", None)
+    else:
+        data = response.get_data()
+        if len(data) < COMPRESS_MIN_BYTES:
+            return response
+        response.set_data(compress_bytes(data, encoding))
+    _mark_encoded(response, encoding)
+    return response
+
+
+async def compress_async_response(response):
+    """The Quart counterpart of `compress_response`."""
+    from quart import request
+
+    if not _compressible(response):
+        return response
+    body = response.response
+    streamed = isinstance(body, response.iterable_body_class)
+    if not streamed and not isinstance(body, response.data_body_class):
+        return response
+    response.vary.add("Accept-Encoding")
+    encoding = negotiate(request.accept_encodings)
+    if encoding is None:
+        return response
+
+    if streamed:
+        response.response = response.iterable_body_class(_compress_async_stream(body, encoding))
+        response.headers.pop("Content-Length", None)
+    else:
+        data = await response.get_data(as_text=False)
+        if len(data) < COMPRESS_MIN_BYTES:
+            return response
+        response.set_data(compress_bytes(data, encoding))
+    _mark_encoded(response, encoding)
+    return response
+
+
+def init_compression(app) -> None:
+    """Register response compression on a Flask or Quart app."""
+    if not COMPRESS_RESPONSES:
+        return
+    is_async = app.__class__.__module__.startswith("quart")
+    app.after_request(compress_async_response if is_async else compress_response)
@@ -0,0 +1,88 @@
+import json
+import uuid
+from datetime import date, datetime
+from decimal import Decimal
+
+from flask.json.provider import JSONProvider
+
+try:
+    import orjson
+except ImportError:  # optional: falls back to the stdlib encoder, same output
+    orjson = None
+
+if orjson is not None:
+    _OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _default(obj):
+    """Types neither encoder handles natively."""
+    if isinstance(obj, Decimal):
+        return str(obj)
+    # ObjectId, Decimal128, ... (bson is loaded lazily, see mongodb.load_driver)
+    if type(obj).__module__.startswith("bson"):
+        return str(obj)
+    if hasattr(obj, "__html__"):
+        return str(obj.__html__())
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _stdlib_default(obj):
+    # What orjson does natively: ISO 8601 dates, UUID strings, numpy values
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    return _default(obj)
+
+
+def dumps(obj, sort_keys: bool = False, indent: bool = False) -> bytes:
+    """Compact UTF-8 JSON; datetimes as ISO 8601, ObjectIds as their hex string."""
+    if orjson is not None:
+        option = _OPTIONS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=_default, option=option)
+    return json.dumps(
+        obj,
+        default=_stdlib_default,
+        sort_keys=sort_keys,
+        indent=2 if indent else None,
+        separators=None if indent else (",", ":"),
+        ensure_ascii=False,
+    ).encode("utf-8")
+
+
+def loads(s: str | bytes):
+    if orjson is not None:
+        return orjson.loads(s)
+    return json.loads(s)
+
+
+class FastJSONProvider(JSONProvider):
+    """`app.json` for the Flask and Quart apps: `jsonify`, `request.get_json`
+    and `flask.json` go through orjson (stdlib json without it).
+
+    Unlike Flask's default provider, keys keep their insertion order and
+    datetimes are ISO 8601 rather than HTTP dates."""
+
+    sort_keys = False
+    compact: bool | None = None
+    mimetype = "application/json"
+
+    def dumps(self, obj, **kwargs) -> str:
+        sort_keys = kwargs.get("sort_keys", self.sort_keys)
+        return dumps(obj, sort_keys=sort_keys, indent=bool(kwargs.get("indent"))).decode()
+
+    def loads(self, s: str | bytes, **kwargs):
+        return loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        # Bytes straight into the response, without a str round trip
+        body = dumps(obj, sort_keys=self.sort_keys, indent=indent) + b"\n"
+        return self._app.response_class(body, mimetype=self.mimetype)
@@ -0,0 +1,64 @@
+from typing import AsyncIterable, AsyncIterator, Iterable, Iterator
+
+from app.utils.json_provider import dumps
+
+NDJSON_MIMETYPE = "application/x-ndjson"
+
+# Lines are sent in chunks of about this size; the first line goes out alone
+# so clients see a row as soon as the cursor yields one
+CHUNK_BYTES = 64 * 1024
+
+
+def wants_ndjson(accept_mimetypes) -> bool:
+    """Whether the request's Accept header prefers NDJSON over JSON."""
+    return accept_mimetypes.best_match(["application/json", NDJSON_MIMETYPE]) == NDJSON_MIMETYPE
+
+
+class _LineEncoder:
+    """Serializes records one per line and batches the lines into chunks,
+    for both the sync and the async stream."""
+
+    def __init__(self):
+        self._chunk: list[bytes] = []
+        self._size = 0
+        self._first = True
+
+    def add(self, record) -> bytes | None:
+        """The record's line, or a full chunk, when one is ready to send."""
+        line = dumps(record) + b"\n"
+        if self._first:
+            self._first = False
+            return line
+        self._chunk.append(line)
+        self._size += len(line)
+        return self.flush() if self._size >= CHUNK_BYTES else None
+
+    def flush(self) -> bytes | None:
+        if not self._chunk:
+            return None
+        data = b"".join(self._chunk)
+        self._chunk, self._size = [], 0
+        return data
+
+
+def ndjson_lines(records: Iterable) -> Iterator[bytes]:
+    """One JSON document per line, serialized as records are pulled."""
+    encoder = _LineEncoder()
+    for record in records:
+        chunk = encoder.add(record)
+        if chunk:
+            yield chunk
+    tail = encoder.flush()
+    if tail:
+        yield tail
+
+
+async def ndjson_lines_async(records: AsyncIterable) -> AsyncIterator[bytes]:
+    encoder = _LineEncoder()
+    async for record in records:
+        chunk = encoder.add(record)
+        if chunk:
+            yield chunk
+    tail = encoder.flush()
+    if tail:
+        yield tail
@@ -0,0 +1,78 @@
+import json
+import re
+import subprocess
+import sys
+
+# `python -X importtime` lines: "import time: <self us> | <cumulative us> | <indent><module>"
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)$")
+
+# Runs in a fresh interpreter so nothing is already imported
+_PROBE = """
+import json, time
+t0 = time.perf_counter()
+import app.main as main
+t1 = time.perf_counter()
+app = main.create_app(preload=True)
+mongo = app.extensions["mongo"]
+mongo.connect()
+t2 = time.perf_counter()
+status = app.test_client().get("/healthz").status_code
+t3 = time.perf_counter()
+ready = mongo.ready.wait(15)
+t4 = time.perf_counter()
+print(json.dumps({
+    "import_app_ms": (t1 - t0) * 1000,
+    "create_app_ms": (t2 - t1) * 1000,
+    "first_request_ms": (t3 - t2) * 1000,
+    "first_request_status": status,
+    "mongo_ready_ms": (t4 - t0) * 1000 if ready else None,
+}))
+"""
+
+
+def _parse_importtime(stderr: str) -> list[dict]:
+    rows = []
+    for line in stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            rows.append({
+                "module": module,
+                "depth": len(indent) // 2,
+                "self_ms": int(self_us) / 1000.0,
+                "cumulative_ms": int(cumulative_us) / 1000.0,
+            })
+    return rows
+
+
+def main(top: int = 20) -> None:
+    """Print a cold-start breakdown of the python-api (startup phases and the
+    slowest imports) measured in a fresh interpreter."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _PROBE],
+        capture_output=True,
+        text=True,
+    )
+    imports = _parse_importtime(proc.stderr)
+    phases_line = next((l for l in reversed(proc.stdout.splitlines()) if l.startswith("{")), None)
+
+    if proc.returncode != 0 or phases_line is None:
+        print("Startup probe failed:", file=sys.stderr)
+        print(proc.stderr[-2000:], file=sys.stderr)
+        sys.exit(1)
+
+    phases = json.loads(phases_line)
+    print("Startup phases")
+    print(f"  import app.main       {phases['import_app_ms']:9.1f} ms")
+    print(f"  create_app + connect  {phases['create_app_ms']:9.1f} ms")
+    print(f"  first request         {phases['first_request_ms']:9.1f} ms "
+          f"(HTTP {phases['first_request_status']})")
+    ready = phases["mongo_ready_ms"]
+    print(f"  mongo indexes ready   {ready:9.1f} ms since start" if ready is not None
+          else "  mongo indexes ready   not ready after 15s")
+
+    top_level = sum(r["cumulative_ms"] for r in imports if r["depth"] == 0)
+    print(f"\nSlowest imports (cumulative, {top_level:.1f} ms total)")
+    for row in sorted(imports, key=lambda r: r["cumulative_ms"], reverse=True)[:top]:
+        print(f"  {row['cumulative_ms']:9.1f} ms  {row['self_ms']:7.1f} ms self  "
+              f"{'  ' * row['depth']}{row['module']}")
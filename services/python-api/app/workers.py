@@ -0,0 +1,185 @@
+import argparse
+import json
+import multiprocessing
+import os
+import signal
+import sys
+import time
+
+from app.core.config import MONGO_DB_NAME, MONGO_URI, WORKER_BATCH_SIZE, WORKER_CLAIM_TTL
+from app.core.mongodb import PROCESSING_BUCKETS, MongoDBClient
+from app.core.workers import ENGINE_UNAVAILABLE_EXIT, run_partition_worker
+from app.utils.logger import logger
+
+# A worker that dies sooner than this after starting is restarted no faster
+RESTART_BACKOFF = 5.0
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Run partitioned analysis pipeline workers and monitor them",
+    )
+    parser.add_argument(
+        "--processes", type=int, default=os.cpu_count() or 1,
+        help="worker processes on this host (default: CPU count)",
+    )
+    parser.add_argument(
+        "--partitions", type=int,
+        help="total partitions across all hosts (default: --processes)",
+    )
+    parser.add_argument(
+        "--first-partition", type=int, default=0,
+        help="this host runs partitions first..first+processes-1 (default: 0)",
+    )
+    parser.add_argument("--batch-size", type=int, default=WORKER_BATCH_SIZE)
+    parser.add_argument(
+        "--drain", action="store_true",
+        help="exit once every partition is empty instead of polling for new data",
+    )
+    parser.add_argument("--report-interval", type=float, default=10.0)
+    parser.add_argument(
+        "--status", action="store_true",
+        help="print raw asteroid counts per processing state and exit",
+    )
+    args = parser.parse_args(argv)
+
+    if args.partitions is None:
+        args.partitions = args.first_partition + args.processes
+    if args.processes < 1 or args.batch_size < 1:
+        parser.error("--processes and --batch-size must be positive")
+    if not 0 < args.partitions <= PROCESSING_BUCKETS:
+        parser.error(f"--partitions must be between 1 and {PROCESSING_BUCKETS}")
+    if args.first_partition < 0 or args.first_partition + args.processes > args.partitions:
+        parser.error("--first-partition + --processes exceeds --partitions")
+    return args
+
+
+class WorkerSupervisor:
+    """Starts one process per partition, restarts crashed ones and reports
+    progress from the processing states in Mongo."""
+
+    def __init__(self, mongo: MongoDBClient, args: argparse.Namespace):
+        self.mongo = mongo
+        self.args = args
+        self.context = multiprocessing.get_context("spawn")
+        self.processes: dict[int, multiprocessing.Process] = {}
+        self.started_at: dict[int, float] = {}
+        # Drain workers that gave up waiting for the engine; not restarted
+        self.engine_unavailable: list[int] = []
+        self.stopping = False
+
+    def _start(self, partition: int) -> None:
+        process = self.context.Process(
+            target=run_partition_worker,
+            args=(partition, self.args.partitions, self.args.batch_size, self.args.drain),
+            name=f"pipeline-worker-{partition}",
+        )
+        process.start()
+        self.processes[partition] = process
+        self.started_at[partition] = time.monotonic()
+
+    def stop(self, *_) -> None:
+        if self.stopping:
+            return
+        self.stopping = True
+        logger.info("Stopping workers after their current batch...")
+        for process in self.processes.values():
+            if process.is_alive():
+                process.terminate()
+
+    def run(self) -> None:
+        first = self.args.first_partition
+        for partition in range(first, first + self.args.processes):
+            self._start(partition)
+        logger.info(
+            f"Started {self.args.processes} workers for partitions "
+            f"{first}..{first + self.args.processes - 1} of {self.args.partitions}"
+        )
+
+        last_report = time.monotonic()
+        last_done = self.mongo.count_processing_states()["done"]
+        while self.processes:
+            time.sleep(1)
+            self._reap()
+
+            now = time.monotonic()
+            if now - last_report >= self.args.report_interval:
+                last_done = self._report(now - last_report, last_done)
+                last_report = now
+
+        if not self.stopping:
+            self._report(time.monotonic() - last_report, last_done)
+        if self.engine_unavailable:
+            logger.error(
+                f"Drain incomplete: partitions {sorted(self.engine_unavailable)} "
+                f"stopped while the engine was unavailable"
+            )
+
+    def _reap(self) -> None:
+        for partition, process in list(self.processes.items()):
+            if process.is_alive():
+                continue
+            if self.stopping or (self.args.drain and process.exitcode == 0):
+                del self.processes[partition]
+                continue
+            if self.args.drain and process.exitcode == ENGINE_UNAVAILABLE_EXIT:
+                logger.warning(f"Worker for partition {partition} gave up: engine unavailable")
+                self.engine_unavailable.append(partition)
+                del self.processes[partition]
+                continue
+            if time.monotonic() - self.started_at[partition] < RESTART_BACKOFF:
+                continue
+            # Its claims expire after WORKER_CLAIM_TTL and are picked up again
+            logger.warning(
+                f"Worker for partition {partition} exited with code {process.exitcode}, restarting"
+            )
+            self._start(partition)
+
+    def _report(self, elapsed: float, last_done: int) -> int:
+        try:
+            counts = self.mongo.count_processing_states()
+        except Exception as e:
+            logger.error(f"Failed to read processing states: {e}")
+            return last_done
+
+        alive = sum(process.is_alive() for process in self.processes.values())
+        rate = (counts["done"] - last_done) / elapsed if elapsed > 0 else 0.0
+        logger.info(
+            f"Workers {alive}/{self.args.processes} alive | "
+            f"pending {counts['pending']}, claimed {counts['claimed']}, "
+            f"done {counts['done']}, failed {counts['failed']} | {rate:.1f} done/s"
+        )
+        return counts["done"]
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = _parse_args(argv)
+
+    mongo = MongoDBClient(MONGO_URI, MONGO_DB_NAME, max_pool_size=4)
+    # Indexes and the processing-state backfill are in place before workers claim
+    mongo.connect(background=False)
+
+    try:
+        if args.status:
+            print(json.dumps(mongo.count_processing_states()))
+            return
+
+        supervisor = WorkerSupervisor(mongo, args)
+        signal.signal(signal.SIGTERM, supervisor.stop)
+        signal.signal(signal.SIGINT, supervisor.stop)
+        try:
+            supervisor.run()
+        finally:
+            for process in supervisor.processes.values():
+                process.join(timeout=WORKER_CLAIM_TTL)
+                if process.is_alive():
+                    process.kill()
+    finally:
+        mongo.close()
+
+    if supervisor.engine_unavailable:
+        sys.exit(ENGINE_UNAVAILABLE_EXIT)
+
+
+if __name__ == "__main__":
+    main()
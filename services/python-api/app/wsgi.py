@@ -0,0 +1,5 @@
+from app.main import create_app
+
+# Imported once in the gunicorn master (preload_app): workers share the loaded
+# modules copy-on-write and open their own connections in post_fork.
+app = create_app(preload=True)
@@ -0,0 +1,64 @@
+import argparse
+import json
+from pathlib import Path
+
+METRICS = (
+    # (name, higher_is_better)
+    ("items_per_sec", True),
+    ("p95_ms", False),
+    ("peak_rss_mb", False),
+)
+
+
+def _index(report: dict) -> dict:
+    return {(r["stage"], r["scale"]): r for r in report["results"]}
+
+
+def compare(baseline: dict, candidate: dict, threshold_pct: float) -> list[str]:
+    """Return human readable regressions (empty when none exceed the threshold)."""
+    old, new = _index(baseline), _index(candidate)
+    regressions = []
+
+    print(f"{'stage':<10} {'scale':>8} {'metric':<14} {'baseline':>12} {'candidate':>12} {'delta':>9}")
+    for key in sorted(old.keys() & new.keys()):
+        for metric, higher_is_better in METRICS:
+            before, after = old[key].get(metric), new[key].get(metric)
+            if not before or after is None:
+                continue
+
+            delta_pct = (after - before) / before * 100.0
+            worse = -delta_pct if higher_is_better else delta_pct
+            marker = " !" if worse > threshold_pct else ""
+
+            print(
+                f"{key[0]:<10} {key[1]:>8} {metric:<14} {before:>12.2f} {after:>12.2f} "
+                f"{delta_pct:>+8.1f}%{marker}"
+            )
+            if marker:
+                regressions.append(f"{key[0]}@{key[1]} {metric} {delta_pct:+.1f}%")
+
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Diff two benchmark result files")
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    parser.add_argument("--threshold", type=float, default=10.0, help="Regression threshold in percent")
+    args = parser.parse_args(argv)
+
+    baseline = json.loads(Path(args.baseline).read_text())
+    candidate = json.loads(Path(args.candidate).read_text())
+
+    print(f"baseline:  {baseline['meta']['git_revision']}  candidate: {candidate['meta']['git_revision']}\n")
+    regressions = compare(baseline, candidate, args.threshold)
+
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) above {args.threshold}%:")
+        for line in regressions:
+            print(f"  - {line}")
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+import argparse
+import json
+import os
+import platform
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+from benchmarks.run import RESULTS_DIR, _git_revision
+
+
+def _synthetic_elements(count: int, seed: int) -> list:
+    os.environ.setdefault("LOG_DIRECTORY", tempfile.mkdtemp(prefix="astroforge-bench-logs-"))
+    from app.models.orbit import GAUSS_K, J2000_JD, OrbitalElements
+
+    rng = np.random.default_rng(seed)
+    elements = []
+    for _ in range(count):
+        a = rng.uniform(0.6, 3.5)
+        elements.append(OrbitalElements(
+            semi_major_axis_au=a,
+            eccentricity=rng.uniform(0.0, 0.9),
+            inclination_deg=rng.uniform(0.0, 40.0),
+            ascending_node_deg=rng.uniform(0.0, 360.0),
+            perihelion_argument_deg=rng.uniform(0.0, 360.0),
+            mean_anomaly_deg=rng.uniform(0.0, 360.0),
+            epoch_jd=J2000_JD + rng.uniform(0.0, 9000.0),
+            mean_motion_deg_per_day=float(np.degrees(GAUSS_K / a**1.5)),
+        ))
+    return elements
+
+
+def _measure(elements: list, epochs: int, block_size: int) -> dict:
+    from app.models.orbit import J2000_JD, min_earth_distance
+
+    start = J2000_JD + 9000.0
+    tracemalloc.start()
+    started = time.perf_counter()
+    min_earth_distance(elements, start, start + epochs - 1, 1.0, block_size=block_size)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    pairs = len(elements) * epochs
+    return {
+        "objects": len(elements),
+        "epochs": epochs,
+        "block_size": block_size,
+        "seconds": round(elapsed, 3),
+        "pairs_per_sec": round(pairs / elapsed),
+        "peak_alloc_mb": round(peak / 1e6, 1),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Time minimum Earth distance over objects x daily epochs"
+    )
+    parser.add_argument("--objects", type=int, nargs="+", default=[1_000, 5_000])
+    parser.add_argument("--epochs", type=int, nargs="+", default=[1_000, 3_650])
+    parser.add_argument("--block-size", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default=None)
+    args = parser.parse_args(argv)
+
+    elements = _synthetic_elements(max(args.objects), args.seed)
+
+    rows = []
+    print(f"{'objects':>8} {'epochs':>7} {'block':>9} {'seconds':>8} {'pairs/s':>11} {'peak MB':>8}")
+    for count in args.objects:
+        for epochs in args.epochs:
+            for block_size in args.block_size:
+                r = _measure(elements[:count], epochs, block_size)
+                rows.append(r)
+                print(
+                    f"{r['objects']:>8} {r['epochs']:>7} {r['block_size']:>9} {r['seconds']:>8.2f} "
+                    f"{r['pairs_per_sec']:>11} {r['peak_alloc_mb']:>8.1f}"
+                )
+
+    revision = _git_revision()
+    report = {
+        "meta": {
+            "git_revision": revision,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+        },
+        "results": rows,
+    }
+    output = Path(args.output) if args.output else RESULTS_DIR / f"{revision}-orbits.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n")
+    print(f"\nResults written to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,305 @@
+import argparse
+import json
+import multiprocessing as mp
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+
+from benchmarks.synthetic import generate_neo_feed, iter_feed_asteroids
+
+STAGES = ("mapping", "ingestion", "pipeline")
+DEFAULT_SCALES = (1_000, 10_000, 100_000)
+
+SERVICE_DIR = Path(__file__).resolve().parent.parent
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+DEFAULT_ENGINE_BINARY = SERVICE_DIR.parent / "rust-engine" / "target" / "release" / "rust-engine"
+
+
+# ---------------------------------------------------------------------------
+# Helpers (run inside the per-stage child process)
+# ---------------------------------------------------------------------------
+
+def _bootstrap_env(settings: dict) -> None:
+    # Must run before any `app.*` import: config is read at import time.
+    os.environ.setdefault("NASA_API_KEY", "BENCHMARK")
+    os.environ["LOG_DIRECTORY"] = settings["log_directory"]
+    os.environ["RUST_ENGINE_URL"] = settings["engine_url"]
+    os.environ["RUST_ENGINE_URLS"] = settings["engine_url"]
+
+    from app.utils.logger import logger
+    logger.setLevel(settings["log_level"])
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS and kilobytes on Linux
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(peak / divisor, 2)
+
+
+def _percentile(sorted_values: list[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(pct / 100.0 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def _summarize(stage: str, scale: int, latencies: list[float], elapsed: float, baseline_rss: float) -> dict:
+    ordered = sorted(latencies)
+    items = len(latencies)
+    return {
+        "stage": stage,
+        "scale": scale,
+        "items": items,
+        "seconds": round(elapsed, 4),
+        "items_per_sec": round(items / elapsed, 2) if elapsed > 0 else 0.0,
+        "p50_ms": round(_percentile(ordered, 50) * 1000.0, 4),
+        "p95_ms": round(_percentile(ordered, 95) * 1000.0, 4),
+        "baseline_rss_mb": baseline_rss,
+        "peak_rss_mb": _peak_rss_mb(),
+    }
+
+
+def _make_app_and_mongo(settings: dict):
+    from flask import Flask
+    from app.core.mongodb import MongoDBClient
+
+    app = Flask("benchmarks")
+    mongo = MongoDBClient(settings["mongo_uri"], settings["mongo_db"])
+
+    if settings["mongo"] == "mongomock":
+        import mongomock
+
+        mongo.client = mongomock.MongoClient()
+        mongo.db = mongo.client[mongo.db_name]
+        mongo._ensure_collections()
+        app.extensions["mongo"] = mongo
+    else:
+        mongo.init_app(app, connect=False)
+        mongo.connect(background=False)
+        mongo.client.drop_database(mongo.db_name)
+        mongo._ensure_collections()
+
+    return app, mongo
+
+
+def _bench_mapping(feed: dict, scale: int, baseline_rss: float) -> dict:
+    from app.core.dto_mapper import map_nasa_raw_to_asteroid
+
+    latencies = []
+    started = time.perf_counter()
+    for _, asteroid in iter_feed_asteroids(feed):
+        t0 = time.perf_counter()
+        map_nasa_raw_to_asteroid(asteroid)
+        latencies.append(time.perf_counter() - t0)
+    elapsed = time.perf_counter() - started
+
+    return _summarize("mapping", scale, latencies, elapsed, baseline_rss)
+
+
+def _bench_ingestion(mongo, feed: dict, scale: int, baseline_rss: float) -> dict:
+    latencies = []
+    started = time.perf_counter()
+    for date_str, asteroid in iter_feed_asteroids(feed):
+        t0 = time.perf_counter()
+        mongo.save_raw_asteroid(date_str, asteroid)
+        latencies.append(time.perf_counter() - t0)
+    elapsed = time.perf_counter() - started
+
+    return _summarize("ingestion", scale, latencies, elapsed, baseline_rss)
+
+
+def _bench_pipeline(app, mongo, feed: dict, scale: int, baseline_rss: float) -> dict:
+    from app.core.pipeline import AnalysisPipeline
+
+    for date_str, asteroid in iter_feed_asteroids(feed):
+        mongo.save_raw_asteroid(date_str, asteroid)
+
+    # Per-item latency is the gap between consecutive persisted results, which
+    # stays meaningful however the pipeline schedules its engine calls.
+    completions: list[float] = []
+    save_analysis_result = mongo.save_analysis_result
+
+    def _timed_save(*args, **kwargs):
+        result = save_analysis_result(*args, **kwargs)
+        completions.append(time.perf_counter())
+        return result
+
+    mongo.save_analysis_result = _timed_save
+
+    with app.app_context():
+        started = time.perf_counter()
+        stats = AnalysisPipeline.analyze_unprocessed_asteroids(limit=scale)
+        elapsed = time.perf_counter() - started
+
+    latencies = []
+    previous = started
+    for completed in completions:
+        latencies.append(completed - previous)
+        previous = completed
+
+    summary = _summarize("pipeline", scale, latencies, elapsed, baseline_rss)
+    summary["pipeline_stats"] = stats
+    return summary
+
+
+def run_stage(stage: str, scale: int, settings: dict) -> dict:
+    _bootstrap_env(settings)
+
+    feed = generate_neo_feed(scale, seed=settings["seed"])
+
+    mongo = None
+    try:
+        if stage == "mapping":
+            return _bench_mapping(feed, scale, _peak_rss_mb())
+
+        app, mongo = _make_app_and_mongo(settings)
+        if stage == "ingestion":
+            return _bench_ingestion(mongo, feed, scale, _peak_rss_mb())
+        return _bench_pipeline(app, mongo, feed, scale, _peak_rss_mb())
+    finally:
+        if mongo is not None and settings["mongo"] != "mongomock":
+            mongo.client.drop_database(mongo.db_name)
+            mongo.close()
+
+
+# ---------------------------------------------------------------------------
+# Orchestration (parent process)
+# ---------------------------------------------------------------------------
+
+def _git_revision() -> str:
+    try:
+        revision = subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=SERVICE_DIR, text=True
+        ).strip()
+        dirty = subprocess.call(
+            ["git", "diff", "--quiet", "HEAD"], cwd=SERVICE_DIR
+        ) != 0
+        return f"{revision}-dirty" if dirty else revision
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def _wait_for_engine(url: str, timeout: float = 15.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(f"{url}/api/health", timeout=1) as response:
+                if response.status == 200:
+                    return
+        except OSError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"Rust engine at {url} did not become healthy in {timeout}s")
+
+
+def _start_engine(args):
+    """Returns (engine_url, label, stop_callback)."""
+    if args.engine_url:
+        _wait_for_engine(args.engine_url)
+        return args.engine_url, f"url:{args.engine_url}", lambda: None
+
+    if args.engine == "binary":
+        binary = Path(args.engine_binary)
+        if not binary.exists():
+            raise SystemExit(
+                f"Rust engine binary not found at {binary}; build it with "
+                "`cargo build --release` or use --engine stub"
+            )
+        process = subprocess.Popen([str(binary)], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        url = "http://127.0.0.1:8080"
+        _wait_for_engine(url)
+        return url, f"binary:{binary}", process.terminate
+
+    from benchmarks.stub_rust_engine import start_stub_engine
+
+    server = start_stub_engine()
+    host, port = server.server_address[:2]
+    return f"http://{host}:{port}", "stub", server.shutdown
+
+
+def _print_table(results: list[dict]) -> None:
+    header = f"{'stage':<10} {'scale':>8} {'items/s':>12} {'p50 ms':>10} {'p95 ms':>10} {'peak RSS MB':>12}"
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        print(
+            f"{r['stage']:<10} {r['scale']:>8} {r['items_per_sec']:>12.1f} "
+            f"{r['p50_ms']:>10.3f} {r['p95_ms']:>10.3f} {r['peak_rss_mb']:>12.1f}"
+        )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Benchmark NASA mapping, Mongo ingestion and the analysis pipeline"
+    )
+    parser.add_argument("--scales", type=int, nargs="+", default=list(DEFAULT_SCALES))
+    parser.add_argument("--stages", nargs="+", choices=STAGES, default=list(STAGES))
+    parser.add_argument("--mongo", choices=("mongomock", "mongod"), default="mongomock")
+    parser.add_argument("--mongo-uri", default=os.getenv("MONGO_URI", "mongodb://localhost:27017"))
+    parser.add_argument("--engine", choices=("stub", "binary"), default="stub")
+    parser.add_argument("--engine-binary", default=str(DEFAULT_ENGINE_BINARY))
+    parser.add_argument("--engine-url", default=None, help="Use an already running engine")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--log-level", default="WARNING")
+    parser.add_argument("--output", default=None, help="Defaults to benchmarks/results/<git-rev>.json")
+    args = parser.parse_args(argv)
+
+    revision = _git_revision()
+    engine_url, engine_label, stop_engine = _start_engine(args)
+
+    settings = {
+        "seed": args.seed,
+        "mongo": args.mongo,
+        "mongo_uri": args.mongo_uri,
+        "mongo_db": f"astroforge_bench_{os.getpid()}",
+        "engine_url": engine_url,
+        "log_level": args.log_level.upper(),
+        "log_directory": tempfile.mkdtemp(prefix="astroforge-bench-logs-"),
+    }
+
+    results = []
+    # A fresh interpreter per (stage, scale) keeps peak RSS figures independent.
+    context = mp.get_context("spawn")
+    try:
+        for scale in args.scales:
+            for stage in args.stages:
+                print(f"Running {stage} @ {scale}...", flush=True)
+                with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+                    results.append(pool.submit(run_stage, stage, scale, settings).result())
+    finally:
+        stop_engine()
+
+    report = {
+        "meta": {
+            "git_revision": revision,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "mongo": args.mongo,
+            "engine": engine_label,
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+
+    output = Path(args.output) if args.output else RESULTS_DIR / f"{revision}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n")
+
+    print()
+    _print_table(results)
+    print(f"\nResults written to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+import argparse
+import json
+import platform
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from benchmarks.run import RESULTS_DIR, _git_revision
+from benchmarks.synthetic import generate_neo_feed
+from benchmarks.wire_format import _build_payloads
+
+
+def _stdlib_listing(docs: list[dict]) -> bytes:
+    # What GET /pipeline/analysis/asteroids did before app.utils.json_provider:
+    # isoformat() per row, then Flask's default provider (sorted keys)
+    from app.models.analysis_result import flatten_analysis
+
+    rows = []
+    for doc in docs:
+        row = flatten_analysis(doc)
+        row["analyzed_at"] = row["analyzed_at"].isoformat()
+        rows.append(row)
+    return json.dumps(rows, separators=(",", ":"), sort_keys=True).encode("utf-8")
+
+
+def _fast_listing(docs: list[dict]) -> bytes:
+    from app.models.analysis_result import flatten_analysis
+    from app.utils.json_provider import dumps
+
+    return dumps([flatten_analysis(doc) for doc in docs])
+
+
+def _stdlib_feed(feed: dict) -> bytes:
+    return json.dumps(feed, separators=(",", ":"), sort_keys=True).encode("utf-8")
+
+
+def _fast_feed(feed: dict) -> bytes:
+    from app.utils.json_provider import dumps
+
+    return dumps(feed)
+
+
+ENCODERS = {
+    "listing": {"stdlib": _stdlib_listing, "orjson": _fast_listing},
+    "feed": {"stdlib": _stdlib_feed, "orjson": _fast_feed},
+}
+
+
+def _analysis_docs(count: int, seed: int) -> list[dict]:
+    """Documents as pymongo returns them from asteroid_analyses."""
+    from bson import ObjectId
+
+    dtos, results = _build_payloads(count, seed)
+    started = datetime(2026, 1, 1)
+    return [
+        {
+            "_id": ObjectId(),
+            "neo_reference_id": dto["id"],
+            "analysis_timestamp": started + timedelta(seconds=i, microseconds=i * 37 % 1_000_000),
+            "risk_data": result,
+        }
+        for i, (dto, result) in enumerate(zip(dtos, results))
+    ]
+
+
+def _best_of(repeat: int, fn, *args) -> tuple[float, object]:
+    best, value = float("inf"), None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        value = fn(*args)
+        best = min(best, time.perf_counter() - started)
+    return best, value
+
+
+def _codings() -> dict:
+    from app.utils.compression import ENCODINGS, compress_bytes
+
+    codings = {"identity": lambda body: body}
+    for encoding in ENCODINGS:
+        codings[encoding] = lambda body, encoding=encoding: compress_bytes(body, encoding)
+    return codings
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Bytes on the wire and serialization CPU of the listing and feed responses"
+    )
+    parser.add_argument("--count", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5, help="Best of N runs is reported")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default=None)
+    args = parser.parse_args(argv)
+
+    payloads = {
+        "listing": _analysis_docs(args.count, args.seed),
+        "feed": generate_neo_feed(args.count, seed=args.seed),
+    }
+    codings = _codings()
+
+    rows = []
+    for endpoint, encoders in ENCODERS.items():
+        for encoder, encode in encoders.items():
+            encode_s, body = _best_of(args.repeat, encode, payloads[endpoint])
+            for coding, compress in codings.items():
+                compress_s, wire = _best_of(args.repeat, compress, body)
+                rows.append({
+                    "endpoint": endpoint,
+                    "encoder": encoder,
+                    "coding": coding,
+                    "items": args.count,
+                    "body_bytes": len(body),
+                    "wire_bytes": len(wire),
+                    "encode_ms": round(encode_s * 1000.0, 3),
+                    "compress_ms": round(compress_s * 1000.0, 3) if coding != "identity" else 0.0,
+                })
+
+    print(f"{'endpoint':<8} {'encoder':<7} {'coding':<9} {'body B':>11} {'wire B':>11} "
+          f"{'encode ms':>10} {'compress ms':>12}")
+    for r in rows:
+        print(
+            f"{r['endpoint']:<8} {r['encoder']:<7} {r['coding']:<9} {r['body_bytes']:>11} "
+            f"{r['wire_bytes']:>11} {r['encode_ms']:>10.2f} {r['compress_ms']:>12.2f}"
+        )
+
+    from app.utils import json_provider
+
+    revision = _git_revision()
+    report = {
+        "meta": {
+            "git_revision": revision,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "orjson": getattr(json_provider.orjson, "__version__", None),
+            "count": args.count,
+        },
+        "results": rows,
+    }
+    output = Path(args.output) if args.output else RESULTS_DIR / f"{revision}-serialization.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2, sort_keys=True, default=str) + "\n")
+    print(f"\nResults written to {output}")
+
+
+if __name__ == "__main__":
+    main()
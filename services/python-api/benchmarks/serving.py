@@ -0,0 +1,108 @@
+import argparse
+import asyncio
+import json
+import platform
+import statistics
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import httpx
+
+from benchmarks.run import RESULTS_DIR, _git_revision
+
+# What the dashboard polls on every refresh
+DEFAULT_PATHS = ["/pipeline/status", "/pipeline/stats", "/pipeline/analysis/asteroids?limit=50"]
+
+
+async def _worker(client: httpx.AsyncClient, paths: list[str], deadline: float,
+                  latencies: list[float], errors: list[int]) -> None:
+    i = 0
+    while time.perf_counter() < deadline:
+        path = paths[i % len(paths)]
+        i += 1
+        started = time.perf_counter()
+        try:
+            response = await client.get(path)
+            if response.status_code >= 500:
+                errors.append(response.status_code)
+        except httpx.HTTPError:
+            errors.append(0)
+        latencies.append(time.perf_counter() - started)
+
+
+async def _run_level(base_url: str, paths: list[str], concurrency: int, duration: float) -> dict:
+    latencies: list[float] = []
+    errors: list[int] = []
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60.0) as client:
+        # Warm up connections and server-side pools
+        await asyncio.gather(*(client.get(paths[0]) for _ in range(min(concurrency, 20))))
+
+        started = time.perf_counter()
+        deadline = started + duration
+        await asyncio.gather(
+            *(_worker(client, paths, deadline, latencies, errors) for _ in range(concurrency))
+        )
+        elapsed = time.perf_counter() - started
+
+    ordered = sorted(latencies)
+    return {
+        "concurrency": concurrency,
+        "requests": len(latencies),
+        "errors": len(errors),
+        "requests_per_sec": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(statistics.median(ordered) * 1000.0, 2) if ordered else None,
+        "p95_ms": round(ordered[int(len(ordered) * 0.95) - 1] * 1000.0, 2) if ordered else None,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Compare requests/sec of the sync (Flask) and async (ASGI) serving modes"
+    )
+    parser.add_argument("--sync-url", default=None, help="e.g. http://localhost:5001")
+    parser.add_argument("--async-url", default=None, help="e.g. http://localhost:5002")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[10, 100, 300])
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds per level")
+    parser.add_argument("--path", dest="paths", action="append", default=None)
+    parser.add_argument("--output", default=None)
+    args = parser.parse_args(argv)
+
+    targets = {name: url for name, url in (("sync", args.sync_url), ("async", args.async_url)) if url}
+    if not targets:
+        parser.error("pass --sync-url and/or --async-url")
+    paths = args.paths or DEFAULT_PATHS
+
+    rows = []
+    for mode, url in targets.items():
+        for level in args.concurrency:
+            row = asyncio.run(_run_level(url, paths, level, args.duration))
+            row["mode"] = mode
+            rows.append(row)
+            print(
+                f"{mode:<6} c={level:<5} {row['requests_per_sec']:>9.1f} req/s  "
+                f"p50={row['p50_ms']}ms p95={row['p95_ms']}ms errors={row['errors']}"
+            )
+
+    revision = _git_revision()
+    report = {
+        "meta": {
+            "git_revision": revision,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "paths": paths,
+            "duration_s": args.duration,
+            "targets": targets,
+        },
+        "results": rows,
+    }
+    output = Path(args.output) if args.output else RESULTS_DIR / f"{revision}-serving.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n")
+    print(f"\nResults written to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+import argparse
+import json
+import math
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# Mirrors rust-engine/src/logic/impact_energy.rs so results look realistic.
+S_TYPE_DENSITY = 2700.0
+JOULES_PER_MEGATON = 4.184e15
+
+
+def _risk_level(score: float) -> str:
+    if score >= 75.0:
+        return "Critical"
+    if score >= 50.0:
+        return "High"
+    if score >= 25.0:
+        return "Medium"
+    return "Low"
+
+
+def compute_risk_result(dto: dict) -> dict:
+    diameter_km = float(dto["diameter_avg_km"])
+    velocity_kps = float(dto["relative_velocity_kps"])
+
+    radius_m = diameter_km * 1000.0 / 2.0
+    volume_m3 = (4.0 / 3.0) * math.pi * radius_m ** 3
+    mass = volume_m3 * S_TYPE_DENSITY
+    energy_joules = 0.5 * mass * (velocity_kps * 1000.0) ** 2
+
+    score = 0.0
+    if energy_joules > 0.0:
+        score = min(max(max(math.log10(energy_joules), 0.0) / 20.0 * 100.0, 0.0), 100.0)
+
+    return {
+        "asteroid_id": dto["id"],
+        "asteroid_name": dto["name"],
+        "impact_energy_joules": energy_joules,
+        "impact_energy_megatons": energy_joules / JOULES_PER_MEGATON,
+        "risk_level": _risk_level(score),
+        "risk_score_0_to_100": score,
+        "is_potentially_hazardous": dto["is_potentially_hazardous"],
+        "miss_distance_km": dto["miss_distance_km"],
+        "velocity_kps": velocity_kps,
+        "diameter_km": diameter_km,
+    }
+
+
+class StubEngineHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status: int, body: bytes, content_type: str) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == "/api/health":
+            self._send(200, b"ok", "text/plain; charset=utf-8")
+        else:
+            self._send(404, b"", "text/plain")
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        payload = self.rfile.read(length)
+
+        if self.path != "/api/process/asteroid":
+            self._send(404, b"", "text/plain")
+            return
+
+        # Same content negotiation as the engine: Content-Type in, Accept out
+        msgpack_in = "msgpack" in self.headers.get("Content-Type", "")
+        msgpack_out = msgpack is not None and "msgpack" in self.headers.get("Accept", "")
+
+        try:
+            dto = msgpack.unpackb(payload) if msgpack_in else json.loads(payload)
+            result = compute_risk_result(dto)
+        except (KeyError, TypeError, ValueError) as e:
+            body = json.dumps({"error": "invalid_input", "details": str(e)}).encode()
+            self._send(400, body, "application/json")
+            return
+
+        if msgpack_out:
+            self._send(200, msgpack.packb(result), "application/msgpack")
+        else:
+            self._send(200, json.dumps(result).encode(), "application/json")
+
+
+def start_stub_engine(host: str = "127.0.0.1", port: int = 0) -> ThreadingHTTPServer:
+    """Start the stub engine in a daemon thread; port 0 picks a free port."""
+    server = ThreadingHTTPServer((host, port), StubEngineHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(
+        target=server.serve_forever, daemon=True, name="stub-rust-engine"
+    )
+    thread.start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for the Rust engine")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer((args.host, args.port), StubEngineHandler)
+    print(f"Stub Rust engine listening on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
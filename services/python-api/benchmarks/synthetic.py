@@ -0,0 +1,87 @@
+import random
+from datetime import date, timedelta
+
+
+def _synthetic_neo(rng: random.Random, index: int, approach_date: date) -> dict:
+    neo_id = str(2_000_000 + index)
+    diameter_min = rng.uniform(0.005, 2.5)
+    diameter_max = diameter_min * rng.uniform(1.5, 2.5)
+    velocity_kps = rng.uniform(2.0, 40.0)
+    miss_km = rng.uniform(1.0e5, 7.5e7)
+    date_str = approach_date.strftime("%Y-%m-%d")
+
+    return {
+        "links": {"self": f"http://api.nasa.gov/neo/rest/v1/neo/{neo_id}"},
+        "id": neo_id,
+        "neo_reference_id": neo_id,
+        "name": f"({approach_date.year} SYN{index})",
+        "nasa_jpl_url": f"https://ssd.jpl.nasa.gov/tools/sbdb_lookup.html#/?sstr={neo_id}",
+        "absolute_magnitude_h": round(rng.uniform(15.0, 30.0), 2),
+        "estimated_diameter": {
+            "kilometers": {
+                "estimated_diameter_min": diameter_min,
+                "estimated_diameter_max": diameter_max,
+            },
+            "meters": {
+                "estimated_diameter_min": diameter_min * 1000.0,
+                "estimated_diameter_max": diameter_max * 1000.0,
+            },
+            "miles": {
+                "estimated_diameter_min": diameter_min * 0.621371,
+                "estimated_diameter_max": diameter_max * 0.621371,
+            },
+            "feet": {
+                "estimated_diameter_min": diameter_min * 3280.84,
+                "estimated_diameter_max": diameter_max * 3280.84,
+            },
+        },
+        "is_potentially_hazardous_asteroid": rng.random() < 0.1,
+        "close_approach_data": [
+            {
+                "close_approach_date": date_str,
+                "close_approach_date_full": f"{approach_date.strftime('%Y-%b-%d')} 12:00",
+                "epoch_date_close_approach": int(
+                    (approach_date - date(1970, 1, 1)).total_seconds() * 1000
+                ),
+                # NASA returns these as strings
+                "relative_velocity": {
+                    "kilometers_per_second": f"{velocity_kps:.10f}",
+                    "kilometers_per_hour": f"{velocity_kps * 3600:.10f}",
+                    "miles_per_hour": f"{velocity_kps * 2236.94:.10f}",
+                },
+                "miss_distance": {
+                    "astronomical": f"{miss_km / 1.495978707e8:.10f}",
+                    "lunar": f"{miss_km / 384400:.10f}",
+                    "kilometers": f"{miss_km:.10f}",
+                    "miles": f"{miss_km * 0.621371:.10f}",
+                },
+                "orbiting_body": "Earth",
+            }
+        ],
+        "is_sentry_object": False,
+    }
+
+
+def generate_neo_feed(count: int, seed: int = 42, start: date = date(2026, 1, 1)) -> dict:
+    """Build a NASA NEO feed payload holding `count` asteroids spread over 7 days."""
+    rng = random.Random(seed)
+    near_earth_objects: dict[str, list[dict]] = {}
+
+    for index in range(count):
+        approach_date = start + timedelta(days=index % 7)
+        date_str = approach_date.strftime("%Y-%m-%d")
+        near_earth_objects.setdefault(date_str, []).append(
+            _synthetic_neo(rng, index, approach_date)
+        )
+
+    return {
+        "links": {},
+        "element_count": count,
+        "near_earth_objects": near_earth_objects,
+    }
+
+
+def iter_feed_asteroids(feed: dict):
+    for date_str, asteroids in feed["near_earth_objects"].items():
+        for asteroid in asteroids:
+            yield date_str, asteroid
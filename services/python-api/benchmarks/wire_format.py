@@ -0,0 +1,111 @@
+import argparse
+import json
+import os
+import platform
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import msgpack
+
+from benchmarks.run import RESULTS_DIR, _git_revision
+from benchmarks.stub_rust_engine import compute_risk_result
+from benchmarks.synthetic import generate_neo_feed, iter_feed_asteroids
+
+# The exact bytes rust_client puts on the wire for each format
+CODECS = {
+    "json": (
+        lambda obj: json.dumps(obj, separators=(",", ":")).encode("utf-8"),
+        json.loads,
+    ),
+    "msgpack": (
+        lambda obj: msgpack.packb(obj, use_bin_type=True),
+        lambda data: msgpack.unpackb(data, raw=False),
+    ),
+}
+
+
+def _build_payloads(count: int, seed: int) -> tuple[list[dict], list[dict]]:
+    os.environ.setdefault("NASA_API_KEY", "BENCHMARK")
+    os.environ.setdefault("LOG_DIRECTORY", tempfile.mkdtemp(prefix="astroforge-bench-logs-"))
+    from app.core.dto_mapper import map_nasa_raw_to_asteroid
+
+    dtos = []
+    for _, raw in iter_feed_asteroids(generate_neo_feed(count, seed=seed)):
+        asteroid = map_nasa_raw_to_asteroid(raw)
+        if asteroid is not None:
+            dtos.append(asteroid.to_dto_dict())
+
+    return dtos, [compute_risk_result(dto) for dto in dtos]
+
+
+def _measure(name: str, payloads: list[dict], encode, decode, repeat: int) -> dict:
+    best_encode = best_decode = float("inf")
+    encoded: list[bytes] = []
+
+    for _ in range(repeat):
+        started = time.perf_counter()
+        encoded = [encode(p) for p in payloads]
+        best_encode = min(best_encode, time.perf_counter() - started)
+
+        started = time.perf_counter()
+        for body in encoded:
+            decode(body)
+        best_decode = min(best_decode, time.perf_counter() - started)
+
+    return {
+        "payload": name,
+        "items": len(payloads),
+        "total_bytes": sum(len(b) for b in encoded),
+        "avg_bytes": round(sum(len(b) for b in encoded) / max(1, len(encoded)), 1),
+        "encode_ms": round(best_encode * 1000.0, 3),
+        "decode_ms": round(best_decode * 1000.0, 3),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Compare JSON and MessagePack for python-api <-> Rust engine payloads"
+    )
+    parser.add_argument("--count", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5, help="Best of N runs is reported")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default=None)
+    args = parser.parse_args(argv)
+
+    dtos, results = _build_payloads(args.count, args.seed)
+
+    rows = []
+    for codec, (encode, decode) in CODECS.items():
+        for name, payloads in (("request (AsteroidDTO)", dtos), ("response (RiskResult)", results)):
+            row = _measure(name, payloads, encode, decode, args.repeat)
+            row["format"] = codec
+            rows.append(row)
+
+    print(f"{'format':<8} {'payload':<22} {'bytes':>11} {'avg B':>7} {'encode ms':>10} {'decode ms':>10}")
+    for r in rows:
+        print(
+            f"{r['format']:<8} {r['payload']:<22} {r['total_bytes']:>11} {r['avg_bytes']:>7} "
+            f"{r['encode_ms']:>10.2f} {r['decode_ms']:>10.2f}"
+        )
+
+    revision = _git_revision()
+    report = {
+        "meta": {
+            "git_revision": revision,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "msgpack": msgpack.version,
+            "count": args.count,
+        },
+        "results": rows,
+    }
+    output = Path(args.output) if args.output else RESULTS_DIR / f"{revision}-wire-format.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2, sort_keys=True, default=str) + "\n")
+    print(f"\nResults written to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+# Production entry point: gunicorn -c gunicorn.conf.py
+#
+# Sizing (all overridable through the environment):
+#   workers = 2 * cores + 1   WEB_CONCURRENCY
+#   threads = 4               GUNICORN_THREADS, per worker; routes mostly wait
+#                             on Mongo, NASA and the Rust engine, so a few
+#                             threads per process keep each core busy
+#   Mongo pool = threads + 2  per worker (+ health check and seed threads)
+#
+# Total Mongo connections are roughly workers * (threads + 2); keep that well
+# under the server's connection limit when scaling out.
+import gc
+import multiprocessing
+import os
+
+wsgi_app = "app.wsgi:app"
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:5001")
+
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count() * 2 + 1))
+threads = int(os.getenv("GUNICORN_THREADS", 4))
+worker_class = "gthread"
+
+# Pipeline runs may process up to 1000 asteroids in one request
+timeout = int(os.getenv("GUNICORN_TIMEOUT", 120))
+graceful_timeout = 30
+keepalive = 5
+
+preload_app = True
+
+# Read by app.core.config when the app is preloaded below
+os.environ.setdefault("MONGO_MAX_POOL_SIZE", str(threads + 2))
+
+
+def when_ready(server):
+    # Move the preloaded heap out of the GC's reach so collections in the
+    # workers don't touch (and copy) the shared pages
+    gc.freeze()
+    server.log.info(f"Serving with {workers} workers x {threads} threads")
+
+
+def post_fork(server, worker):
+    from app.main import init_worker
+    from app.wsgi import app
+
+    init_worker(app)
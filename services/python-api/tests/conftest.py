@@ -0,0 +1,24 @@
+import os
+import tempfile
+import uuid
+
+import pytest
+
+# Before any app module is imported: config and logger read these
+os.environ.setdefault("NASA_API_KEY", "TEST")
+os.environ.setdefault("LOG_DIRECTORY", tempfile.mkdtemp(prefix="astroforge-test-logs-"))
+
+
+@pytest.fixture
+def mongo(monkeypatch):
+    """A connected MongoDBClient on a fresh mongomock database."""
+    import mongomock
+    import pymongo
+
+    from app.core.mongodb import MongoDBClient
+
+    monkeypatch.setattr(pymongo, "MongoClient", mongomock.MongoClient)
+    client = MongoDBClient("mongodb://localhost:27017", f"astroforge_test_{uuid.uuid4().hex[:8]}")
+    client.connect(background=False)
+    yield client
+    client.close()
@@ -0,0 +1,68 @@
+import json
+from datetime import datetime, timezone
+
+import pytest
+from flask import Flask
+
+from app.models.analysis_result import MAX_JSON_PAGE
+from app.routes.orchestration import list_analyzed_asteroids
+
+
+@pytest.fixture
+def client(mongo):
+    app = Flask(__name__)
+    app.extensions["mongo"] = mongo
+    # Only the listing route: the blueprint would also build the leaderboard
+    app.add_url_rule("/pipeline/analysis/asteroids", view_func=list_analyzed_asteroids)
+    return app.test_client()
+
+
+@pytest.mark.parametrize("query", ["limit=0", "limit=-5", "offset=-1", f"limit={MAX_JSON_PAGE + 1}"])
+def test_rejected_pages(client, query):
+    response = client.get(f"/pipeline/analysis/asteroids?{query}")
+    assert response.status_code == 400
+
+
+def test_streamed_pages_may_exceed_the_json_cap(client):
+    response = client.get(
+        f"/pipeline/analysis/asteroids?limit={MAX_JSON_PAGE + 1}",
+        headers={"Accept": "application/x-ndjson"},
+    )
+    assert response.status_code == 200
+    assert response.headers["X-Total-Count"] == "0"
+
+
+def test_json_page_within_the_cap(client):
+    response = client.get(f"/pipeline/analysis/asteroids?limit={MAX_JSON_PAGE}")
+    assert response.status_code == 200
+    assert response.get_json() == []
+
+
+def test_streamed_rows_match_the_json_page(client, mongo):
+    mongo.db["asteroid_analyses"].insert_many([
+        {
+            "neo_reference_id": str(i),
+            "analysis_timestamp": datetime(2026, 3, 1, i, tzinfo=timezone.utc),
+            "risk_data": {
+                "asteroid_name": f"({i})",
+                "risk_level": "Low",
+                "risk_score_0_to_100": float(i),
+                "impact_energy_megatons": 1.0,
+                "miss_distance_km": 1.0e6,
+                "diameter_km": 0.1,
+                "velocity_kps": 10.0,
+                "is_potentially_hazardous": False,
+            },
+        }
+        for i in range(5)
+    ])
+
+    streamed = client.get("/pipeline/analysis/asteroids", headers={"Accept": "application/x-ndjson"})
+    page = client.get("/pipeline/analysis/asteroids")
+
+    assert streamed.is_streamed
+    assert streamed.mimetype == "application/x-ndjson"
+    assert "Accept" in streamed.vary
+    rows = [json.loads(line) for line in streamed.get_data().splitlines()]
+    assert len(rows) == 5
+    assert [row["id"] for row in rows] == [row["id"] for row in page.get_json()]
@@ -0,0 +1,90 @@
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+import requests
+from requests.exceptions import HTTPError
+
+from app.routes import nasa
+
+
+def _entry(day: str) -> dict:
+    return {"date": day, "title": f"APOD {day}", "media_type": "image", "url": f"https://apod.test/{day}.jpg"}
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    """Records NASA calls; `published` holds the dates NASA has an entry for."""
+    calls = []
+    published = set()
+
+    def get_apod(day):
+        calls.append((day, day))
+        if day not in published:
+            response = requests.Response()
+            response.status_code = 404
+            raise HTTPError(f"404 Client Error for {day}", response=response)
+        return _entry(day)
+
+    def get_apod_range(first, last):
+        calls.append((first, last))
+        start, end = date.fromisoformat(first), date.fromisoformat(last)
+        days = [(start + timedelta(days=n)).isoformat() for n in range((end - start).days + 1)]
+        return [_entry(day) for day in days if day in published]
+
+    monkeypatch.setattr(nasa, "get_apod", get_apod)
+    monkeypatch.setattr(nasa, "get_apod_range", get_apod_range)
+    return calls, published
+
+
+def test_only_missing_runs_are_fetched(mongo, upstream):
+    calls, published = upstream
+    published.update(f"2024-03-{d:02d}" for d in range(1, 11))
+    mongo.save_apod_entries(
+        {day: _entry(day) for day in ("2024-03-03", "2024-03-04", "2024-03-07")},
+        {day: True for day in ("2024-03-03", "2024-03-04", "2024-03-07")},
+    )
+
+    entries, final = nasa._apod_entries(mongo, date(2024, 3, 1), date(2024, 3, 10))
+
+    assert calls == [("2024-03-01", "2024-03-02"), ("2024-03-05", "2024-03-06"), ("2024-03-08", "2024-03-10")]
+    assert [entry["date"] for entry in entries] == [f"2024-03-{d:02d}" for d in range(1, 11)]
+    assert final
+
+
+def test_unpublished_day_is_not_an_error(mongo, upstream):
+    calls, _ = upstream
+    today = nasa.apod_today()
+
+    entries, final = nasa._apod_entries(mongo, today, today)
+
+    assert entries == []
+    assert not final
+    assert mongo.get_apod_entries([today.isoformat()])[today.isoformat()]["entry"] is None
+
+
+def test_dates_follow_the_apod_day(monkeypatch):
+    class LateUtcEvening(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            # 2024-03-01 21:00 in New York
+            return datetime(2024, 3, 2, 2, 0, tzinfo=timezone.utc).astimezone(tz)
+
+    monkeypatch.setattr(nasa, "datetime", LateUtcEvening)
+
+    assert nasa.apod_today() == date(2024, 3, 1)
+    assert nasa._parse_apod_date("2024-03-01") == date(2024, 3, 1)
+    with pytest.raises(ValueError):
+        nasa._parse_apod_date("2024-03-02")
+    assert nasa._is_final(date(2024, 2, 29))
+    assert not nasa._is_final(date(2024, 3, 1))
+
+
+def test_other_upstream_errors_propagate(mongo, monkeypatch):
+    def rejected(day):
+        response = requests.Response()
+        response.status_code = 403
+        raise HTTPError("403 Client Error", response=response)
+
+    monkeypatch.setattr(nasa, "get_apod", rejected)
+    with pytest.raises(HTTPError):
+        nasa._apod_entries(mongo, date(2024, 3, 1), date(2024, 3, 1))
@@ -0,0 +1,131 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.core import workers
+from app.core.mongodb import processing_bucket
+from app.core.workers import PartitionWorker
+
+
+def _neo(asteroid_id: str) -> dict:
+    return {
+        "id": asteroid_id,
+        "name": f"({asteroid_id})",
+        "absolute_magnitude_h": 22.1,
+        "estimated_diameter": {"kilometers": {"estimated_diameter_min": 0.1, "estimated_diameter_max": 0.3}},
+        "is_potentially_hazardous_asteroid": False,
+        "close_approach_data": [{
+            "close_approach_date": "2024-03-01",
+            "epoch_date_close_approach": 1709251200000,
+            "relative_velocity": {"kilometers_per_second": "12.5"},
+            "miss_distance": {"kilometers": "4500000"},
+            "orbiting_body": "Earth",
+        }],
+    }
+
+
+def _seed(mongo, count: int) -> list:
+    return [mongo.save_raw_asteroid("2024-03-01", _neo(str(3000000 + i))) for i in range(count)]
+
+
+def _processing(mongo, raw_id) -> dict:
+    return mongo.db["asteroids_raw"].find_one({"_id": raw_id})["processing"]
+
+
+def _expire(mongo, raw_id) -> None:
+    mongo.db["asteroids_raw"].update_one(
+        {"_id": raw_id},
+        {"$set": {"processing.claimed_until": datetime.now(timezone.utc) - timedelta(seconds=1)}},
+    )
+
+
+def test_claims_are_exclusive_while_live(mongo):
+    _seed(mongo, 5)
+
+    first = mongo.claim_unprocessed("a", 3, ttl_s=60)
+    second = mongo.claim_unprocessed("b", 10, ttl_s=60)
+
+    assert len(first) == 3 and len(second) == 2
+    assert not {doc["_id"] for doc in first} & {doc["_id"] for doc in second}
+    assert mongo.claim_unprocessed("c", 10, ttl_s=60) == []
+    assert mongo.count_processing_states()["claimed"] == 5
+
+
+def test_partition_claims_only_its_buckets(mongo):
+    raw_ids = _seed(mongo, 20)
+
+    claimed = mongo.claim_unprocessed("a", 100, ttl_s=60, partition=1, partitions=4)
+
+    assert claimed
+    assert all(doc["processing"]["bucket"] % 4 == 1 for doc in claimed)
+    expected = sum(processing_bucket(str(3000000 + i)) % 4 == 1 for i in range(len(raw_ids)))
+    assert len(claimed) == expected
+
+
+def test_expired_claim_is_taken_over_and_renewal_keeps_it(mongo):
+    [raw_id] = _seed(mongo, 1)
+    mongo.claim_unprocessed("a", 1, ttl_s=60)
+
+    _expire(mongo, raw_id)
+    assert mongo.renew_claims("a", ttl_s=60) == 1
+    assert mongo.claim_unprocessed("b", 1, ttl_s=60) == []
+
+    _expire(mongo, raw_id)
+    [stolen] = mongo.claim_unprocessed("b", 1, ttl_s=60)
+    assert stolen["processing"]["owner"] == "b"
+    assert stolen["processing"]["attempts"] == 2
+    # The previous owner's late result is rejected
+    assert not mongo.finish_claim(raw_id, "a", "done")
+    assert mongo.renew_claims("a", ttl_s=60) == 0
+
+
+def test_finish_and_release(mongo):
+    done_id, released_id = _seed(mongo, 2)
+    mongo.claim_unprocessed("a", 2, ttl_s=60)
+
+    assert mongo.finish_claim(done_id, "a", "done")
+    assert _processing(mongo, done_id)["state"] == "done"
+    assert "claimed_until" not in _processing(mongo, done_id)
+
+    assert mongo.release_claim(released_id, "a", count_attempt=False)
+    assert _processing(mongo, released_id)["state"] == "pending"
+    assert _processing(mongo, released_id)["attempts"] == 0
+
+
+def test_max_attempts_marks_failed(mongo):
+    [raw_id] = _seed(mongo, 1)
+    for _ in range(2):
+        assert mongo.claim_unprocessed("a", 1, ttl_s=60, max_attempts=2)
+        mongo.release_claim(raw_id, "a")
+
+    assert mongo.claim_unprocessed("a", 1, ttl_s=60, max_attempts=2) == []
+    processing = _processing(mongo, raw_id)
+    assert processing["state"] == "failed"
+    assert processing["reason"] == "max_attempts"
+
+
+@pytest.fixture
+def engine_down(monkeypatch):
+    monkeypatch.setattr(workers, "is_rust_available", lambda: False)
+    monkeypatch.setattr(workers, "WORKER_IDLE_INTERVAL", 0.01)
+    monkeypatch.setattr(workers, "WORKER_ENGINE_WAIT", 0.05)
+
+
+def test_drain_gives_up_without_engine(mongo, engine_down):
+    _seed(mongo, 3)
+
+    totals = PartitionWorker(mongo, 0, 1, drain=True).run()
+
+    assert totals["engine_unavailable"]
+    assert totals["batches"] == 0
+    assert mongo.count_processing_states()["pending"] == 3
+
+
+def test_drain_exits_once_empty(mongo, monkeypatch):
+    monkeypatch.setattr(workers, "is_rust_available", lambda: True)
+
+    totals = PartitionWorker(mongo, 0, 1, drain=True).run()
+
+    assert totals == {
+        "batches": 0, "processed": 0, "failed": 0, "skipped": 0, "deferred": 0, "engine_unavailable": False
+    }
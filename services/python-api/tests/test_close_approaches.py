@@ -0,0 +1,127 @@
+from datetime import datetime, timezone
+
+import pytest
+from flask import Flask
+
+from app.models.close_approach import explode_close_approaches
+from app.routes.close_approaches import close_approaches_bp
+
+
+def _approach(day: int, km: float, body: str = "Earth", kps: str = "10.0") -> dict:
+    moment = datetime(2026, 3, day, 6, 30, tzinfo=timezone.utc)
+    return {
+        "close_approach_date": moment.strftime("%Y-%m-%d"),
+        "epoch_date_close_approach": int(moment.timestamp() * 1000),
+        "relative_velocity": {"kilometers_per_second": kps},
+        "miss_distance": {"kilometers": str(km)},
+        "orbiting_body": body,
+    }
+
+
+def _neo(asteroid_id: str, *approaches: dict, hazardous: bool = False) -> dict:
+    return {
+        "id": asteroid_id,
+        "name": f"({asteroid_id})",
+        "is_potentially_hazardous_asteroid": hazardous,
+        "close_approach_data": list(approaches),
+    }
+
+
+@pytest.fixture
+def client(mongo):
+    app = Flask(__name__)
+    app.extensions["mongo"] = mongo
+    app.register_blueprint(close_approaches_bp)
+    return app.test_client()
+
+
+def test_explode_one_document_per_approach():
+    neo = _neo("3542519", _approach(1, 4.5e6), _approach(1, 9.0e5, body="Mars"), _approach(9, 7.2e6))
+    neo["close_approach_data"].append({"orbiting_body": "Earth", "miss_distance": {"kilometers": "1"}})
+
+    documents = explode_close_approaches(neo)
+
+    assert [d["_id"] for d in documents] == [
+        "3542519:Earth:20260301T0630",
+        "3542519:Mars:20260301T0630",
+        "3542519:Earth:20260309T0630",
+    ]
+    assert documents[0]["approach_at"] == datetime(2026, 3, 1, 6, 30, tzinfo=timezone.utc)
+    assert documents[0]["miss_distance_km"] == 4.5e6
+    assert documents[0]["relative_velocity_kps"] == 10.0
+    assert explode_close_approaches({"close_approach_data": [_approach(1, 1.0)]}) == []
+
+
+def test_explode_falls_back_to_the_calendar_date():
+    approach = _approach(4, 1.0e6)
+    del approach["epoch_date_close_approach"]
+    [document] = explode_close_approaches(_neo("1", approach))
+    assert document["approach_at"] == datetime(2026, 3, 4, tzinfo=timezone.utc)
+
+
+def test_ingest_upserts_approaches(mongo):
+    neo = _neo("2000433", _approach(2, 3.1e7), _approach(20, 2.2e7))
+    mongo.save_raw_asteroid("2026-03-02", neo)
+    mongo.save_raw_asteroid("2026-03-02", neo)
+
+    assert mongo.db["close_approaches"].count_documents({"neo_id": "2000433"}) == 2
+
+
+def test_backfill_explodes_raw_asteroids_stored_before_the_collection(mongo):
+    mongo.db["asteroids_raw"].insert_many([
+        {"date": "2026-03-01", "asteroid": _neo("1", _approach(1, 1.0e6), _approach(3, 2.0e6))},
+        {"date": "2026-03-01", "asteroid": _neo("2", _approach(2, 3.0e6))},
+        {"date": "2026-03-01", "asteroid": {"name": "no id"}},
+    ])
+    mongo.db.drop_collection("close_approaches")
+
+    mongo._ensure_collections()
+
+    ids = sorted(d["_id"] for d in mongo.db["close_approaches"].find({}, {"_id": 1}))
+    assert ids == ["1:Earth:20260301T0630", "1:Earth:20260303T0630", "2:Earth:20260302T0630"]
+
+
+def test_backfill_runs_only_when_the_collection_is_created(mongo):
+    mongo.db["asteroids_raw"].insert_one({"date": "2026-03-01", "asteroid": _neo("1", _approach(1, 1.0e6))})
+
+    mongo._ensure_collections()
+
+    assert mongo.db["close_approaches"].count_documents({}) == 0
+
+
+def test_window_and_threshold_query(client, mongo):
+    mongo.save_close_approaches(_neo("1", _approach(1, 5.0e6), _approach(5, 1.0e6, kps="20.0")))
+    mongo.save_close_approaches(_neo("2", _approach(3, 2.0e6), _approach(3, 1.0e5, body="Mars"), hazardous=True))
+    mongo.save_close_approaches(_neo("3", _approach(12, 1.0e5)))
+
+    response = client.get("/close-approaches?start=2026-03-01&end=2026-03-08")
+    assert response.status_code == 200
+    assert response.headers["X-Total-Count"] == "3"
+    # In date order; Mars and the approach after `end` are left out
+    assert [(d["neo_id"], d["miss_distance_km"]) for d in response.get_json()] == [
+        ("1", 5.0e6), ("2", 2.0e6), ("1", 1.0e6),
+    ]
+
+    response = client.get("/close-approaches?start=2026-03-01&end=2026-03-08&max_km=2.5e6&sort=distance")
+    assert [(d["neo_id"], d["miss_distance_km"]) for d in response.get_json()] == [("1", 1.0e6), ("2", 2.0e6)]
+
+    response = client.get("/close-approaches?start=2026-03-01&end=2026-03-08&hazardous=true")
+    assert [d["neo_id"] for d in response.get_json()] == ["2"]
+
+    response = client.get("/close-approaches?start=2026-03-01&end=2026-03-08&body=Mars")
+    assert [d["miss_distance_km"] for d in response.get_json()] == [1.0e5]
+
+    response = client.get("/close-approaches?start=2026-03-01&end=2026-03-08&sort=velocity&order=desc&limit=1")
+    assert response.headers["X-Total-Count"] == "3"
+    assert [d["relative_velocity_kps"] for d in response.get_json()] == [20.0]
+
+
+@pytest.mark.parametrize("query", [
+    "start=yesterday",
+    "start=2026-03-08&end=2026-03-01",
+    "limit=0",
+    "offset=-1",
+    "sort=size",
+])
+def test_rejected_queries(client, query):
+    assert client.get(f"/close-approaches?{query}").status_code == 400
@@ -0,0 +1,119 @@
+import gzip
+import zlib
+
+import pytest
+from flask import Flask, Response, jsonify, request
+
+from app.utils import compression
+from app.utils.compression import init_compression
+from app.utils.ndjson import NDJSON_MIMETYPE, ndjson_lines
+
+ROWS = [{"id": str(i), "name": f"({i})", "risk_level": "Low"} for i in range(200)]
+
+
+@pytest.fixture
+def client():
+    app = Flask(__name__)
+
+    @app.route("/rows")
+    def rows():
+        count = request.args.get("count", default=len(ROWS), type=int)
+        return jsonify(ROWS[:count])
+
+    @app.route("/stream")
+    def stream():
+        return Response(ndjson_lines(iter(ROWS)), mimetype=NDJSON_MIMETYPE)
+
+    @app.route("/snapshot")
+    def snapshot():
+        # As the dashboard snapshot does: a strong ETag, then conditional
+        response = jsonify(ROWS)
+        response.set_etag("v42")
+        return response.make_conditional(request)
+
+    @app.route("/image")
+    def image():
+        return Response(b"\x89PNG" + bytes(4096), mimetype="image/png")
+
+    init_compression(app)
+    return app.test_client()
+
+
+def test_gzip(client):
+    response = client.get("/rows", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in response.vary
+    assert int(response.headers["Content-Length"]) == len(response.data)
+    assert gzip.decompress(response.data) == client.get("/rows").data
+
+
+def test_brotli_preferred_when_both_are_accepted(client):
+    brotli = pytest.importorskip("brotli")
+    response = client.get("/rows", headers={"Accept-Encoding": "gzip, deflate, br"})
+
+    assert response.headers["Content-Encoding"] == "br"
+    assert brotli.decompress(response.data) == client.get("/rows").data
+
+
+def test_client_preference_wins(client):
+    response = client.get("/rows", headers={"Accept-Encoding": "br;q=0.5, gzip"})
+    assert response.headers["Content-Encoding"] == "gzip"
+
+
+@pytest.mark.parametrize("accept", [None, "identity", "deflate"])
+def test_no_acceptable_encoding(client, accept):
+    headers = {"Accept-Encoding": accept} if accept else {}
+    response = client.get("/rows", headers=headers)
+
+    assert "Content-Encoding" not in response.headers
+    # Caches must still key on it: another client gets the compressed body
+    assert "Accept-Encoding" in response.vary
+
+
+def test_minimum_size(client, monkeypatch):
+    size = len(client.get("/rows?count=3").data)
+    headers = {"Accept-Encoding": "gzip"}
+
+    monkeypatch.setattr(compression, "COMPRESS_MIN_BYTES", size + 1)
+    assert "Content-Encoding" not in client.get("/rows?count=3", headers=headers).headers
+
+    monkeypatch.setattr(compression, "COMPRESS_MIN_BYTES", size)
+    assert client.get("/rows?count=3", headers=headers).headers["Content-Encoding"] == "gzip"
+
+
+def test_other_mimetypes_are_left_alone(client):
+    response = client.get("/image", headers={"Accept-Encoding": "gzip"})
+    assert "Content-Encoding" not in response.headers
+    assert "Accept-Encoding" not in response.vary
+
+
+def test_streamed_ndjson_decodes_chunk_by_chunk(client):
+    response = client.get("/stream", headers={"Accept-Encoding": "gzip"}, buffered=False)
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Content-Length" not in response.headers
+    expected = list(ndjson_lines(iter(ROWS)))
+    decoder = zlib.decompressobj(31)
+    chunks = list(response.response)
+    # Each chunk is flushed, so the first row decodes without waiting for the rest
+    assert decoder.decompress(chunks[0]) == expected[0]
+    rest = b"".join(decoder.decompress(chunk) for chunk in chunks[1:]) + decoder.flush()
+    assert rest == b"".join(expected[1:])
+    assert decoder.eof
+    response.close()
+
+
+def test_compressed_etag_is_weak_and_still_matches(client):
+    response = client.get("/snapshot", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["ETag"] == 'W/"v42"'
+
+    for etag in ('W/"v42"', '"v42"'):
+        revalidated = client.get("/snapshot", headers={"Accept-Encoding": "gzip", "If-None-Match": etag})
+        assert revalidated.status_code == 304
+        assert "Content-Encoding" not in revalidated.headers
+        assert not revalidated.data
+
+    # Uncompressed, the representation keeps its strong ETag
+    assert client.get("/snapshot").headers["ETag"] == '"v42"'
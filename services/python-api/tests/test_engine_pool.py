@@ -0,0 +1,129 @@
+import pytest
+
+from app.core import resilience
+from app.core.engine_pool import EnginePool
+from app.core.resilience import CircuitBreaker, CircuitOpenError
+
+URLS = ["http://engine-a", "http://engine-b", "http://engine-c"]
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(resilience.time, "monotonic", lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def health():
+    """Health answered by each fake instance's /api/health."""
+    return {url: "ok" for url in URLS}
+
+
+@pytest.fixture
+def pool(clock, health):
+    return EnginePool(
+        URLS,
+        health_check=lambda url: health[url],
+        failure_threshold=2,
+        reset_timeout=10,
+        slow_eject_factor=3.0,
+    )
+
+
+def _by_url(pool, url):
+    return next(i for i in pool.instances if i.url == url)
+
+
+def _serve(pool, latencies: dict) -> None:
+    """One successful call on every instance, with the given latencies."""
+    for url, latency in latencies.items():
+        instance = _by_url(pool, url)
+        instance.outstanding += 1
+        pool.release(instance, latency, ok=True)
+
+
+def test_picks_the_least_outstanding_instance(pool):
+    first, second, third = (pool.acquire() for _ in range(3))
+    assert {first.url, second.url, third.url} == set(URLS)
+    assert all(i.outstanding == 1 for i in pool.instances)
+
+    pool.release(second, 0.01, ok=True)
+    assert pool.acquire() is second
+    assert second.requests == 2
+
+
+def test_ties_go_to_the_fastest_instance(pool):
+    _serve(pool, {URLS[0]: 0.03, URLS[1]: 0.01, URLS[2]: 0.02})
+    assert pool.acquire().url == URLS[1]
+
+
+def test_failing_instance_is_ejected(pool):
+    a = _by_url(pool, URLS[0])
+    for _ in range(2):
+        a.outstanding += 1
+        pool.release(a, 0.0, ok=False)
+
+    assert a.breaker.state == CircuitBreaker.OPEN
+    assert a.ejections == 1 and a.failures == 2
+    assert all(pool.acquire() is not a for _ in range(6))
+
+
+def test_slow_instance_is_ejected_and_starts_again_from_the_median(pool):
+    _serve(pool, {URLS[0]: 0.010, URLS[1]: 0.012, URLS[2]: 0.100})
+
+    slow = _by_url(pool, URLS[2])
+    assert slow.breaker.state == CircuitBreaker.OPEN
+    assert slow.ejections == 1
+    assert slow.latency_ewma_s == pytest.approx(0.012)
+    assert _by_url(pool, URLS[0]).breaker.state == CircuitBreaker.CLOSED
+
+
+def test_last_healthy_instance_is_never_ejected_for_being_slow(clock, health):
+    pool = EnginePool(URLS[:2], lambda url: health[url], 2, 10, 3.0)
+    pool.instances[0].breaker.trip()
+
+    _serve(pool, {URLS[1]: 5.0})
+    assert pool.instances[1].breaker.state == CircuitBreaker.CLOSED
+
+
+def test_ejected_instance_is_readmitted_once_its_probe_succeeds(pool, clock, health):
+    a = _by_url(pool, URLS[0])
+    a.breaker.trip()
+    health[URLS[0]] = "unreachable"
+
+    clock[0] += 10
+    pool.check_all()
+    assert a.breaker.state == CircuitBreaker.OPEN
+    assert a.last_health == "unreachable"
+
+    clock[0] += 10
+    health[URLS[0]] = "ok"
+    pool.check_all()
+    assert a.breaker.state == CircuitBreaker.CLOSED
+    assert pool.acquire() is a
+
+
+def test_health_check_ejects_a_closed_instance(pool, health):
+    health[URLS[1]] = "unhealthy"
+    pool.check_all()
+
+    b = _by_url(pool, URLS[1])
+    assert b.breaker.state == CircuitBreaker.OPEN
+    assert b.ejections == 1
+    assert pool.health_status() == "ok"
+
+
+def test_all_ejected(pool, clock, health):
+    for instance in pool.instances:
+        instance.breaker.trip()
+    with pytest.raises(CircuitOpenError):
+        pool.acquire()
+    assert not pool.is_available()
+
+    clock[0] += 10
+    # Without probing, the event loop never blocks on a health check
+    with pytest.raises(CircuitOpenError):
+        pool.acquire(probe=False)
+    # With it, instances past their reset timeout probe their way back in
+    assert pool.acquire().breaker.state == CircuitBreaker.CLOSED
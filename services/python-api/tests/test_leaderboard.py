@@ -0,0 +1,131 @@
+import threading
+import time
+from datetime import datetime, timezone
+
+import pytest
+from flask import Flask
+
+from app.core.events import EventBroker
+from app.core.leaderboard import RiskLeaderboard
+from app.routes import dashboard
+
+
+def _analysis(asteroid_id: str, score: float) -> dict:
+    return {
+        "neo_reference_id": asteroid_id,
+        "analysis_timestamp": datetime(2024, 3, 1, tzinfo=timezone.utc),
+        "risk_data": {
+            "asteroid_name": f"({asteroid_id})",
+            "risk_level": "High" if score >= 50 else "Low",
+            "risk_score_0_to_100": score,
+            "impact_energy_megatons": score * 10,
+            "miss_distance_km": 4_500_000.0,
+            "diameter_km": 0.2,
+            "velocity_kps": 12.5,
+            "is_potentially_hazardous": score >= 50,
+        },
+    }
+
+
+def _insert(mongo, asteroid_id: str, score: float) -> dict:
+    doc = _analysis(asteroid_id, score)
+    mongo.db["asteroid_analyses"].insert_one(doc)
+    return doc
+
+
+def _ids(leaderboard) -> list[str]:
+    return [row["id"] for row in leaderboard.top()]
+
+
+@pytest.fixture
+def leaderboard(mongo):
+    for asteroid_id, score in (("a", 10), ("b", 40), ("c", 30), ("d", 20)):
+        _insert(mongo, asteroid_id, score)
+    board = RiskLeaderboard(mongo, k=3, verify_interval_s=60)
+    board.rebuild()
+    return board
+
+
+def test_rebuild_keeps_the_top_k(leaderboard):
+    assert _ids(leaderboard) == ["b", "c", "d"]
+    assert leaderboard.top(1)[0]["risk_score"] == 40
+
+
+def test_offer_evicts_the_lowest(mongo, leaderboard):
+    assert leaderboard.offer(_insert(mongo, "e", 35))
+    assert _ids(leaderboard) == ["b", "e", "c"]
+
+    assert not leaderboard.offer(_insert(mongo, "f", 5))
+    assert _ids(leaderboard) == ["b", "e", "c"]
+
+
+def test_offer_ignores_duplicates_and_unloaded_boards(mongo, leaderboard):
+    doc = _insert(mongo, "e", 99)
+    assert leaderboard.offer(doc)
+    assert not leaderboard.offer(doc)
+    assert _ids(leaderboard) == ["e", "b", "c"]
+
+    unloaded = RiskLeaderboard(mongo, k=3, verify_interval_s=60)
+    assert not unloaded.offer(_insert(mongo, "f", 100))
+    assert unloaded.top() == []
+
+
+def test_ties_break_on_id_like_mongo(mongo, leaderboard):
+    first, second = _insert(mongo, "e", 40), _insert(mongo, "f", 40)
+    leaderboard.offer(second)
+    leaderboard.offer(first)
+
+    assert _ids(leaderboard) == ["f", "e", "b"]
+    assert leaderboard.verify(repair=False)["consistent"]
+
+
+def test_verify_repairs_drift(mongo, leaderboard):
+    assert leaderboard.verify()["consistent"]
+
+    # Written by another process, never offered
+    _insert(mongo, "e", 90)
+    check = leaderboard.verify(repair=False)
+    assert not check["consistent"] and not check["repaired"]
+    assert len(check["missing"]) == 1 and len(check["unexpected"]) == 1
+    assert _ids(leaderboard) == ["b", "c", "d"]
+
+    check = leaderboard.verify()
+    assert check["repaired"]
+    assert _ids(leaderboard) == ["e", "b", "c"]
+    assert leaderboard.verify()["consistent"]
+
+
+def test_other_processes_reach_the_board_without_subscribers(mongo, leaderboard, monkeypatch):
+    broker = EventBroker(mongo, poll_interval_s=0.02)
+    # mongomock has no change streams: poll, as on a standalone mongod
+    monkeypatch.setattr(broker, "_watch_change_stream", lambda: False)
+    offered = threading.Event()
+
+    def listener(event):
+        leaderboard.offer_event(event)
+        offered.set()
+
+    broker.add_listener(listener)
+    broker.start()
+    try:
+        # Let the poller record the latest _id before the insert
+        deadline = time.monotonic() + 5
+        while broker.mode != "polling" and time.monotonic() < deadline:
+            time.sleep(0.01)
+        _insert(mongo, "e", 95)
+        assert offered.wait(timeout=5)
+    finally:
+        broker.stop()
+
+    assert broker.subscriber_count() == 0
+    assert _ids(leaderboard) == ["e", "b", "c"]
+
+
+def test_snapshot_serves_top_risks_from_the_board(mongo, leaderboard, monkeypatch):
+    app = Flask(__name__)
+    app.extensions["mongo"] = mongo
+    app.extensions["risk_leaderboard"] = leaderboard
+    monkeypatch.setattr(dashboard, "DASHBOARD_TOP_RISKS", 2)
+    monkeypatch.setattr(mongo, "get_top_risks", lambda limit: pytest.fail("sorted in Mongo"))
+
+    assert [row["id"] for row in dashboard._top_risks(app, mongo)] == ["b", "c"]
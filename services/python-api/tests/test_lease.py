@@ -0,0 +1,60 @@
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.core.lease import LOCKS_COLLECTION, LeaseHeldError, MongoLease
+
+
+def _expire(mongo, name: str) -> None:
+    mongo.db[LOCKS_COLLECTION].update_one(
+        {"_id": name}, {"$set": {"expires_at": datetime.now(timezone.utc) - timedelta(seconds=1)}}
+    )
+
+
+def test_one_holder_at_a_time(mongo):
+    first, second = MongoLease(mongo, "pipeline", 60), MongoLease(mongo, "pipeline", 60)
+
+    assert first.acquire()
+    assert not second.acquire()
+    assert second.holder()["owner"] == first.owner
+
+    first.release()
+    assert first.holder() is None
+    assert second.acquire()
+
+
+def test_expired_lease_is_stolen_and_old_holder_cannot_renew(mongo):
+    first, second = MongoLease(mongo, "pipeline", 60), MongoLease(mongo, "pipeline", 60)
+    assert first.acquire()
+    assert first.renew()
+
+    _expire(mongo, "pipeline")
+    assert second.acquire()
+    assert not first.renew()
+    # Releasing a lease it lost leaves the new holder in place
+    first.release()
+    assert second.holder()["owner"] == second.owner
+
+
+def test_slot_runs_once(mongo):
+    first, second = MongoLease(mongo, "pipeline", 60), MongoLease(mongo, "pipeline", 60)
+    slot = datetime(2024, 3, 1, 11, 0, tzinfo=timezone.utc)
+
+    with first.hold(slot=slot):
+        pass
+    with pytest.raises(LeaseHeldError):
+        with second.hold(slot=slot):
+            pass
+    with second.hold(slot=slot + timedelta(hours=1)):
+        assert second.holder()["owner"] == second.owner
+
+
+def test_hold_renews_while_running(mongo):
+    lease = MongoLease(mongo, "pipeline", 0.15)
+    with lease.hold():
+        first_expiry = mongo.db[LOCKS_COLLECTION].find_one({"_id": "pipeline"})["expires_at"]
+        time.sleep(0.25)
+        assert lease.holder() is not None
+        assert mongo.db[LOCKS_COLLECTION].find_one({"_id": "pipeline"})["expires_at"] > first_expiry
+    assert lease.holder() is None
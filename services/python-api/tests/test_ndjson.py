@@ -0,0 +1,56 @@
+import asyncio
+import json
+from datetime import datetime, timezone
+
+import pytest
+from werkzeug.datastructures import MIMEAccept
+from werkzeug.http import parse_accept_header
+
+from app.utils import ndjson
+from app.utils.ndjson import ndjson_lines, ndjson_lines_async, wants_ndjson
+
+
+def _records(count: int) -> list[dict]:
+    return [{"id": str(i), "score": i / 2} for i in range(count)]
+
+
+async def _collect(records) -> list[bytes]:
+    async def source():
+        for record in records:
+            yield record
+
+    return [chunk async for chunk in ndjson_lines_async(source())]
+
+
+def test_first_line_alone_then_chunks(monkeypatch):
+    monkeypatch.setattr(ndjson, "CHUNK_BYTES", 60)
+
+    chunks = list(ndjson_lines(_records(8)))
+
+    assert chunks[0] == b'{"id":"0","score":0.0}\n'
+    # Later lines are batched up to CHUNK_BYTES, with the remainder last
+    assert [chunk.count(b"\n") for chunk in chunks] == [1, 3, 3, 1]
+    lines = b"".join(chunks).splitlines()
+    assert [json.loads(line) for line in lines] == _records(8)
+
+
+@pytest.mark.parametrize("count", [0, 1, 2, 500])
+def test_async_stream_matches_the_sync_one(monkeypatch, count):
+    monkeypatch.setattr(ndjson, "CHUNK_BYTES", 1024)
+    assert asyncio.run(_collect(_records(count))) == list(ndjson_lines(_records(count)))
+
+
+def test_lines_use_the_app_encoder():
+    [line] = ndjson_lines([{"at": datetime(2026, 3, 1, 6, 30, tzinfo=timezone.utc)}])
+    assert json.loads(line) == {"at": "2026-03-01T06:30:00+00:00"}
+
+
+@pytest.mark.parametrize("accept, expected", [
+    ("application/x-ndjson", True),
+    ("application/x-ndjson, application/json;q=0.5", True),
+    ("application/json", False),
+    ("*/*", False),
+    ("", False),
+])
+def test_wants_ndjson(accept, expected):
+    assert wants_ndjson(parse_accept_header(accept, MIMEAccept)) is expected
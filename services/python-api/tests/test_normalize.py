@@ -0,0 +1,91 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from app.core.dto_mapper import map_mongo_document_to_asteroid, normalize_nasa_raw
+
+
+def _neo(**overrides) -> dict:
+    neo = {
+        "id": "3542519",
+        "name": " (2010 PK9) ",
+        "absolute_magnitude_h": 21.4,
+        "estimated_diameter": {"kilometers": {"estimated_diameter_min": 0.1, "estimated_diameter_max": 0.3}},
+        "is_potentially_hazardous_asteroid": True,
+        "close_approach_data": [{
+            "close_approach_date": "2026-03-01",
+            "epoch_date_close_approach": 1772323200000,
+            "relative_velocity": {"kilometers_per_second": "12.5"},
+            "miss_distance": {"kilometers": "4500000"},
+            "orbiting_body": "Earth",
+        }],
+    }
+    neo.update(overrides)
+    return neo
+
+
+def test_normalized_fields():
+    normalized, reason = normalize_nasa_raw(_neo())
+
+    assert reason is None
+    assert normalized == {
+        "id": "3542519",
+        "name": "(2010 PK9)",
+        "absolute_magnitude_h": 21.4,
+        "diameter_km": pytest.approx(0.2),
+        "velocity_kps": 12.5,
+        "distance_km": 4.5e6,
+        "is_potentially_hazardous": True,
+        "approach_at": datetime(2026, 3, 1, tzinfo=timezone.utc),
+        "orbiting_body": "Earth",
+    }
+
+
+@pytest.mark.parametrize("overrides, reason", [
+    ({"id": "  "}, "missing_id"),
+    ({"estimated_diameter": {}}, "invalid_diameter"),
+    ({"close_approach_data": []}, "missing_close_approach"),
+    ({"close_approach_data": [{"relative_velocity": {"kilometers_per_second": "0"}}]}, "invalid_velocity"),
+    ({"estimated_diameter": {"kilometers": {"estimated_diameter_min": "n/a"}}}, "malformed"),
+    ({"id": 3542519}, "malformed"),
+])
+def test_reason_codes(overrides, reason):
+    assert normalize_nasa_raw(_neo(**overrides)) == (None, reason)
+
+
+def test_ingest_stores_normalized_or_fails_the_document(mongo):
+    good = mongo.save_raw_asteroid("2026-03-01", _neo())
+    bad = mongo.save_raw_asteroid("2026-03-01", _neo(id="3542520", close_approach_data=[]))
+
+    doc = mongo.db["asteroids_raw"].find_one({"_id": good})
+    assert doc["normalized"]["diameter_km"] == pytest.approx(0.2)
+    assert doc["processing"]["state"] == "pending"
+
+    doc = mongo.db["asteroids_raw"].find_one({"_id": bad})
+    assert "normalized" not in doc
+    assert doc["processing"]["state"] == "failed"
+    assert doc["processing"]["reason"] == "missing_close_approach"
+    # Never handed to a worker
+    assert [d["_id"] for d in mongo.claim_unprocessed("a", 10, ttl_s=60)] == [good]
+
+
+def test_normalize_raw_asteroid_stored_before_normalize_at_ingest(mongo):
+    raw_id = mongo.db["asteroids_raw"].insert_one({"date": "2026-03-01", "asteroid": _neo()}).inserted_id
+
+    normalized, reason = mongo.normalize_raw_asteroid(raw_id)
+
+    assert reason is None
+    doc = mongo.db["asteroids_raw"].find_one({"_id": raw_id})
+    assert doc["normalized"]["diameter_km"] == normalized["diameter_km"]
+    asteroid = map_mongo_document_to_asteroid(doc)
+    assert (asteroid.id, asteroid.velocity_kps) == ("3542519", 12.5)
+
+
+def test_normalize_raw_asteroid_reasons(mongo):
+    invalid = mongo.db["asteroids_raw"].insert_one({"asteroid": _neo(estimated_diameter={})}).inserted_id
+    empty = mongo.db["asteroids_raw"].insert_one({"date": "2026-03-01"}).inserted_id
+
+    assert mongo.normalize_raw_asteroid(invalid) == (None, "invalid_diameter")
+    assert "normalized" not in mongo.db["asteroids_raw"].find_one({"_id": invalid})
+    assert mongo.normalize_raw_asteroid(empty) == (None, "missing_asteroid")
+    assert mongo.normalize_raw_asteroid("no-such-id") == (None, "missing_asteroid")
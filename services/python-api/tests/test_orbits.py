@@ -0,0 +1,92 @@
+from datetime import date, datetime, timezone
+
+import numpy as np
+import pytest
+from flask import Flask
+
+from app.models.orbit import (
+    J2000_JD,
+    OrbitalElements,
+    _EARTH_ELEMENTS,
+    earth_position,
+    min_earth_distance,
+    solve_kepler,
+)
+from app.routes import orbits
+
+
+@pytest.fixture
+def client(mongo, monkeypatch):
+    monkeypatch.setattr(orbits, "ORBIT_MAX_IDS", 3)
+    app = Flask(__name__)
+    app.extensions["mongo"] = mongo
+    app.register_blueprint(orbits.orbits_bp)
+    return app.test_client()
+
+
+def test_batch_rejects_too_many_ids(client):
+    response = client.post("/orbits/min-distance", json={"ids": ["1", "2", "3", "4"]})
+    assert response.status_code == 400
+    assert "3" in response.get_json()["error"]
+
+
+def test_batch_counts_distinct_ids(client, monkeypatch):
+    seen = []
+    monkeypatch.setattr(orbits, "_load_elements", lambda mongo, ids: (seen.extend(ids), ({}, {}))[1])
+
+    response = client.post("/orbits/min-distance", json={"ids": ["1", "2", "3", "1", 2]})
+
+    assert response.status_code == 200
+    assert seen == ["1", "2", "3"]
+
+
+@pytest.mark.parametrize("eccentricity", [0.0, 0.3, 0.9, 0.99])
+def test_solve_kepler_residual(eccentricity):
+    M = np.linspace(-4 * np.pi, 4 * np.pi, 2001)
+
+    E = solve_kepler(M, eccentricity)
+
+    residual = E - eccentricity * np.sin(E) - np.remainder(M, 2 * np.pi)
+    assert np.max(np.abs(residual)) < 1e-10
+
+
+def test_earth_position_at_j2000():
+    np.testing.assert_allclose(earth_position(J2000_JD), [-0.1771, 0.9672, 0.0], atol=1e-3)
+
+
+def test_min_distance_finds_a_constructed_encounter():
+    # Earth's own orbit tilted 5 degrees about the line through Earth at
+    # J2000: both bodies pass through that point at J2000 and nowhere near
+    # each other a few weeks either side
+    a, e, _, mean_longitude, perihelion_longitude, _ = _EARTH_ELEMENTS
+    x, y, _ = earth_position(J2000_JD)
+    node = np.degrees(np.arctan2(y, x))
+    crossing = OrbitalElements.from_nasa({
+        "semi_major_axis": a,
+        "eccentricity": e,
+        "inclination": 5.0,
+        "ascending_node_longitude": node,
+        "perihelion_argument": perihelion_longitude - node,
+        "mean_anomaly": mean_longitude - perihelion_longitude,
+        "epoch_osculation": J2000_JD,
+    })
+
+    distance_au, at_jd = min_earth_distance([crossing], J2000_JD - 100.37, J2000_JD + 100, step_days=1.0)
+
+    assert distance_au[0] < 2e-5
+    assert abs(at_jd[0] - J2000_JD) < 0.02
+    far, _ = min_earth_distance([crossing], J2000_JD + 30, J2000_JD + 100, step_days=1.0)
+    assert far[0] > 0.02
+
+
+def test_default_window_starts_on_the_utc_day(monkeypatch):
+    class JustAfterUtcMidnight(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return datetime(2024, 3, 2, 0, 30, tzinfo=timezone.utc).astimezone(tz)
+
+    monkeypatch.setattr(orbits, "datetime", JustAfterUtcMidnight)
+
+    start, end, step_days = orbits._parse_window({})
+    assert start == date(2024, 3, 2)
+    assert (end - start).days == orbits.DEFAULT_WINDOW_DAYS
@@ -0,0 +1,107 @@
+import threading
+
+import pytest
+
+from app.core import resilience
+from app.core.resilience import AdaptiveConcurrencyLimiter, CircuitBreaker
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(resilience.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_breaker_opens_after_consecutive_failures(clock):
+    breaker = CircuitBreaker("engine", failure_threshold=3, reset_timeout=10)
+
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow_request()
+
+
+def test_breaker_closes_when_probe_succeeds_after_reset_timeout(clock):
+    healthy = [False]
+    breaker = CircuitBreaker("engine", failure_threshold=1, reset_timeout=10, probe=lambda: healthy[0])
+    breaker.record_failure()
+
+    clock[0] += 10
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert not breaker.allow_request()
+    # A failed probe restarts the reset timeout
+    assert breaker.state == CircuitBreaker.OPEN
+    clock[0] += 5
+    assert not breaker.allow_request()
+
+    clock[0] += 5
+    healthy[0] = True
+    assert breaker.allow_request()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.snapshot()["consecutive_failures"] == 0
+
+
+def test_breaker_probe_raising_counts_as_unhealthy(clock):
+    def probe():
+        raise RuntimeError("boom")
+
+    breaker = CircuitBreaker("engine", failure_threshold=1, reset_timeout=1, probe=probe)
+    breaker.trip()
+    clock[0] += 1
+    assert not breaker.allow_request()
+    assert breaker.state == CircuitBreaker.OPEN
+
+
+def test_limiter_grows_additively_and_halves_on_failure(clock):
+    limiter = AdaptiveConcurrencyLimiter(min_limit=2, max_limit=8, latency_target_s=1.0)
+
+    # +1/limit per fast success: about `limit` successes per step
+    for _ in range(20):
+        limiter.acquire()
+        limiter.release(0.1, ok=True)
+    assert limiter.limit == 6
+
+    limiter.acquire()
+    limiter.release(0.1, ok=False)
+    assert limiter.limit == 3
+
+    # Calls already in flight report the same congestion: one backoff per window
+    limiter.acquire()
+    limiter.release(5.0, ok=True)
+    assert limiter.limit == 3
+    clock[0] += 1.0
+    limiter.acquire()
+    limiter.release(5.0, ok=True)
+    assert limiter.limit == 2  # never below min_limit
+
+    for _ in range(200):
+        limiter.acquire()
+        limiter.release(0.1, ok=True)
+    assert limiter.limit == 8
+
+
+def test_limiter_blocks_callers_beyond_the_limit():
+    limiter = AdaptiveConcurrencyLimiter(min_limit=1, max_limit=1, latency_target_s=1.0)
+    limiter.acquire()
+
+    acquired = threading.Event()
+
+    def second_caller():
+        limiter.acquire()
+        acquired.set()
+
+    thread = threading.Thread(target=second_caller, daemon=True)
+    thread.start()
+    assert not acquired.wait(0.1)
+
+    limiter.cancel()
+    assert acquired.wait(1.0)
+    thread.join(1.0)
+    assert limiter.snapshot()["in_flight"] == 1
@@ -0,0 +1,106 @@
+from datetime import date, datetime, timezone
+
+from app.models.risk_rollup import build_histogram, rollup_id, rollup_update
+
+
+def _analysis(day: int, level: str = "High", score: float = 50.0, hazardous: bool = False) -> dict:
+    return {
+        "neo_reference_id": "1",
+        "analysis_timestamp": datetime(2026, 3, day, 12, tzinfo=timezone.utc),
+        "risk_data": {
+            "risk_level": level,
+            "risk_score_0_to_100": score,
+            "impact_energy_megatons": 10.0,
+            "miss_distance_km": 1.0e6 * day,
+            "is_potentially_hazardous": hazardous,
+        },
+    }
+
+
+def _rollup(day: str, level: str, count: int, risk_score_sum: float) -> dict:
+    return {
+        "_id": rollup_id(day, level),
+        "day": day,
+        "level": level,
+        "count": count,
+        "hazardous": 0,
+        "risk_score_sum": risk_score_sum,
+        "risk_score_max": risk_score_sum,
+        "energy_mt_sum": 0,
+    }
+
+
+def test_rollup_update_skips_missing_extremes():
+    analysis = _analysis(2)
+    analysis["risk_data"]["miss_distance_km"] = None
+    query, update = rollup_update(analysis)
+
+    assert query == {"_id": "2026-03-02:High"}
+    assert update["$inc"]["count"] == 1
+    assert "$min" not in update
+    assert update["$max"]["risk_score_max"] == 50.0
+
+
+def test_histogram_buckets_have_the_same_keys_empty_or_not():
+    rollups = [_rollup("2026-03-02", "High", 2, 100.0), _rollup("2026-03-02", "Low", 2, 20.0)]
+    buckets = build_histogram(rollups, date(2026, 3, 1), date(2026, 3, 3), "day")
+
+    assert [b["start"] for b in buckets] == ["2026-03-01", "2026-03-02", "2026-03-03"]
+    assert buckets[1]["count"] == 4
+    assert buckets[1]["by_level"] == {"High": 2, "Low": 2}
+    assert buckets[1]["risk_score_avg"] == 30.0
+    assert buckets[0]["risk_score_avg"] is None
+    assert {tuple(sorted(b)) for b in buckets} == {tuple(sorted(buckets[1]))}
+    assert "risk_score_sum" not in buckets[0]
+
+
+def test_histogram_weekly_buckets_start_on_monday():
+    rollups = [_rollup("2026-03-03", "High", 1, 10.0), _rollup("2026-03-08", "High", 1, 30.0)]
+    buckets = build_histogram(rollups, date(2026, 3, 3), date(2026, 3, 10), "week")
+
+    assert [b["start"] for b in buckets] == ["2026-03-02", "2026-03-09"]
+    assert buckets[0]["count"] == 2
+    assert buckets[0]["risk_score_avg"] == 20.0
+    assert buckets[1]["count"] == 0
+
+
+def _emulate_merge(mongo, monkeypatch):
+    # mongomock has no $merge: run the rest of the pipeline and replace by _id
+    collection = mongo.db["asteroid_analyses"]
+    aggregate = collection.aggregate
+
+    def aggregate_with_merge(pipeline, *args, **kwargs):
+        *stages, merge = pipeline
+        target = mongo.db[merge["$merge"]["into"]]
+        for doc in aggregate(stages, *args, **kwargs):
+            target.replace_one({"_id": doc["_id"]}, doc, upsert=True)
+        return iter(())
+
+    monkeypatch.setattr(collection, "aggregate", aggregate_with_merge)
+
+
+def test_rebuild_drops_rollups_whose_analyses_are_gone(mongo, monkeypatch):
+    mongo.db["asteroid_analyses"].insert_many([_analysis(3), _analysis(3, score=70.0)])
+    # Analyses of March 2 were archived after being rolled up
+    mongo.db["risk_rollups"].insert_one(_rollup("2026-03-02", "Low", 5, 5.0))
+    _emulate_merge(mongo, monkeypatch)
+
+    assert mongo.rebuild_risk_rollups(date(2026, 3, 1), date(2026, 3, 31)) == 1
+
+    rollups = list(mongo.db["risk_rollups"].find())
+    assert [(r["_id"], r["count"], r["risk_score_sum"]) for r in rollups] == [("2026-03-03:High", 2, 120.0)]
+
+
+def test_default_day_range_ends_on_the_utc_day(monkeypatch):
+    from app.routes import orchestration
+
+    class JustAfterUtcMidnight(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return datetime(2024, 3, 2, 0, 30, tzinfo=timezone.utc).astimezone(tz)
+
+    monkeypatch.setattr(orchestration, "datetime", JustAfterUtcMidnight)
+
+    start, end = orchestration._parse_day_range({})
+    assert end == date(2024, 3, 2)
+    assert (end - start).days == orchestration.HISTOGRAM_DEFAULT_DAYS - 1
@@ -0,0 +1,113 @@
+import msgpack
+import pytest
+import requests
+
+from app.core import rust_client
+from app.core.engine_pool import EnginePool
+from app.core.resilience import AdaptiveConcurrencyLimiter
+
+ENGINE = "http://engine:8080"
+RESULT = {"asteroid_id": "1", "risk_level": "Low"}
+
+
+def _response(status: int, body: bytes, content_type: str) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status
+    response._content = body
+    response.headers["Content-Type"] = content_type
+    return response
+
+
+class FakeEngine:
+    """Stands in for the HTTP session; answers with `respond(content_type)`."""
+
+    def __init__(self, respond):
+        self.respond = respond
+        self.content_types: list[str] = []
+
+    def post(self, url, data, headers, timeout):
+        assert url == f"{ENGINE}/api/process/asteroid"
+        self.content_types.append(headers["Content-Type"])
+        return self.respond(headers["Content-Type"])
+
+
+@pytest.fixture
+def instance(monkeypatch):
+    pool = EnginePool(
+        [ENGINE], health_check=lambda url: "ok", failure_threshold=3, reset_timeout=10, slow_eject_factor=3.0
+    )
+    monkeypatch.setattr(rust_client, "pool", pool)
+    monkeypatch.setattr(rust_client, "limiter", AdaptiveConcurrencyLimiter(1, 4, 1.0))
+    monkeypatch.setattr(rust_client, "WIRE_FORMAT", "msgpack")
+    return pool.instances[0]
+
+
+def _use(monkeypatch, respond) -> FakeEngine:
+    engine = FakeEngine(respond)
+    monkeypatch.setattr(rust_client, "_session", engine)
+    return engine
+
+
+def test_msgpack_round_trip(instance, monkeypatch):
+    engine = _use(monkeypatch, lambda ct: _response(200, msgpack.packb(RESULT), "application/msgpack"))
+
+    assert rust_client.process_asteroid_with_rust({"id": "1"}) == RESULT
+    assert engine.content_types == ["application/msgpack"]
+    assert not instance.json_only
+
+
+def test_engine_rejecting_msgpack_is_retried_and_then_sent_json(instance, monkeypatch):
+    def respond(content_type):
+        if content_type != "application/json":
+            return _response(415, b'{"error":"unsupported media type"}', "application/json")
+        return _response(200, b'{"asteroid_id":"1","risk_level":"Low"}', "application/json")
+
+    engine = _use(monkeypatch, respond)
+
+    assert rust_client.process_asteroid_with_rust({"id": "1"}) == RESULT
+    assert instance.json_only
+    assert instance.breaker.snapshot()["consecutive_failures"] == 0
+
+    assert rust_client.process_asteroid_with_rust({"id": "1"}) == RESULT
+    assert engine.content_types == ["application/msgpack", "application/json", "application/json"]
+
+
+@pytest.mark.parametrize("status", [400, 422])
+def test_invalid_payload_is_not_retried(instance, monkeypatch, status):
+    # Domain validation and decode errors: the engine read the body
+    engine = _use(monkeypatch, lambda ct: _response(status, b'{"error":"invalid_input"}', "application/json"))
+
+    with pytest.raises(requests.HTTPError):
+        rust_client.process_asteroid_with_rust({"id": "1"})
+    assert engine.content_types == ["application/msgpack"]
+    assert not instance.json_only
+
+
+def test_async_calls_share_the_limiter(instance, monkeypatch):
+    import asyncio
+
+    import httpx
+
+    from app.core import async_clients
+
+    limiter = AdaptiveConcurrencyLimiter(1, 1, 1.0)
+    monkeypatch.setattr(async_clients, "pool", rust_client.pool)
+    monkeypatch.setattr(async_clients, "limiter", limiter)
+    in_flight = []
+
+    async def respond(request):
+        in_flight.append(limiter.snapshot()["in_flight"])
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, content=msgpack.packb(RESULT), headers={"Content-Type": "application/msgpack"})
+
+    async def run():
+        clients = async_clients.AsyncClients()
+        clients.http = httpx.AsyncClient(transport=httpx.MockTransport(respond))
+        try:
+            return await asyncio.gather(*(clients.process_asteroid_with_rust({"id": "1"}) for _ in range(3)))
+        finally:
+            await clients.http.aclose()
+
+    assert asyncio.run(run()) == [RESULT] * 3
+    assert in_flight == [1, 1, 1]
+    assert limiter.snapshot()["in_flight"] == 0
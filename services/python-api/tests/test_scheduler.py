@@ -0,0 +1,82 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.core import scheduler
+from app.core.scheduler import CronSchedule, IntervalSchedule, PipelineScheduler, parse_schedule
+
+
+def _utc(*args) -> datetime:
+    return datetime(*args, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize("spec, seconds", [("300", 300), ("90s", 90), ("5m", 300), ("1h", 3600), (" 2 h ", 7200)])
+def test_interval_specs(spec, seconds):
+    schedule = parse_schedule(spec)
+    assert isinstance(schedule, IntervalSchedule)
+    assert schedule.seconds == seconds
+
+
+def test_empty_spec_disables():
+    assert parse_schedule("") is None
+    assert parse_schedule("   ") is None
+
+
+@pytest.mark.parametrize("spec", ["0", "0m", "* * *", "61 * * * *", "* 24 * * *", "5-1 * * * *", "*/0 * * * *", "0 0 31 2 *"])
+def test_invalid_specs(spec):
+    with pytest.raises(ValueError):
+        schedule = parse_schedule(spec)
+        schedule.next_after(_utc(2024, 1, 1))
+
+
+def test_interval_slots_are_epoch_aligned():
+    schedule = parse_schedule("15m")
+    assert schedule.next_after(_utc(2024, 3, 1, 10, 7, 30)) == _utc(2024, 3, 1, 10, 15)
+    # A moment on a slot boundary waits for the next one
+    assert schedule.next_after(_utc(2024, 3, 1, 10, 15)) == _utc(2024, 3, 1, 10, 30)
+
+
+@pytest.mark.parametrize("spec, moment, expected", [
+    ("@hourly", _utc(2024, 3, 1, 10, 0), _utc(2024, 3, 1, 11, 0)),
+    ("@daily", _utc(2024, 3, 1, 10, 0), _utc(2024, 3, 2, 0, 0)),
+    # 2024-03-01 is a Friday; weekday 0 and 7 are both Sunday
+    ("@weekly", _utc(2024, 3, 1, 10, 0), _utc(2024, 3, 3, 0, 0)),
+    ("30 4 * * 7", _utc(2024, 3, 1, 10, 0), _utc(2024, 3, 3, 4, 30)),
+    ("*/20 9-17 * * 1-5", _utc(2024, 3, 1, 17, 45), _utc(2024, 3, 4, 9, 0)),
+    ("0,30 * * * *", _utc(2024, 3, 1, 10, 0, 59), _utc(2024, 3, 1, 10, 30)),
+    ("0 0 29 2 *", _utc(2024, 3, 1), _utc(2028, 2, 29)),
+    # Both day fields restricted: either matches (the 15th, or a Monday)
+    ("0 12 15 * 1", _utc(2024, 3, 1), _utc(2024, 3, 4, 12, 0)),
+])
+def test_cron_next_after(spec, moment, expected):
+    schedule = parse_schedule(spec)
+    assert isinstance(schedule, CronSchedule)
+    assert schedule.next_after(moment) == expected
+
+
+def test_jitter_delays_wakeup_past_the_slot(monkeypatch):
+    schedule = parse_schedule("1h")
+    now = _utc(2024, 3, 1, 10, 20)
+    slot = _utc(2024, 3, 1, 11, 0)
+
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return now
+
+    class Mongo:
+        ready = type("Ready", (), {"wait": staticmethod(lambda timeout=None: True)})()
+
+    class App:
+        extensions = {"mongo": Mongo()}
+
+    monkeypatch.setattr(scheduler, "datetime", FrozenDatetime)
+    monkeypatch.setattr(scheduler.random, "uniform", lambda low, high: high)
+    runner = PipelineScheduler(App(), lease=None, schedule=schedule, jitter_s=30.0)
+    delays = []
+    monkeypatch.setattr(runner._stop, "wait", lambda delay: delays.append(delay) or True)
+
+    runner._run()
+
+    assert runner.next_run == slot
+    assert delays == [(slot - now).total_seconds() + 30.0]
@@ -0,0 +1,68 @@
+import pytest
+
+from app.core import snapshot as snapshot_module
+from app.core.snapshot import SnapshotCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(snapshot_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+def _counting_build(payload=None):
+    builds = []
+
+    def build():
+        builds.append(1)
+        return dict(payload or {"stats": {"total": len(builds)}})
+
+    return builds, build
+
+
+def test_invalidations_are_coalesced(clock):
+    builds, build = _counting_build()
+    cache = SnapshotCache(5.0, build, min_age_s=1.0)
+    cache.get()
+
+    for _ in range(50):
+        cache.invalidate()
+        cache.get()
+    assert len(builds) == 1
+
+    clock[0] += 1.0
+    cache.get()
+    cache.get()
+    assert len(builds) == 2
+
+
+def test_ttl_expires_without_invalidation(clock):
+    builds, build = _counting_build()
+    cache = SnapshotCache(5.0, build, min_age_s=1.0)
+    cache.get()
+    clock[0] += 4.9
+    cache.get()
+    assert len(builds) == 1
+    clock[0] += 0.1
+    cache.get()
+    assert len(builds) == 2
+
+
+def test_etag_ignores_generated_at_and_logs(clock):
+    payloads = iter([
+        {"generated_at": "a", "logs": ["one"], "stats": {"total": 1}},
+        {"generated_at": "b", "logs": ["one", "two"], "stats": {"total": 1}},
+        {"generated_at": "c", "logs": ["one", "two"], "stats": {"total": 2}},
+    ])
+    cache = SnapshotCache(1.0, lambda: next(payloads))
+
+    first = cache.get()
+    clock[0] += 1.0
+    second = cache.get()
+    clock[0] += 1.0
+    third = cache.get()
+
+    assert first.body != second.body
+    assert first.etag == second.etag
+    assert third.etag != second.etag
@@ -1,11 +1,14 @@
-use axum::{extract::Json, http::StatusCode, response::IntoResponse};
+use axum::{http::StatusCode, response::{IntoResponse, Response}};
+use crate::api::codec::{encode, Negotiated};
 use crate::domain::asteroid::Asteroid;
 use crate::domain::error::map_domain_error;
 use crate::domain::risk::RiskResult;
 use crate::dto::asteroid_dto::AsteroidDTO;
 use crate::logic::impact_energy::ImpactPhysics;
 
-pub async fn process_asteroid(Json(dto): Json<AsteroidDTO>) -> impl IntoResponse {
+pub async fn process_asteroid(
+    Negotiated { value: dto, response_format }: Negotiated<AsteroidDTO>,
+) -> Response {
     tracing::info!(id = %dto.id, name = %dto.name, "Processing asteroid request");
 
     let asteroid = match Asteroid::try_from(dto) {
@@ -46,5 +49,5 @@ pub async fn process_asteroid(Json(dto): Json<AsteroidDTO>) -> impl IntoResponse
     );
    
 
-    (StatusCode::OK, Json(result)).into_response()
+    encode(response_format, StatusCode::OK, &result)
 }
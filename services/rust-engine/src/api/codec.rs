@@ -0,0 +1,228 @@
+use axum::{
+    body::Bytes,
+    extract::{FromRequest, Request},
+    http::{header, HeaderMap, StatusCode},
+    response::{IntoResponse, Response},
+    Json,
+};
+use rmp_serde::decode::Error as DecodeError;
+use serde::{de::DeserializeOwned, Serialize};
+use serde_json::{error::Category, json};
+
+pub const JSON_CONTENT_TYPE: &str = "application/json";
+pub const MSGPACK_CONTENT_TYPE: &str = "application/msgpack";
+
+/// Body encodings understood by the process endpoints. JSON stays the default.
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+pub enum WireFormat {
+    Json,
+    MsgPack,
+}
+
+impl WireFormat {
+    fn is_msgpack(value: &str) -> bool {
+        let value = value.to_ascii_lowercase();
+        value.contains(MSGPACK_CONTENT_TYPE) || value.contains("application/x-msgpack")
+    }
+
+    /// `application/json` or `application/*+json`, as `axum::Json` accepts.
+    fn is_json(value: &str) -> bool {
+        let essence = value.split(';').next().unwrap_or("");
+        let essence = essence.trim().to_ascii_lowercase();
+        essence == JSON_CONTENT_TYPE
+            || (essence.starts_with("application/") && essence.ends_with("+json"))
+    }
+
+    /// Format of the request body, from `Content-Type`; `None` when it is
+    /// missing or neither JSON nor MessagePack.
+    pub fn from_content_type(headers: &HeaderMap) -> Option<Self> {
+        match headers.get(header::CONTENT_TYPE).and_then(|v| v.to_str().ok()) {
+            Some(value) if Self::is_msgpack(value) => Some(WireFormat::MsgPack),
+            Some(value) if Self::is_json(value) => Some(WireFormat::Json),
+            _ => None,
+        }
+    }
+
+    /// Format the client wants back, from `Accept`.
+    pub fn from_accept(headers: &HeaderMap) -> Self {
+        match headers.get(header::ACCEPT).and_then(|v| v.to_str().ok()) {
+            Some(value) if Self::is_msgpack(value) => WireFormat::MsgPack,
+            _ => WireFormat::Json,
+        }
+    }
+}
+
+/// Request body decoded according to its `Content-Type`, together with the
+/// format negotiated for the response.
+///
+/// Rejections keep the statuses of `axum::Json`: 415 for an unsupported
+/// content type, 400 for a body that cannot be parsed and 422 for one that
+/// parses but does not match `T`. Clients tell an engine that predates
+/// MessagePack (415) from an invalid payload this way.
+pub struct Negotiated<T> {
+    pub value: T,
+    pub response_format: WireFormat,
+}
+
+impl<S, T> FromRequest<S> for Negotiated<T>
+where
+    T: DeserializeOwned,
+    S: Send + Sync,
+{
+    type Rejection = Response;
+
+    async fn from_request(req: Request, state: &S) -> Result<Self, Self::Rejection> {
+        let response_format = WireFormat::from_accept(req.headers());
+        let Some(request_format) = WireFormat::from_content_type(req.headers()) else {
+            return Err(reject(
+                StatusCode::UNSUPPORTED_MEDIA_TYPE,
+                "unsupported_media_type",
+                format!("Expected Content-Type {} or {}", JSON_CONTENT_TYPE, MSGPACK_CONTENT_TYPE),
+            ));
+        };
+
+        let bytes = Bytes::from_request(req, state)
+            .await
+            .map_err(IntoResponse::into_response)?;
+
+        let decoded = match request_format {
+            WireFormat::Json => serde_json::from_slice(&bytes).map_err(|e| {
+                let status = match e.classify() {
+                    Category::Data => StatusCode::UNPROCESSABLE_ENTITY,
+                    Category::Syntax | Category::Eof | Category::Io => StatusCode::BAD_REQUEST,
+                };
+                (status, e.to_string())
+            }),
+            WireFormat::MsgPack => rmp_serde::from_slice(&bytes).map_err(|e| {
+                let status = match &e {
+                    // Truncated or not MessagePack at all
+                    DecodeError::InvalidMarkerRead(_) | DecodeError::InvalidDataRead(_) => {
+                        StatusCode::BAD_REQUEST
+                    }
+                    _ => StatusCode::UNPROCESSABLE_ENTITY,
+                };
+                (status, e.to_string())
+            }),
+        };
+
+        match decoded {
+            Ok(value) => Ok(Negotiated { value, response_format }),
+            Err((status, details)) => {
+                tracing::warn!(?request_format, %status, "Failed to decode request body: {}", details);
+                let error = if status == StatusCode::BAD_REQUEST {
+                    "malformed_body"
+                } else {
+                    "invalid_body"
+                };
+                Err(reject(status, error, details))
+            }
+        }
+    }
+}
+
+fn reject(status: StatusCode, error: &str, details: String) -> Response {
+    (status, Json(json!({ "error": error, "details": details }))).into_response()
+}
+
+/// Encodes `value` in the negotiated format.
+pub fn encode<T: Serialize>(format: WireFormat, status: StatusCode, value: &T) -> Response {
+    match format {
+        WireFormat::Json => (status, Json(value)).into_response(),
+        // Named (map) encoding so clients get the same keys as with JSON
+        WireFormat::MsgPack => match rmp_serde::to_vec_named(value) {
+            Ok(bytes) => (status, [(header::CONTENT_TYPE, MSGPACK_CONTENT_TYPE)], bytes).into_response(),
+            Err(err) => {
+                tracing::error!("Failed to encode MessagePack response: {}", err);
+                let body = json!({ "error": "encoding_failed", "details": err.to_string() });
+                (StatusCode::INTERNAL_SERVER_ERROR, Json(body)).into_response()
+            }
+        },
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use axum::body::Body;
+    use axum::http::HeaderValue;
+    use serde::Deserialize;
+
+    #[derive(Debug, Deserialize, Serialize)]
+    struct Probe {
+        id: String,
+        diameter_km: f64,
+    }
+
+    async fn decode(content_type: Option<&str>, body: Vec<u8>) -> Result<Negotiated<Probe>, Response> {
+        let mut request = axum::http::Request::builder().method("POST").uri("/");
+        if let Some(content_type) = content_type {
+            request = request.header(header::CONTENT_TYPE, content_type);
+        }
+        Negotiated::<Probe>::from_request(request.body(Body::from(body)).unwrap(), &()).await
+    }
+
+    async fn rejection(content_type: Option<&str>, body: Vec<u8>) -> (StatusCode, String) {
+        let response = decode(content_type, body).await.err().expect("request should be rejected");
+        let status = response.status();
+        let bytes = axum::body::to_bytes(response.into_body(), usize::MAX).await.unwrap();
+        let body: serde_json::Value = serde_json::from_slice(&bytes).unwrap();
+        (status, body["error"].as_str().unwrap().to_string())
+    }
+
+    fn probe() -> Probe {
+        Probe { id: "3542519".into(), diameter_km: 0.2 }
+    }
+
+    #[tokio::test]
+    async fn decodes_json_and_msgpack_bodies() {
+        let json_body = serde_json::to_vec(&probe()).unwrap();
+        let decoded = decode(Some("application/json; charset=utf-8"), json_body).await.ok().unwrap();
+        assert_eq!(decoded.value.id, "3542519");
+
+        let msgpack_body = rmp_serde::to_vec_named(&probe()).unwrap();
+        let decoded = decode(Some(MSGPACK_CONTENT_TYPE), msgpack_body).await.ok().unwrap();
+        assert_eq!(decoded.value.diameter_km, 0.2);
+    }
+
+    #[tokio::test]
+    async fn unsupported_or_missing_content_type_is_415() {
+        let body = serde_json::to_vec(&probe()).unwrap();
+        assert_eq!(
+            rejection(Some("text/plain"), body.clone()).await,
+            (StatusCode::UNSUPPORTED_MEDIA_TYPE, "unsupported_media_type".to_string())
+        );
+        assert_eq!(rejection(None, body).await.0, StatusCode::UNSUPPORTED_MEDIA_TYPE);
+    }
+
+    #[tokio::test]
+    async fn malformed_bodies_are_400() {
+        // A map header announcing two entries, then nothing
+        assert_eq!(
+            rejection(Some(MSGPACK_CONTENT_TYPE), vec![0x82]).await,
+            (StatusCode::BAD_REQUEST, "malformed_body".to_string())
+        );
+        assert_eq!(rejection(Some(JSON_CONTENT_TYPE), b"{\"id\":".to_vec()).await.0, StatusCode::BAD_REQUEST);
+    }
+
+    #[tokio::test]
+    async fn well_formed_bodies_of_the_wrong_shape_are_422() {
+        let missing_field = rmp_serde::to_vec_named(&serde_json::json!({ "id": "1" })).unwrap();
+        assert_eq!(
+            rejection(Some(MSGPACK_CONTENT_TYPE), missing_field).await,
+            (StatusCode::UNPROCESSABLE_ENTITY, "invalid_body".to_string())
+        );
+        let wrong_type = br#"{"id": "1", "diameter_km": "large"}"#.to_vec();
+        assert_eq!(rejection(Some(JSON_CONTENT_TYPE), wrong_type).await.0, StatusCode::UNPROCESSABLE_ENTITY);
+    }
+
+    #[test]
+    fn negotiates_msgpack_only_when_requested() {
+        let mut headers = HeaderMap::new();
+        assert_eq!(WireFormat::from_accept(&headers), WireFormat::Json);
+
+        headers.insert(header::ACCEPT, HeaderValue::from_static("application/msgpack, application/json"));
+        headers.insert(header::CONTENT_TYPE, HeaderValue::from_static("application/json"));
+        assert_eq!(WireFormat::from_accept(&headers), WireFormat::MsgPack);
+        assert_eq!(WireFormat::from_content_type(&headers), Some(WireFormat::Json));
+    }
+}
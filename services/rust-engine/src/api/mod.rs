@@ -1,6 +1,7 @@
 use axum::routing::{get, post};
 use axum::Router;
 mod asteroid;
+mod codec;
 
 pub use asteroid::process_asteroid;
 